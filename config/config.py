@@ -2,7 +2,7 @@ import os
 from dotenv import load_dotenv
 
 class Config:
-    def __init__(self):
+    def __init__(self, require_login=True):
         # Load environment variables from .env file
         load_dotenv()
         
@@ -13,15 +13,71 @@ class Config:
         self.username = os.getenv('LOGIN_EMAIL')
         self.password = os.getenv('LOGIN_PASSWORD')
         
-        if not all([self.username, self.password]):
-            raise ValueError("Missing required environment variables LOGIN_EMAIL and LOGIN_PASSWORD")
+        if require_login:
+            self.check_login()
         
         # Browser configuration
         self.browser = os.getenv('BROWSER', 'chrome')
-        self.headless = os.getenv('HEADLESS', 'false').lower() == 'true'
+        # Launch profile: default, lean or throughput (see WebDriverFactory.PROFILES)
+        self.browser_profile = os.getenv('BROWSER_PROFILE', 'default').lower()
+        # Unset keeps the profile's choice, true/false forces headless on or off
+        headless = os.getenv('HEADLESS')
+        self.headless = None if headless is None else headless.lower() == 'true'
+        self.browser_cache_dir = os.getenv('BROWSER_CACHE_DIR', '.cache/chrome')
+        # Resolved chromedriver binaries, shared by every process of every run (see DriverCache)
+        self.driver_cache_dir = os.getenv('DRIVER_CACHE_DIR', '.cache/drivers')
+        
+        # Request interception: URL patterns or groups (image, font, media, analytics), comma separated.
+        # Blocked requests fail in every test, stubbed ones are answered from the asset cache.
+        self.block_requests = [p.strip() for p in os.getenv('BLOCK_REQUESTS', '').split(',') if p.strip()]
+        self.stub_assets = [p.strip() for p in os.getenv('STUB_ASSETS', '').split(',') if p.strip()]
+        self.asset_cache_dir = os.getenv('ASSET_CACHE_DIR', '.cache/assets')
         
         # Timeouts
         self.implicit_wait = int(os.getenv('IMPLICIT_WAIT', '10'))
         self.explicit_wait = int(os.getenv('EXPLICIT_WAIT', '20'))
         
+        # WebDriver pool - 0 disables pooling and launches a browser per test
+        self.pool_size = int(os.getenv('POOL_SIZE', '0'))
+        self.pool_max_uses = int(os.getenv('POOL_MAX_USES', '25'))
+        
+        # Cached login session lifetime in seconds - 0 forces a UI login for every test
+        self.session_ttl = int(os.getenv('SESSION_TTL', '1800'))
+        
+        # Screenshots: always, on-failure or never; png or jpeg (jpeg needs Pillow)
+        self.screenshot_policy = os.getenv('SCREENSHOT_POLICY', 'on-failure').lower()
+        self.screenshot_format = os.getenv('SCREENSHOT_FORMAT', 'png').lower()
+        
+        # Per-test log capture: records kept in memory for the report, older ones spill to a file
+        self.log_capture_size = int(os.getenv('LOG_CAPTURE_SIZE', '1000'))
+        self.log_capture_level = os.getenv('LOG_CAPTURE_LEVEL', 'INFO').upper()
+        
+        # Record every WebDriver command per test for the report and the commands .jsonl file
+        self.command_trace = os.getenv('COMMAND_TRACE', 'true').lower() == 'true'
+        
+        # Delete the records tests created when the session ends, leftovers are retried next run
+        self.entity_cleanup = os.getenv('ENTITY_CLEANUP', 'true').lower() == 'true'
+        
+        # Seed of the generated test data, random when unset; the run logs it so a run can be repeated
+        data_seed = os.getenv('DATA_SEED')
+        self.data_seed = int(data_seed) if data_seed else None
+        
+        # Test durations of past runs, used to start the longest tests first so parallel workers finish together
+        self.duration_store = os.getenv('DURATION_STORE', '.cache/durations.json')
+        self.duration_order = os.getenv('DURATION_ORDER', 'true').lower() == 'true'
+        
+        # Waits taking more than this share of their timeout are logged as slow
+        self.slow_wait_ratio = float(os.getenv('SLOW_WAIT_RATIO', '0.5'))
+        
         print("Configuration loaded successfully")
+
+    @property
+    def has_login(self):
+        """Whether login credentials are set"""
+        return bool(self.username and self.password)
+
+    def check_login(self):
+        """Raise when the login credentials are missing"""
+        if not self.has_login:
+            raise ValueError("Missing required environment variables LOGIN_EMAIL and LOGIN_PASSWORD")
+        return self
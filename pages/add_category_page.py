@@ -1,8 +1,9 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 import os
 from .base_page import BasePage
+from utils.entity_registry import entity_registry
+from data.constants import CategoryPage as CategoryConstants
 
 class AddCategoryPage(BasePage):
     # Header Elements
@@ -16,6 +17,7 @@ class AddCategoryPage(BasePage):
     NAME_INPUT = (By.ID, "category_name")
     DESCRIPTION_INPUT = (By.ID, "category_description")
     SORT_ORDER_INPUT = (By.ID, "category_sort_order")
+    READY_LOCATOR = NAME_INPUT
     PHOTO_DIMENSIONS = (By.CSS_SELECTOR, ".text-info.overline")
     
     # Validation and Error Elements
@@ -87,14 +89,18 @@ class AddCategoryPage(BasePage):
             return False
 
     def save_category(self):
-        """Click save button and wait for response"""
+        """Click save button and wait for response, new categories are recorded for cleanup"""
         try:
+            creating = CategoryConstants.URLS["NEW"] in self.driver.current_url
+            name = self.find_element(self.NAME_INPUT).get_attribute('value') if creating else None
             self.click(self.SAVE_BUTTON)
             # Wait for either success navigation or error message
             self.wait.until(lambda d: 
                 "/admin/categories" in d.current_url or 
                 self.is_element_visible(self.ERROR_CONTAINER)
             )
+            if creating and name and not self.driver.find_elements(*self.ERROR_ALERT):
+                entity_registry.add('categories', name=name)
             return True
         except Exception as e:
             self.logger.error(f"Failed to save category: {str(e)}")
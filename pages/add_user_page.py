@@ -1,9 +1,10 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.support import expected_conditions as EC  # Add this import
-from selenium.webdriver.support.ui import WebDriverWait  # Add this import
-from faker import Faker
+from utils.wait_stats import TimedWait
 from .base_page import BasePage
+from utils.entity_registry import entity_registry
+from utils.data_pool import data_pool
 from data.constants import AddUserPage as Constants
 
 class AddUserPage(BasePage):
@@ -29,6 +30,7 @@ class AddUserPage(BasePage):
     MIDDLE_NAME_INPUT = (By.ID, "user_middle_name")
     LAST_NAME_INPUT = (By.ID, "user_last_name")
     EMAIL_INPUT = (By.ID, "user_email")
+    READY_LOCATOR = FIRST_NAME_INPUT
     
     # Role Selection
     ROLE_SELECT = (By.ID, "division-id")
@@ -45,20 +47,10 @@ class AddUserPage(BasePage):
     # Alert Messages
     ALERT_MESSAGE = (By.CSS_SELECTOR, ".alert--soft-danger ul li")
     
-    def __init__(self, driver):
-        super().__init__(driver)
-        self.faker = Faker()
-
     def fill_user_form(self, user_data=None):
         """Fill user form with provided data or generate fake data"""
         if user_data is None:
-            user_data = {
-                'first_name': self.faker.first_name(),
-                'last_name': self.faker.last_name(),
-                'email': self.faker.email(),
-                'role': 'Administrator'
-                # Removed is_active since there's no toggle
-            }
+            user_data = data_pool.user()
         
         self.type(self.FIRST_NAME_INPUT, user_data['first_name'])
         self.type(self.LAST_NAME_INPUT, user_data['last_name'])
@@ -75,12 +67,14 @@ class AddUserPage(BasePage):
         try:
             self.logger.info("Saving new user")
             current_url = self.driver.current_url
+            creating = Constants.URLS["NEW"] in current_url
+            email = self.find_element(self.EMAIL_INPUT).get_attribute('value') if creating else None
             
             # Click save button
             self.click(self.SAVE_BUTTON)
             
             # Wait for URL to change with longer timeout
-            long_wait = WebDriverWait(self.driver, 30)  # Increased timeout
+            long_wait = TimedWait(self.driver, 30)  # Increased timeout
             long_wait.until(EC.url_contains('/admin/users'))
             long_wait.until(lambda d: d.current_url != current_url)
             
@@ -89,10 +83,12 @@ class AddUserPage(BasePage):
             long_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.table')))
             long_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'tbody tr')))
             
-            # Extra wait for data to settle
-            self.driver.implicitly_wait(3)
+            # Wait for data to settle
+            self.wait_for_settled(self.TABLE)
             
             self.logger.info("User saved successfully")
+            if email:
+                entity_registry.add('users', name=email)
             return True
             
         except Exception as e:
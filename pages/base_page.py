@@ -1,20 +1,108 @@
 import logging
-from selenium.webdriver.support.wait import WebDriverWait
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, StaleElementReferenceException
 from selenium.webdriver.support.ui import Select
+from selenium.webdriver.common.by import By
+from utils.http_client import AdminHttpClient
+from utils.table_snapshot import TableSnapshot
+from utils.wait_stats import TimedWait, wait_stats
 
 class BasePage:
+    TABLE = (By.CSS_SELECTOR, ".table")
+
+    # Element that marks the page as loaded, checked by wait_until_ready()
+    READY_LOCATOR = None
+
+    # Requests (URL patterns or RequestInterceptor groups) the Router blocks while this page is open
+    BLOCKED_REQUESTS = ()
+
+    # pagy "Next" link of list views
+    NEXT_PAGE = (By.CSS_SELECTOR, ".pagy a[aria-label='Next']:not([aria-disabled='true'])")
+
+    # Table snapshot plus the next page's href, read together in one round trip
+    PAGE_SCRIPT = """
+        const table = (function () {%s}).apply(null, arguments);
+        const next = document.querySelector(arguments[1]);
+        return {table: table, next: next ? next.href : null};
+    """ % TableSnapshot.SCRIPT
+
+    # Installs request tracking once per document and mutation tracking once per watched
+    # element (CSS selector in arguments[0], the whole document when empty), both kept on
+    # window.__qaSettle. Each watched element has the time of its last mutation and a
+    # mutation count; the document token tells a new document from the one watched before.
+    WATCH_SCRIPT = """
+        const state = window.__qaSettle || (window.__qaSettle = (() => {
+            const s = {pending: 0, watchers: {}, mutations: {}, document: `${Date.now()}-${Math.random()}`};
+            if (window.fetch) {
+                const fetch = window.fetch;
+                window.fetch = function () {
+                    s.pending++;
+                    return fetch.apply(this, arguments).finally(() => { s.pending--; });
+                };
+            }
+            const send = XMLHttpRequest.prototype.send;
+            XMLHttpRequest.prototype.send = function () {
+                s.pending++;
+                this.addEventListener('loadend', () => { s.pending--; }, {once: true});
+                return send.apply(this, arguments);
+            };
+            return s;
+        })());
+        const key = arguments[0] || ':root';
+        if (!(key in state.watchers)) {
+            state.watchers[key] = Date.now();
+            state.mutations[key] = 0;
+            const touches = (node) => node && node.nodeType === 1 && (node.matches(key) || node.querySelector(key));
+            new MutationObserver((records) => {
+                const hit = records.some((r) => {
+                    const target = r.target.nodeType === 1 ? r.target : r.target.parentElement;
+                    return (target && target.closest(key))
+                        || Array.from(r.addedNodes).some(touches)
+                        || Array.from(r.removedNodes).some(touches);
+                });
+                if (hit) {
+                    state.watchers[key] = Date.now();
+                    state.mutations[key]++;
+                }
+            }).observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+        }
+    """
+
+    # Resolves once the page has had no pending fetch/XHR, no Turbo busy marker and
+    # no DOM mutation inside the watched element for the quiet window
+    SETTLE_SCRIPT = WATCH_SCRIPT + """
+        const [, quietMs, timeoutMs] = arguments;
+        const done = arguments[arguments.length - 1];
+        const start = Date.now();
+        (function check() {
+            const busy = state.pending > 0 || document.readyState !== 'complete'
+                || document.querySelector('[aria-busy="true"], turbo-frame[busy]');
+            if (!busy && Date.now() - state.watchers[key] >= quietMs) return done(true);
+            if (Date.now() - start >= timeoutMs) return done(false);
+            setTimeout(check, 50);
+        })();
+    """
+
+    # Document token and mutation count of the watched element, changes whenever its DOM does
+    MUTATIONS_SCRIPT = WATCH_SCRIPT + """
+        return `${state.document}:${state.mutations[key]}`;
+    """
+
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = TimedWait(driver, 10)
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._rows = None
+        self._rows_version = None
 
     def find_element(self, locator):
         try:
             return self.wait.until(EC.presence_of_element_located(locator))
         except TimeoutException:
-            raise Exception(f"Element {locator} not found")
+            raise Exception(f"Element {locator} not found within {self.wait._timeout}s")
 
     def find_elements(self, locator):
         try:
@@ -23,6 +111,53 @@ class BasePage:
             self.logger.warning(f"Elements {locator} not found")
             return []
 
+    def wait_for_settled(self, locator=None, quiet_ms=300, timeout=10):
+        """Wait until requests are idle and the DOM (or the element at a CSS/ID locator) stops changing"""
+        # Anything worth waiting for may have re-rendered the list
+        self.invalidate_rows()
+        # A click may have left the page whose requests the Router blocked
+        interceptor = getattr(self.driver, 'interceptor', None)
+        if interceptor and interceptor.page_path:
+            try:
+                interceptor.leave_page(self.driver.current_url)
+            except WebDriverException:
+                pass  # Mid-navigation, checked again on the next wait
+        selector = self._css_selector(locator)
+        started = time.time()
+        deadline = started + timeout
+        while time.time() < deadline:
+            remaining_ms = int((deadline - time.time()) * 1000)
+            try:
+                if self.driver.execute_async_script(self.SETTLE_SCRIPT, selector, quiet_ms, remaining_ms):
+                    wait_stats.record(f"settled({selector or 'page'})", timeout, time.time() - started, 'ok')
+                    return True
+                break
+            except WebDriverException:
+                # Navigation replaced the document mid-wait - watch the new one
+                time.sleep(0.1)
+        wait_stats.record(f"settled({selector or 'page'})", timeout, time.time() - started, 'timeout')
+        self.logger.warning(f"Page did not settle within {timeout}s")
+        return False
+
+    @staticmethod
+    def _css_selector(locator):
+        """CSS selector of a CSS or ID locator, None for any other locator"""
+        if locator and locator[0] == By.CSS_SELECTOR:
+            return locator[1]
+        if locator and locator[0] == By.ID:
+            return f"#{locator[1]}"
+        return None
+
+    def wait_until_ready(self, timeout=10):
+        """Wait for the page's READY_LOCATOR (if any) and for the page to settle after a direct load"""
+        try:
+            if self.READY_LOCATOR:
+                TimedWait(self.driver, timeout).until(EC.presence_of_element_located(self.READY_LOCATOR))
+            return self.wait_for_settled(self.READY_LOCATOR, timeout=timeout)
+        except TimeoutException:
+            self.logger.error(f"{self.__class__.__name__} not ready: {self.READY_LOCATOR} not found")
+            return False
+
     def click(self, locator):
         self.find_element(locator).click()
 
@@ -50,3 +185,144 @@ class BasePage:
         except Exception as e:
             self.logger.error(f"Failed to select value {value}: {str(e)}")
             return False
+
+    def invalidate_rows(self):
+        """Drop the cached row index, the next lookup reads the table again"""
+        self._rows = None
+        self._rows_version = None
+
+    def table_version(self):
+        """Changes whenever the TABLE's DOM mutates or the document is replaced, None when it can't be read"""
+        try:
+            return self.driver.execute_script(self.MUTATIONS_SCRIPT, self._css_selector(self.TABLE))
+        except WebDriverException:
+            return None
+
+    def cache_rows(self, snapshot, version=None):
+        """Keep snapshot as the row index while the table stays unchanged
+
+        version is table_version() read before the snapshot was taken; without it the
+        version is read now.
+        """
+        self._rows = snapshot
+        self._rows_version = self.table_version() if version is None else version
+        return snapshot
+
+    def find_row(self, column, key):
+        """Row element whose cell in column has the given text, looked up in the cached row index
+
+        The index is one table snapshot shared by all columns, hits cost no browser round
+        trip. It is dropped whenever the page waits for the DOM to settle, and a hit whose
+        row was replaced since is caught by with_row(). A miss reads the table's mutation
+        count in one small script call and re-reads the table only when it changed since
+        the snapshot, e.g. rows added without a settle wait.
+        """
+        if self._rows is None:
+            version = self.table_version()
+            return self.cache_rows(self.get_table_snapshot(), version).row(column, key)
+        row = self._rows.row(column, key)
+        if row is None:
+            version = self.table_version()
+            if version is None or version != self._rows_version:
+                self.logger.debug("Table changed since the row index was read, reading it again")
+                row = self.cache_rows(self.get_table_snapshot(), version).row(column, key)
+        return row
+
+    def with_row(self, column, key, action):
+        """Run action(row) on the row keyed by key, rebuilding the index once if the row went stale
+
+        Returns action's result, or None when no row matches.
+        """
+        for attempt in range(2):
+            row = self.find_row(column, key)
+            if row is None:
+                return None
+            try:
+                return action(row)
+            except StaleElementReferenceException:
+                self.logger.debug("Row index stale, re-reading table")
+                self.invalidate_rows()
+                if attempt:
+                    raise
+
+    def open_first_page(self):
+        """Load the current list without its page parameter, returns False when it already is on page 1"""
+        parts = urlsplit(self.driver.current_url)
+        params = parse_qsl(parts.query, keep_blank_values=True)
+        if all(name != 'page' or value in ('', '1') for name, value in params):
+            return False
+        query = urlencode([(name, value) for name, value in params if name != 'page'])
+        self.logger.debug("Going back to the first list page")
+        self.driver.get(urlunsplit(parts._replace(query=query)))
+        self.wait_until_ready()
+        return True
+
+    def iter_pages(self, max_pages=None, prefetch=False, from_first=False):
+        """Yield a TableSnapshot of each page of the list, starting with the current one (page 1 with from_first)
+
+        Filters in the current URL are kept when going back to page 1. Pages are
+        loaded only as the consumer asks for them, so stopping early skips the rest. With prefetch the following pages are fetched over HTTP (sharing
+        the browser's cookies) while the consumer works on the current one; those
+        snapshots have no elements, open snapshot.url in the browser to act on them.
+        """
+        if from_first:
+            self.open_first_page()
+        snapshot, next_url = self._read_page()
+        client = executor = None
+        if prefetch:
+            client = AdminHttpClient(self.driver.current_url)
+            client.use_cookies(self.driver.get_cookies())
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+
+        try:
+            page = 1
+            while True:
+                if max_pages and page >= max_pages:
+                    next_url = None
+                future = executor.submit(client.get_table, next_url) if executor and next_url else None
+                yield snapshot
+                if not next_url:
+                    return
+
+                page += 1
+                self.logger.debug("Loading list page %s: %s", page, next_url)
+                if future:
+                    url = next_url
+                    snapshot, next_href = future.result()
+                    snapshot.url = url
+                    next_url = urljoin(url, next_href) if next_href else None
+                else:
+                    self.driver.get(next_url)
+                    self.wait_until_ready()
+                    snapshot, next_url = self._read_page()
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                client.close()
+
+    def _read_page(self):
+        """Snapshot of the current page's table and the href of its next page"""
+        try:
+            self.find_element(self.TABLE)
+            result = self.driver.execute_script(self.PAGE_SCRIPT, self.TABLE[1], self.NEXT_PAGE[1])
+            snapshot = TableSnapshot.from_script_result(result['table'])
+            snapshot.url = self.driver.current_url
+            return snapshot, result['next']
+        except Exception as e:
+            self.logger.warning(f"Failed to read list page: {str(e)}")
+            return TableSnapshot(url=self.driver.current_url), None
+
+    def get_table_snapshot(self, table_locator=None):
+        """Read every row and cell of a table in a single round trip"""
+        table_locator = table_locator or self.TABLE
+        by, value = table_locator
+        try:
+            target = value if by == By.CSS_SELECTOR else self.find_element(table_locator)
+            result = self.driver.execute_script(TableSnapshot.SCRIPT, target)
+            if result is None and by == By.CSS_SELECTOR:
+                # Table not rendered yet - wait for it and read again
+                result = self.driver.execute_script(TableSnapshot.SCRIPT, self.find_element(table_locator))
+            return TableSnapshot.from_script_result(result)
+        except Exception as e:
+            self.logger.warning(f"Failed to read table {table_locator}: {str(e)}")
+            return TableSnapshot()
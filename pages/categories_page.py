@@ -1,8 +1,10 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
-from selenium.webdriver.support.ui import WebDriverWait  # Add this import
+from utils.wait_stats import TimedWait
+from urllib.parse import urlencode
 from .base_page import BasePage
+from config.config import Config
 from data.constants import CategoryPage
 
 class CategoriesPage(BasePage):
@@ -20,6 +22,8 @@ class CategoriesPage(BasePage):
     TABLE = (By.CSS_SELECTOR, ".table")
     TABLE_HEADERS = (By.CSS_SELECTOR, "thead th")
     TABLE_ROWS = (By.CSS_SELECTOR, "tbody tr")
+    READY_LOCATOR = TABLE
+    BLOCKED_REQUESTS = ('image', 'font', 'analytics')  # Category photos aren't checked by list tests
     
     # Table Column Elements
     CATEGORY_NAME = (By.CSS_SELECTOR, f"td:nth-child({CategoryPage.TableColumns.NAME})")
@@ -80,6 +84,11 @@ class CategoriesPage(BasePage):
     # Add error alert locator
     ERROR_ALERT = (By.CSS_SELECTOR, ".alert.alert--danger .alert__content .col")
 
+    def __init__(self, driver, base_url=None):
+        super().__init__(driver)
+        # App URL for list_url(), BASE_URL from the config when not given
+        self.base_url = base_url
+
     def get_category_details(self, row):
         """Get details for a category row"""
         return {
@@ -89,12 +98,42 @@ class CategoriesPage(BasePage):
         }
 
     def get_all_categories(self):
-        """Get all categories from current page"""
-        categories = []
-        rows = self.find_elements(self.TABLE_ROWS)
-        for row in rows:
-            categories.append(self.get_category_details(row))
-        return categories
+        """Get all categories from current page in a single table read"""
+        snapshot = self.get_table_snapshot()
+        return [
+            {'name': name, 'sort_order': sort_order, 'status': status}
+            for name, sort_order, status in zip(
+                snapshot.text(CategoryPage.TableColumns.NAME),
+                snapshot.text(CategoryPage.TableColumns.SORT_ORDER),
+                snapshot.badge(CategoryPage.TableColumns.STATUS)
+            )
+        ]
+
+    def list_url(self, name=None, order_by=None, status=None, count_per_page=None, page=None):
+        """URL of the categories list with the given search, sort, filter and paging params"""
+        params = {
+            'name': name,
+            'order_by': order_by,
+            'status': str(status).lower() if isinstance(status, bool) else status,
+            'count_per_page': count_per_page,
+            'page': page
+        }
+        query = urlencode({key: value for key, value in params.items() if value is not None})
+        if self.base_url is None:
+            self.base_url = Config(require_login=False).base_url
+        url = f"{self.base_url.rstrip('/')}{CategoryPage.URLS['LIST']}"
+        return f"{url}?{query}" if query else url
+
+    def load_filtered(self, name=None, order_by=None, status=None, count_per_page=None, page=None):
+        """Open the list already searched, sorted and filtered by URL instead of through the widgets
+
+        status takes True/False like filter_by_status, order_by a CategoryPage.SORT_OPTIONS value.
+        """
+        url = self.list_url(name, order_by, status, count_per_page, page)
+        self.logger.info(f"Loading categories: {url}")
+        self.driver.get(url)
+        self.wait_until_ready()
+        return self
 
     def search_category(self, name):
         """Search for a category by name with improved waits"""
@@ -109,7 +148,7 @@ class CategoriesPage(BasePage):
             search_input.send_keys(name)
             
             # Wait for search results with longer timeout
-            long_wait = WebDriverWait(self.driver, 20)
+            long_wait = TimedWait(self.driver, 20)
             
             # Wait for table update
             old_rows = self.find_elements(self.TABLE_ROWS)
@@ -122,8 +161,8 @@ class CategoriesPage(BasePage):
             long_wait.until(EC.visibility_of(table))
             long_wait.until(EC.presence_of_element_located(self.TABLE_ROWS))
             
-            # Additional wait for data to load
-            self.driver.implicitly_wait(2)
+            # Wait for the results table to stop changing
+            self.wait_for_settled(self.TABLE)
             
             # Verify search results
             def verify_search_result():
@@ -170,8 +209,8 @@ class CategoriesPage(BasePage):
             # Wait for new rows
             self.wait.until(EC.presence_of_all_elements_located(self.TABLE_ROWS))
             
-            # Additional wait for sorting to complete
-            self.driver.implicitly_wait(1)
+            # Wait for sorting to complete
+            self.wait_for_settled(self.TABLE)
             
             return self
             
@@ -207,7 +246,7 @@ class CategoriesPage(BasePage):
             
             # Wait for new rows
             self.wait.until(EC.presence_of_all_elements_located(self.TABLE_ROWS))
-            self.driver.implicitly_wait(1)  # Additional wait for data
+            self.wait_for_settled(self.TABLE)  # Wait for filtered data
             
             return self
             
@@ -259,18 +298,27 @@ class CategoriesPage(BasePage):
 
     def edit_category(self, name):
         """Edit category by name"""
-        rows = self.find_elements(self.TABLE_ROWS)
-        for row in rows:
-            if row.find_element(*self.CATEGORY_NAME).text == name:
-                row.find_element(*self.EDIT_BUTTON).click()
-                return True
+        def click(row):
+            row.find_element(*self.EDIT_BUTTON).click()
+            return True
+        if self.with_row(CategoryPage.TableColumns.NAME, name, click):
+            # Left the list, its rows are gone
+            self.invalidate_rows()
+            return True
         return False
 
+    def _click_delete(self, name):
+        """Click the delete action of the category's row, False if no row has that name"""
+        def click(row):
+            self.driver.execute_script("arguments[0].click();", row.find_element(*self.DELETE_BUTTON))
+            return True
+        return bool(self.with_row(CategoryPage.TableColumns.NAME, name, click))
+
     def wait_for_modal(self):
         """Wait for modal to be visible and interactive"""
         try:
             # Wait for modal with longer timeout
-            long_wait = WebDriverWait(self.driver, 20)
+            long_wait = TimedWait(self.driver, 20)
             
             # Wait for both modal and dialog
             modal = long_wait.until(EC.presence_of_element_located(self.DELETE_MODAL))
@@ -279,8 +327,8 @@ class CategoriesPage(BasePage):
             # Wait for confirmation text
             long_wait.until(EC.visibility_of_element_located(self.DELETE_CONFIRM_TEXT))
             
-            # Additional wait for animation
-            self.driver.implicitly_wait(1)
+            # Wait for the modal animation to finish
+            self.wait_for_settled(self.DELETE_MODAL)
             
             return True
         except Exception as e:
@@ -293,16 +341,7 @@ class CategoriesPage(BasePage):
             self.logger.info(f"Attempting to delete category: {name}")
             
             # Find and click delete button for category
-            found = False
-            rows = self.find_elements(self.TABLE_ROWS)
-            for row in rows:
-                if row.find_element(*self.CATEGORY_NAME).text.strip() == name:
-                    delete_btn = row.find_element(*self.DELETE_BUTTON)
-                    self.driver.execute_script("arguments[0].click();", delete_btn)
-                    found = True
-                    break
-            
-            if not found:
+            if not self._click_delete(name):
                 self.logger.error(f"Category '{name}' not found")
                 return False
 
@@ -316,7 +355,7 @@ class CategoriesPage(BasePage):
             
             # Check for error message immediately
             try:
-                error_elem = WebDriverWait(self.driver, 5).until(
+                error_elem = TimedWait(self.driver, 5).until(
                     EC.presence_of_element_located(self.ERROR_ALERT)
                 )
                 if error_elem.is_displayed() and error_elem.text:
@@ -329,13 +368,11 @@ class CategoriesPage(BasePage):
             # Wait for modal to close and verify deletion
             self.wait.until(EC.invisibility_of_element_located(self.DELETE_MODAL))
             
-            # Wait a moment and verify category is gone
-            self.driver.implicitly_wait(2)
-            remaining_rows = self.find_elements(self.TABLE_ROWS)
-            for row in remaining_rows:
-                if row.find_element(*self.CATEGORY_NAME).text.strip() == name:
-                    self.logger.error(f"Category '{name}' still exists after deletion")
-                    return False
+            # Wait for the table to update and verify category is gone
+            self.wait_for_settled(self.TABLE)
+            if self.find_row(CategoryPage.TableColumns.NAME, name) is not None:
+                self.logger.error(f"Category '{name}' still exists after deletion")
+                return False
                     
             self.logger.info(f"Category '{name}' successfully deleted")
             return True
@@ -348,16 +385,7 @@ class CategoriesPage(BasePage):
         """Cancel category deletion with improved modal handling"""
         try:
             # Find and click delete button
-            found = False
-            rows = self.find_elements(self.TABLE_ROWS)
-            for row in rows:
-                if row.find_element(*self.CATEGORY_NAME).text.strip() == name:
-                    delete_btn = row.find_element(*self.DELETE_BUTTON)
-                    self.driver.execute_script("arguments[0].click();", delete_btn)
-                    found = True
-                    break
-                    
-            if not found:
+            if not self._click_delete(name):
                 self.logger.error(f"Category '{name}' not found")
                 return False
 
@@ -373,13 +401,7 @@ class CategoriesPage(BasePage):
             self.wait.until(EC.invisibility_of_element_located(self.DELETE_MODAL))
             
             # Verify category still exists
-            rows = self.find_elements(self.TABLE_ROWS)
-            still_exists = any(
-                row.find_element(*self.CATEGORY_NAME).text.strip() == name 
-                for row in rows
-            )
-            
-            if not still_exists:
+            if self.find_row(CategoryPage.TableColumns.NAME, name) is None:
                 self.logger.error("Category disappeared after cancellation")
                 return False
                 
@@ -407,27 +429,20 @@ class CategoriesPage(BasePage):
             return 1
 
     def navigate_to_page(self, direction):
-        """Navigate to next or previous page"""
+        """Open the next or previous page through its link, returns True once the new page is loaded"""
         try:
             if direction == 'next':
-                button = self.find_element(self.NEXT_PAGE)
+                link = self.find_element(self.NEXT_PAGE)
             else:
-                button = self.find_element(self.PREV_PAGE)
-                
-            # Get current categories before navigation
-            current_categories = self.get_all_categories()
+                link = self.find_element(self.PREV_PAGE)
             
-            # Click the pagination button
-            self.driver.execute_script("arguments[0].click();", button)
-            
-            # Wait for table update
-            self.wait.until(EC.staleness_of(self.find_element(self.TABLE_ROWS)))
-            self.wait.until(EC.presence_of_element_located(self.TABLE_ROWS))
+            url = link.get_attribute('href')
+            self.logger.info(f"Navigating {direction}: {url}")
+            self.driver.get(url)
             
-            # Additional wait for data
-            self.driver.implicitly_wait(1)
-            
-            return current_categories
+            # Wait for the new page's data
+            self.wait_until_ready()
+            return True
             
         except Exception as e:
             self.logger.error(f"Failed to navigate {direction}: {str(e)}")
@@ -436,7 +451,7 @@ class CategoriesPage(BasePage):
     def verify_no_records(self):
         """Verify no records found after search"""
         try:
-            long_wait = WebDriverWait(self.driver, 20)
+            long_wait = TimedWait(self.driver, 20)
             return long_wait.until(lambda d: 
                 len(d.find_elements(*self.TABLE_ROWS)) == 0 or
                 d.find_elements(*self.NO_RECORDS)[0].text.strip() == "No record found"
@@ -28,8 +28,8 @@ class EditCategoryPage(AddCategoryPage):
             self.wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
             self.wait.until(EC.presence_of_element_located(self.NAME_INPUT))
             
-            # Additional wait for form data to populate
-            self.driver.implicitly_wait(2)
+            # Wait for form data to populate
+            self.wait_for_settled()
             
             # Get current values
             actual_data = {
@@ -63,7 +63,7 @@ class EditCategoryPage(AddCategoryPage):
             self.wait.until(EC.presence_of_element_located(self.NAME_INPUT))
             self.wait.until(EC.presence_of_element_located(self.DESCRIPTION_INPUT))
             self.wait.until(EC.presence_of_element_located(self.SORT_ORDER_INPUT))
-            self.driver.implicitly_wait(2)  # Additional wait for data population
+            self.wait_for_settled()  # Wait for data population
             return True
         except Exception as e:
             self.logger.error(f"Page failed to load: {str(e)}")
@@ -75,8 +75,8 @@ class EditCategoryPage(AddCategoryPage):
             if self.is_element_visible(self.GALLERY_OVERLAY):
                 self.click(self.GALLERY_CLOSE_BUTTON)
                 self.wait.until_not(EC.presence_of_element_located(self.GALLERY_OVERLAY))
-                # Additional wait for animation
-                self.driver.implicitly_wait(1)
+                # Wait for the close animation
+                self.wait_for_settled()
             return True
         except Exception as e:
             self.logger.error(f"Failed to close gallery: {str(e)}")
@@ -0,0 +1,86 @@
+import logging
+from urllib.parse import urlencode, urlsplit
+from .base_page import BasePage
+from .users_page import UsersPage
+from .add_user_page import AddUserPage
+from .edit_user_page import EditUserPage
+from .categories_page import CategoriesPage
+from .add_category_page import AddCategoryPage
+from .edit_category_page import EditCategoryPage
+from data.constants import URLs
+from data.constants import UsersPage as UserConstants
+from data.constants import CategoryPage as CategoryConstants
+
+class Router:
+    """Opens app pages by URL instead of clicking through the side menu
+
+    Paths come from data.constants (URLs attribute names such as "CATEGORIES" work
+    too). The page object registered for a path decides when the page is ready and
+    which requests are blocked while the browser is on it.
+    """
+
+    PAGES = {
+        URLs.USERS: UsersPage,
+        UserConstants.URLS["NEW"]: AddUserPage,
+        UserConstants.URLS["EDIT"]: EditUserPage,
+        URLs.CATEGORIES: CategoriesPage,
+        CategoryConstants.URLS["NEW"]: AddCategoryPage,
+        CategoryConstants.URLS["EDIT"]: EditCategoryPage,
+    }
+
+    def __init__(self, driver, base_url):
+        self.driver = driver
+        self.base_url = base_url.rstrip('/')
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def resolve(path):
+        """Turn a URLs attribute name into its path, paths are returned unchanged"""
+        if not path.startswith('/'):
+            return getattr(URLs, path.upper())
+        return path
+
+    def url(self, path, params=None, **path_args):
+        """Full URL for a path, filling {id}-style placeholders and adding query params (None values are dropped)"""
+        url = f"{self.base_url}{self.resolve(path).format(**path_args)}"
+        query = {key: value for key, value in (params or {}).items() if value is not None}
+        return f"{url}?{urlencode(query)}" if query else url
+
+    def page_class(self, path):
+        """Page object class for a path, BasePage when none is registered"""
+        return self.PAGES.get(self.resolve(path), BasePage)
+
+    def page_for(self, path):
+        """Page object for a path, pages that build their own URLs get the router's base URL"""
+        page = self.page_class(path)(self.driver)
+        if hasattr(page, 'base_url'):
+            page.base_url = self.base_url
+        return page
+
+    def block_requests(self, path, url=None):
+        """Block the BLOCKED_REQUESTS of path's page object while the browser is on url (default: path's URL)
+
+        Paths without a page object clear the blocks of the page before.
+        """
+        interceptor = getattr(self.driver, 'interceptor', None)
+        if interceptor:
+            interceptor.block_page(urlsplit(url or self.url(path)).path, self.page_class(path).BLOCKED_REQUESTS)
+
+    def _ready(self, path):
+        page = self.page_for(path)
+        if not page.wait_until_ready():
+            self.logger.warning(f"{path} opened but not ready")
+        return page
+
+    def wait_until_ready(self, path):
+        """Wait for the page object of an already loaded path to be ready, blocking its requests from now on"""
+        self.block_requests(path, self.driver.current_url)
+        return self._ready(path)
+
+    def open(self, path, params=None, **path_args):
+        """Load a page directly and return its page object once ready"""
+        url = self.url(path, params, **path_args)
+        self.logger.info(f"Opening {url}")
+        self.block_requests(path, url)
+        self.driver.get(url)
+        return self._ready(path)
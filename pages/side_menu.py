@@ -1,6 +1,6 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
+from utils.wait_stats import TimedWait
 from .base_page import BasePage
 from data.constants import SideMenu as Constants  # Add this import
 
@@ -39,7 +39,7 @@ class SideMenu(BasePage):
                 lambda driver: driver.execute_script("return document.readyState") == "complete"
             )
             # Then wait for sidebar elements with longer timeout
-            long_wait = WebDriverWait(self.driver, 20)
+            long_wait = TimedWait(self.driver, 20)
             long_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".sidebar")))
             long_wait.until(EC.visibility_of_element_located(self.HEADER_LOGO))
             return True
@@ -51,7 +51,7 @@ class SideMenu(BasePage):
         """Generic method to expand submenu"""
         try:
             # Wait for button with longer timeout
-            long_wait = WebDriverWait(self.driver, 15)
+            long_wait = TimedWait(self.driver, 15)
             button = long_wait.until(EC.element_to_be_clickable(button_locator))
             
             # Check if already expanded
@@ -133,7 +133,7 @@ class SideMenu(BasePage):
     def click_link_with_retry(self, locator, expected_url_part):
         """Click link with retry mechanism"""
         try:
-            long_wait = WebDriverWait(self.driver, 15)
+            long_wait = TimedWait(self.driver, 15)
             element = long_wait.until(EC.element_to_be_clickable(locator))
             
             # First try normal click
@@ -281,7 +281,7 @@ class SideMenu(BasePage):
             self.logger.info("Navigating to Users section")
             
             # Wait for the element with longer timeout
-            long_wait = WebDriverWait(self.driver, 20)
+            long_wait = TimedWait(self.driver, 20)
             users_link = long_wait.until(EC.element_to_be_clickable(self.USERS_LINK))
             
             # Click using JavaScript for reliability
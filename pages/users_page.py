@@ -1,6 +1,7 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+from utils.wait_stats import TimedWait
+from selenium.common.exceptions import StaleElementReferenceException
 from .base_page import BasePage
 from data.constants import UsersPage as Constants
 
@@ -49,6 +50,8 @@ class UsersPage(BasePage):
     TABLE = (By.CSS_SELECTOR, ".table")
     TABLE_HEADERS = (By.CSS_SELECTOR, "thead th")
     TABLE_ROWS = (By.CSS_SELECTOR, "tbody tr")
+    READY_LOCATOR = TABLE
+    BLOCKED_REQUESTS = ('image', 'font', 'analytics')  # Avatars and webfonts aren't checked by list tests
     
     # User Row Elements using predefined column indices
     USER_NAME_COL = (By.CSS_SELECTOR, f"td:nth-child({NAME_COL})")
@@ -110,42 +113,33 @@ class UsersPage(BasePage):
         return self
 
     def get_user_details(self, row):
-        """Get details for a user row with retry mechanism"""
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                return {
-                    'name': self.driver.execute_script("return arguments[0].querySelector('td:nth-child(1) span').textContent;", row),
-                    'email': self.driver.execute_script("return arguments[0].querySelector('td:nth-child(2) a').textContent;", row),
-                    'role': self.driver.execute_script("return arguments[0].querySelector('td:nth-child(3)').textContent;", row)
-                }
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    self.logger.error(f"Failed to get user details after {max_retries} attempts: {str(e)}")
-                    raise
-                self.logger.warning(f"Retry {attempt + 1}: Failed to get user details")
-                self.wait_for_users_table()
+        """Get details for a user row in a single script call"""
+        return self.driver.execute_script("""
+            const cell = (index) => arguments[0].querySelector(`td:nth-child(${index})`);
+            const text = (element) => element ? element.textContent.trim() : '';
+            return {
+                name: text(cell(arguments[1]).querySelector('span')),
+                email: text(cell(arguments[2]).querySelector('a')),
+                role: text(cell(arguments[3]))
+            };
+        """, row, NAME_COL, EMAIL_COL, ROLE_COL)
 
     def get_all_users(self):
-        """Get all users from current page with stability check"""
+        """Get all users from current page in a single table read"""
         try:
             # Wait for table to be ready
             self.wait_for_users_table()
-            self.driver.implicitly_wait(1)  # Short wait for data to settle
+            self.wait_for_settled(self.TABLE)
             
-            # Get all rows with retry mechanism
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    rows = self.find_elements(self.USER_ROW)
-                    return [self.get_user_details(row) for row in rows]
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        self.logger.error(f"Failed to get users after {max_retries} attempts: {str(e)}")
-                        raise
-                    self.logger.warning(f"Retry {attempt + 1}: Failed to get users")
-                    self.wait_for_users_table()
-                    
+            snapshot = self.get_table_snapshot()
+            return [
+                {'name': name, 'email': email, 'role': role}
+                for name, email, role in zip(
+                    snapshot.text(NAME_COL),
+                    snapshot.text(EMAIL_COL),
+                    snapshot.text(ROLE_COL)
+                )
+            ]
         except Exception as e:
             self.logger.error(f"Failed to get all users: {str(e)}")
             return []
@@ -203,31 +197,43 @@ class UsersPage(BasePage):
         """Get all user rows from the table"""
         return self.find_elements(self.USER_ROW)
 
-    def get_user_by_email(self, email, check_all_pages=True):
-        """Find a user row by email with improved waits and retries"""
+    def get_user_by_email(self, email, check_all_pages=True, prefetch=False):
+        """Find a user row by email, following the pagination only as far as needed"""
         try:
             self.logger.info(f"Looking for user with email: {email}")
             
+            # Repeated lookups on an unchanged page are answered from the row index
+            if self._rows is not None:
+                row = self._rows.row(EMAIL_COL, email)
+                if row is not None:
+                    return row
+            
             # Wait for table with longer timeout
-            long_wait = WebDriverWait(self.driver, 30)
+            long_wait = TimedWait(self.driver, 30)
             long_wait.until(EC.presence_of_element_located(self.TABLE))
             long_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'tbody tr')))
             
-            # Additional wait for data to settle
-            self.driver.implicitly_wait(3)
+            # Wait for data to settle
+            self.wait_for_settled(self.TABLE)
             
-            # Get all user rows
-            rows = self.find_elements(self.USER_ROW)
-            for row in rows:
-                try:
-                    user_email = row.find_element(*self.USER_EMAIL_COL).text.strip()
-                    self.logger.info(f"Checking user with email: {user_email}")
-                    if user_email == email:
-                        self.logger.info(f"Found user: {email}")
-                        return row
-                except Exception as e:
-                    self.logger.warning(f"Error checking row: {str(e)}")
+            # A search through all pages starts at page 1, an earlier lookup may have left the browser further on
+            max_pages = None if check_all_pages else 1
+            for snapshot in self.iter_pages(max_pages=max_pages, prefetch=prefetch, from_first=check_all_pages):
+                if email not in snapshot.index(EMAIL_COL):
                     continue
+                
+                if not snapshot.elements:
+                    # Prefetched over HTTP - open the page to get the row element
+                    self.driver.get(snapshot.url)
+                    self.wait_until_ready()
+                    snapshot = self.get_table_snapshot()
+                # The browser is on this page now, keep its rows for the next lookup
+                self.cache_rows(snapshot)
+                row = snapshot.row(EMAIL_COL, email)
+                if row is None:
+                    break
+                self.logger.info(f"Found user: {email}")
+                return row
             
             self.logger.warning(f"User not found: {email}")
             return None
@@ -236,6 +242,19 @@ class UsersPage(BasePage):
             self.logger.error(f"Error searching for user: {str(e)}")
             return None
 
+    def _with_user_row(self, email, action):
+        """Run action(row) on the user's row, looking it up again once if the cached row went stale"""
+        for attempt in range(2):
+            row = self.get_user_by_email(email)
+            if row is None:
+                return None
+            try:
+                return action(row)
+            except StaleElementReferenceException:
+                self.invalidate_rows()
+                if attempt:
+                    raise
+
     def click_next_page(self):
         """Click next page if available"""
         try:
@@ -266,23 +285,19 @@ class UsersPage(BasePage):
             self.search_user(email, search_type="email")
             
             # Wait for search results with longer timeout
-            long_wait = WebDriverWait(self.driver, 20)
+            long_wait = TimedWait(self.driver, 20)
             
             # Wait for table update
             long_wait.until(EC.presence_of_element_located(self.TABLE))
             long_wait.until(EC.presence_of_element_located(self.USER_ROW))
             
-            # Additional wait for data
-            self.driver.implicitly_wait(3)
+            # Wait for data to settle
+            self.wait_for_settled(self.TABLE)
             
             # Check rows after search
-            rows = self.find_elements(self.USER_ROW)
-            for row in rows:
-                user_email = row.find_element(*self.USER_EMAIL_COL).text.strip()
-                self.logger.info(f"Found email in row: {user_email}")
-                if user_email == email:
-                    self.logger.info(f"User found: {email}")
-                    return True
+            if self.find_row(EMAIL_COL, email) is not None:
+                self.logger.info(f"User found: {email}")
+                return True
             
             self.logger.warning(f"User not found after search: {email}")
             return False
@@ -293,10 +308,12 @@ class UsersPage(BasePage):
 
     def click_user_row(self, email):
         """Click on a user row by email"""
-        user_row = self.get_user_by_email(email)
-        if user_row:
+        def click(row):
             self.logger.info(f"Clicking user row with email: {email}")
-            user_row.click()
+            row.click()
+            return True
+        if self._with_user_row(email, click):
+            self.invalidate_rows()
             return True
         self.logger.warning(f"User with email {email} not found in table")
         return False
@@ -320,11 +337,12 @@ class UsersPage(BasePage):
     def edit_user(self, email):
         """Click edit button for specific user"""
         try:
-            user_row = self.get_user_by_email(email)
-            if user_row:
-                edit_link = user_row.find_element(*self.EDIT_BUTTON)
+            def click(row):
                 self.logger.info(f"Clicking edit button for user: {email}")
-                edit_link.click()
+                row.find_element(*self.EDIT_BUTTON).click()
+                return True
+            if self._with_user_row(email, click):
+                self.invalidate_rows()
                 return True
             self.logger.warning(f"User with email {email} not found")
             return False
@@ -386,7 +404,7 @@ class UsersPage(BasePage):
             search_input.send_keys(query)
             
             # Use longer timeout for search results
-            long_wait = WebDriverWait(self.driver, 20)
+            long_wait = TimedWait(self.driver, 20)
             
             # Wait for old results to become stale
             old_rows = self.find_elements(self.TABLE_ROWS)
@@ -398,8 +416,8 @@ class UsersPage(BasePage):
             long_wait.until(EC.visibility_of(table))
             long_wait.until(EC.presence_of_element_located(self.TABLE_ROWS))
             
-            # Additional wait for data to settle
-            self.driver.implicitly_wait(2)
+            # Wait for data to settle
+            self.wait_for_settled(self.TABLE)
             
             # Verify search results
             def verify_search_result():
@@ -0,0 +1,32 @@
+import argparse
+import json
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.test_impact import DependencyMap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main():
+    parser = argparse.ArgumentParser(description="List the tests affected by changes, from a static map of what each test uses")
+    parser.add_argument('base', nargs='?', default='origin/main', help="Git ref to compare against (merge base with HEAD)")
+    parser.add_argument('--explain', action='store_true', help="Show the changed symbols or files behind each test")
+    parser.add_argument('--map', action='store_true', help="Print each test's page objects, locators and constants as JSON")
+    args = parser.parse_args()
+
+    dependency_map = DependencyMap(ROOT)
+    if args.map:
+        print(json.dumps(dependency_map.to_dict(), indent=2))
+        return 0
+
+    affected = dependency_map.affected(args.base)
+    for nodeid, reasons in sorted(affected.items()):
+        print(f"{nodeid}  <- {', '.join(reasons)}" if args.explain else nodeid)
+    print(f"{len(affected)} of {len(dependency_map.tests)} tests affected by changes since {args.base}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Not available on Windows, the Python high-water mark is reported as None there
+    resource = None
+
+try:
+    import psutil
+except ImportError:  # psutil is optional, only needed to measure the browser's memory
+    psutil = None
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pages.login_page import LoginPage
+from pages.categories_page import CategoriesPage
+from pages.add_category_page import AddCategoryPage
+from pages.router import Router
+from data.constants import CategoryPage as CategoryConstants, LoginPage as LoginConstants
+from utils.command_tracer import CommandTracer
+from utils.report_utils import StreamingReportWriter
+from utils.standin_app import StandinApp
+from utils.webdriver_factory import WebDriverFactory
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "benchmarks", "results")
+BASELINE_PATH = os.path.join(PROJECT_ROOT, "benchmarks", "baseline.json")
+TEMPLATE_PATH = os.path.join(PROJECT_ROOT, "templates", "report_template.html")
+
+def setup_logger():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    # Page objects log every step, keep the benchmark output readable
+    logging.getLogger().setLevel(logging.WARNING)
+    logger = logging.getLogger('benchmark')
+    logger.setLevel(logging.INFO)
+    return logger
+
+def python_maxrss_kb():
+    """High-water mark of this Python process's resident set size in KiB, since it started"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS reports bytes
+
+class BrowserMemorySampler:
+    """Peak RSS of the browser process tree while a flow runs, in KiB
+
+    The tree is the driver service process (chromedriver) and all its children: Chrome's
+    browser, GPU and renderer processes. It is summed every `interval` seconds on a
+    background thread. peak stays None without psutil or a local driver process.
+    """
+
+    def __init__(self, driver, interval=0.05):
+        self.interval = interval
+        self.process = None
+        self.peak = None
+        self._stop = threading.Event()
+        self._thread = None
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        if psutil and process is not None:
+            try:
+                self.process = psutil.Process(process.pid)
+            except psutil.Error:
+                pass
+
+    def sample(self):
+        """Current RSS of the process tree in KiB, None when the driver process is gone"""
+        try:
+            processes = [self.process] + self.process.children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                pass  # Renderer exited between listing and reading
+        return total // 1024
+
+    def _record(self):
+        rss = self.sample()
+        if rss is not None:
+            self.peak = rss if self.peak is None else max(self.peak, rss)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._record()
+
+    def __enter__(self):
+        self.peak = None
+        if self.process is not None:
+            self._stop.clear()
+            self._record()
+            self._thread = threading.Thread(target=self._run, name="browser-rss", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            self._record()
+        return False
+
+class BenchmarkContext:
+    """Stand-in app, logged-in browser and page objects shared by the flows"""
+
+    def __init__(self, app, driver):
+        self.app = app
+        self.driver = driver
+        self.router = Router(driver, app.base_url)
+        self.categories_page = CategoriesPage(driver, app.base_url)
+        self.add_page = AddCategoryPage(driver)
+        self.counter = 0
+
+    def login(self):
+        self.driver.delete_all_cookies()
+        self.driver.get(f"{self.app.base_url}{LoginConstants.URLS['LOGIN']}")
+        assert LoginPage(self.driver).login(self.app.data.email, self.app.data.password), "Login failed"
+
+# Each flow takes the context and does one representative piece of framework work
+
+def flow_login(ctx):
+    ctx.login()
+
+def list_scrape(rows):
+    def flow(ctx):
+        ctx.router.open(CategoryConstants.URLS["LIST"], {'count_per_page': rows})
+        categories = ctx.categories_page.get_all_categories()
+        assert len(categories) == rows, f"Expected {rows} rows, read {len(categories)}"
+    return flow
+
+def flow_search(ctx):
+    ctx.router.open(CategoryConstants.URLS["LIST"])
+    ctx.categories_page.search_category("Category 00042")
+    assert ctx.categories_page.find_row(CategoryConstants.TableColumns.NAME, "Category 00042") is not None
+
+def flow_paginate(ctx):
+    ctx.categories_page.load_filtered(count_per_page=50)
+    pages = sum(1 for _ in ctx.categories_page.iter_pages())
+    assert pages > 1, "Expected more than one page"
+
+def flow_create_delete_category(ctx):
+    ctx.counter += 1
+    name = f"Bench Category {ctx.counter} {int(time.time() * 1000)}"
+    ctx.router.open(CategoryConstants.URLS["NEW"])
+    assert ctx.add_page.upload_photo(), "Photo selection failed"
+    ctx.add_page.fill_category_form(name, "Benchmark category", 100000 + ctx.counter)
+    assert ctx.add_page.save_category(), "Save failed"
+    ctx.categories_page.load_filtered(name=name)
+    assert ctx.categories_page.delete_category(name), "Delete failed"
+
+def flow_report(ctx, results=1000):
+    with tempfile.TemporaryDirectory() as report_dir:
+        writer = StreamingReportWriter(TEMPLATE_PATH, os.path.join(report_dir, "report.html"))
+        for index in range(results):
+            writer.add_test_case(f"tests/test_bench.py::test_{index}", {
+                'name': f"test_{index}",
+                'status': 'failed' if index % 10 == 0 else 'passed',
+                'duration': 0.5 + index % 7,
+                'error': "AssertionError: expected value" if index % 10 == 0 else None,
+                'logs': "\n".join(f"2024-01-01 00:00:00 - INFO - step {step}" for step in range(20))
+            })
+        writer.finalize()
+
+FLOWS = {
+    'login': flow_login,
+    'list_10': list_scrape(10),
+    'list_50': list_scrape(50),
+    'list_500': list_scrape(500),
+    'search': flow_search,
+    'paginate': flow_paginate,
+    'create_delete_category': flow_create_delete_category,
+    'report_1k': flow_report,
+}
+
+# Flows that never touch the browser
+OFFLINE_FLOWS = {'report_1k'}
+
+def run_flows(names, repeat, latency_ms, profile, logger):
+    """Run each flow repeat times, returns the per-flow measurements"""
+    results = {}
+    tracer = CommandTracer()
+    needs_browser = any(name not in OFFLINE_FLOWS for name in names)
+    with StandinApp(categories=600, users=50, latency_ms=latency_ms) as app:
+        driver = WebDriverFactory.create_driver(profile=profile) if needs_browser else None
+        try:
+            ctx = BenchmarkContext(app, driver)
+            sampler = BrowserMemorySampler(driver)
+            if driver:
+                ctx.login()
+                if sampler.process is None:
+                    logger.info("Browser memory not measured, install psutil for browser_peak_rss_kb")
+            for name in names:
+                runs, commands, browser_peaks = [], [], []
+                for _ in range(repeat):
+                    if driver:
+                        tracer.attach(driver)
+                    with sampler:
+                        started = time.perf_counter()
+                        FLOWS[name](ctx)
+                        runs.append(time.perf_counter() - started)
+                    commands.append(tracer.stop()['count'] if driver else 0)
+                    if sampler.peak is not None and name not in OFFLINE_FLOWS:
+                        browser_peaks.append(sampler.peak)
+                results[name] = {
+                    'wall': statistics.median(runs),
+                    'runs': runs,
+                    'commands': max(commands),
+                    'browser_peak_rss_kb': max(browser_peaks) if browser_peaks else None,
+                    'python_maxrss_kb': python_maxrss_kb()
+                }
+                memory = f", browser peak {results[name]['browser_peak_rss_kb'] // 1024} MiB" if browser_peaks else ""
+                logger.info(f"{name}: {results[name]['wall']:.3f}s, {results[name]['commands']} commands{memory}")
+        finally:
+            if driver:
+                driver.quit()
+    return results
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+def compare(current, baseline, threshold):
+    """Rows of (flow, metric, baseline, current, change) and whether any metric regressed past threshold"""
+    rows = []
+    regressed = False
+    for name, result in current['flows'].items():
+        previous = baseline['flows'].get(name)
+        if not previous:
+            continue
+        for metric in ('wall', 'commands'):
+            before, after = previous.get(metric), result.get(metric)
+            if not before:
+                continue
+            change = (after - before) / before
+            failed = change > threshold
+            regressed = regressed or failed
+            rows.append((name, metric, before, after, change, failed))
+    return rows, regressed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark framework flows against the local stand-in app")
+    parser.add_argument('--flows', nargs='+', choices=list(FLOWS), default=list(FLOWS), help="Flows to run")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per flow, the median wall time is kept")
+    parser.add_argument('--latency', type=float, default=0, help="Milliseconds the stand-in app adds per request")
+    parser.add_argument('--profile', default="default", choices=list(WebDriverFactory.PROFILES),
+                        help="Browser launch profile")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="Baseline JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Allowed slowdown before failing (0.10 = 10%%)")
+    parser.add_argument('--save-baseline', action='store_true', help="Store this run as the new baseline")
+    args = parser.parse_args()
+
+    logger = setup_logger()
+    result = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {'repeat': args.repeat, 'latency_ms': args.latency, 'profile': args.profile},
+        'flows': run_flows(args.flows, max(1, args.repeat), args.latency, args.profile, logger)
+    }
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    result_path = os.path.join(RESULTS_DIR, f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+    logger.info(f"Results written: {result_path}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        logger.info(f"Baseline saved: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        logger.info("No baseline to compare against, run with --save-baseline to create one")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('settings') != result['settings']:
+        logger.warning(f"Baseline settings differ: {baseline.get('settings')} vs {result['settings']}")
+
+    rows, regressed = compare(result, baseline, args.threshold)
+    print(f"{'flow':<24} {'metric':<9} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, metric, before, after, change, failed in rows:
+        fmt = "{:>10.3f}" if metric == 'wall' else "{:>10}"
+        print(f"{name:<24} {metric:<9} {fmt.format(before)} {fmt.format(after)} {change:>+7.1%}"
+              f"{'  REGRESSION' if failed else ''}")
+    if regressed:
+        logger.error(f"Regression above {args.threshold:.0%} against baseline from {baseline.get('commit')}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
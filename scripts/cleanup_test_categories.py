@@ -1,13 +1,11 @@
+import argparse
 import os
 import sys
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
 from dotenv import load_dotenv
 
 # Add project root to path
@@ -15,7 +13,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pages.login_page import LoginPage
 from pages.categories_page import CategoriesPage
-from pages.side_menu import SideMenu
+from data.constants import CategoryPage as CategoryConstants
+from utils.http_client import AdminHttpClient
+from utils.session_cache import SessionCache
 
 def setup_logger():
     logging.basicConfig(
@@ -26,7 +26,6 @@ def setup_logger():
 
 def cleanup_test_categories():
     logger = setup_logger()
-    wait_between_actions = 1  # seconds
     
     # Load environment variables
     load_dotenv()
@@ -43,96 +42,42 @@ def cleanup_test_categories():
     chrome_options.add_argument('--start-maximized')
     driver = webdriver.Chrome(options=chrome_options)
     
-    # Add locators for error alert
-    PRODUCT_ERROR_ALERT = (By.CSS_SELECTOR, ".alert.alert--danger .alert__content .col")
-    
     try:
         # Initialize pages
         login_page = LoginPage(driver)
-        categories_page = CategoriesPage(driver)
-        side_menu = SideMenu(driver)
+        categories_page = CategoriesPage(driver, base_url)
         
         # Login
         logger.info("Logging in...")
         driver.get(f"{base_url}/login")
         login_page.login(username, password)
         
-        # Add explicit wait
-        wait = WebDriverWait(driver, 20)
-        
-        # Navigate to categories page
+        # Navigate to categories page with maximum items per page
         logger.info("Navigating to categories...")
-        side_menu.navigate_to_system_settings_item('categories')
-        time.sleep(2)  # Wait for page to settle
+        categories_page.load_filtered(count_per_page=50)
         
-        # Set maximum items per page
-        categories_page.set_items_per_page(50)  # Use maximum items per page
-        time.sleep(2)  # Wait for table update
+        # Collect test categories from every page first, deleting shifts rows between pages
+        names = []
+        for snapshot in categories_page.iter_pages(prefetch=True):
+            names.extend(name for name in snapshot.text(CategoryConstants.TableColumns.NAME)
+                         if 'test' in name.lower())
+        logger.info(f"Found {len(names)} test categories")
         
         deleted_count = 0
         skipped_count = 0
-        has_more_pages = True
-        
-        while has_more_pages:
-            # Get fresh rows after each page load
-            rows = WebDriverWait(driver, 10).until(
-                EC.presence_of_all_elements_located(categories_page.TABLE_ROWS)
-            )
-            
-            if not rows:
-                logger.info("No categories found on current page")
-                break
-                
-            # Process each row index instead of the row element
-            for i in range(len(rows)):
-                try:
-                    # Get fresh row element for each iteration
-                    current_row = driver.find_elements(*categories_page.TABLE_ROWS)[i]
-                    name = current_row.find_element(*categories_page.CATEGORY_NAME).text.strip()
-                    
-                    if 'test' in name.lower():
-                        logger.info(f"Found test category: {name}")
-                        
-                        # Try to delete
-                        if categories_page.delete_category(name):
-                            try:
-                                error_elem = WebDriverWait(driver, 5).until(
-                                    EC.presence_of_element_located(PRODUCT_ERROR_ALERT)
-                                )
-                                if "Cannot delete" in error_elem.text:
-                                    logger.info(f"Skipping '{name}' - Cannot delete due to associations")
-                                    skipped_count += 1
-                                    continue
-                            except:
-                                deleted_count += 1
-                                logger.info(f"Successfully deleted: {name}")
-                                time.sleep(wait_between_actions)
-                                # After deletion, get fresh rows
-                                break  # Break to refresh row list
-                        else:
-                            logger.warning(f"Failed to delete: {name}")
-                            
-                except Exception as e:
-                    logger.warning(f"Error processing row {i}: {str(e)}")
-                    continue
-                
-                time.sleep(0.5)
-            
-            # Check for next page with explicit wait
+        for name in names:
             try:
-                next_button = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located(categories_page.NEXT_PAGE)
-                )
-                if "disabled" not in next_button.get_attribute("class"):
-                    logger.info("Moving to next page...")
-                    driver.execute_script("arguments[0].click();", next_button)
-                    time.sleep(2)
+                logger.info(f"Found test category: {name}")
+                categories_page.load_filtered(name=name)
+                if categories_page.delete_category(name):
+                    deleted_count += 1
+                    logger.info(f"Successfully deleted: {name}")
                 else:
-                    has_more_pages = False
-                    logger.info("Reached last page")
-            except:
-                has_more_pages = False
-                logger.info("No more pages found")
+                    # delete_category logs the app's "Cannot delete" message
+                    logger.info(f"Skipping '{name}' - Cannot delete due to associations")
+                    skipped_count += 1
+            except Exception as e:
+                logger.warning(f"Error processing {name}: {str(e)}")
         
         logger.info(f"Cleanup complete. Deleted: {deleted_count}, Skipped: {skipped_count} categories")
         
@@ -141,5 +86,111 @@ def cleanup_test_categories():
     finally:
         driver.quit()
 
+def find_test_categories(client, match):
+    """List (name, delete path) of every category whose name contains match, across all pages"""
+    columns = CategoryConstants.TableColumns
+    found = []
+    for snapshot in client.iter_tables(CategoryConstants.URLS["LIST"], {'count_per_page': 50}):
+        for name, actions in zip(snapshot.text(columns.NAME), snapshot.actions(columns.ACTION)):
+            if match not in name.lower():
+                continue
+            path = actions.get('Delete')
+            if not path or path == '#':
+                path = (actions.get('Edit') or '').rsplit('/edit', 1)[0]
+            if path:
+                found.append((name, path))
+    return found
+
+def cleanup_test_categories_http(base_url, username, password, dry_run=False, workers=8, match='test',
+                                 worker=None, session_dir=".cache/sessions"):
+    """Delete test categories with concurrent HTTP requests instead of driving the UI
+
+    The login of the last test run is reused when one is cached: worker's session file,
+    or else the most recent one of any worker (parallel runs keep one per xdist worker).
+    """
+    logger = setup_logger()
+    client = AdminHttpClient(base_url, pool_size=workers)
+    try:
+        # Reuse the session cached by the last test run before falling back to the login form
+        caches = ([SessionCache(base_url, session_dir, worker_id=worker)] if worker
+                  else SessionCache.all_workers(base_url, session_dir))
+        if any(client.use_session_cache(cache) for cache in caches):
+            logger.info("Reusing cached test session")
+        elif not client.login(username, password):
+            logger.error("Login failed")
+            return None
+
+        targets = find_test_categories(client, match)
+        logger.info(f"Found {len(targets)} test categories")
+        if dry_run:
+            for name, path in targets:
+                logger.info(f"Would delete: {name} ({path})")
+            return {'deleted': [], 'blocked': [], 'failed': [], 'pending': [name for name, _ in targets]}
+
+        def delete(target):
+            name, path = target
+            try:
+                response = client.delete(path)
+                if response.status_code >= 400 and response.status_code != 422:
+                    return path, f"HTTP {response.status_code}"
+                return path, None
+            except Exception as e:
+                return path, str(e)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            errors = dict(executor.map(delete, targets))
+
+        # Categories still listed were refused by the app, usually because products use them
+        remaining = {path for _, path in find_test_categories(client, match)}
+        result = {'deleted': [], 'blocked': [], 'failed': []}
+        for name, path in targets:
+            if path not in remaining:
+                result['deleted'].append(name)
+            elif errors[path]:
+                result['failed'].append(name)
+                logger.warning(f"Failed to delete '{name}': {errors[path]}")
+            else:
+                result['blocked'].append(name)
+                logger.info(f"Skipped '{name}' - Cannot delete due to associations")
+
+        logger.info(f"Cleanup complete. Deleted: {len(result['deleted'])}, "
+                    f"Blocked: {len(result['blocked'])}, Failed: {len(result['failed'])} categories")
+        return result
+    except Exception as e:
+        logger.error(f"Cleanup failed: {str(e)}")
+        return None
+    finally:
+        client.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Delete categories created by test runs")
+    parser.add_argument('--http', action='store_true', help="Delete over HTTP instead of through the browser")
+    parser.add_argument('--dry-run', action='store_true', help="Only list the categories that would be deleted")
+    parser.add_argument('--workers', type=int, default=8, help="Concurrent delete requests in HTTP mode")
+    parser.add_argument('--match', default='test', help="Delete categories whose name contains this text")
+    parser.add_argument('--worker', help="Reuse the session of this test worker (main, gw0, ...) in HTTP mode, "
+                                         "default: the most recent one")
+    args = parser.parse_args()
+
+    if not args.http:
+        if args.dry_run:
+            parser.error("--dry-run needs --http")
+        cleanup_test_categories()
+        return
+
+    load_dotenv()
+    base_url = os.getenv('BASE_URL')
+    if not base_url:
+        parser.error("Missing BASE_URL environment variable")
+    cleanup_test_categories_http(
+        base_url,
+        os.getenv('APP_USERNAME'),
+        os.getenv('APP_PASSWORD'),
+        dry_run=args.dry_run,
+        workers=args.workers,
+        match=args.match.lower(),
+        worker=args.worker
+    )
+
 if __name__ == "__main__":
-    cleanup_test_categories()
+    main()
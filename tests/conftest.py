@@ -2,11 +2,25 @@ import pytest
 import logging
 import os
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from string import Template
-from utils.webdriver_factory import WebDriverFactory
-from utils.report_utils import ReportGenerator, TestCaseLogHandler
+from utils.webdriver_factory import WebDriverFactory, WebDriverPool
+from utils.report_utils import ReportGenerator, StreamingReportWriter, TestCaseLogHandler
+from utils.session_cache import SessionCache
+from utils.screenshot_manager import ScreenshotManager
+from utils.command_tracer import CommandTracer
+from utils.wait_stats import WaitReport, wait_stats
+from utils.request_interceptor import AssetCache
+from utils.data_factory import DataFactory
+from utils.entity_registry import EntityRegistry, entity_registry
+from utils.data_pool import data_pool
+from utils.duration_store import DurationStore
+from utils.test_impact import DependencyMap
+from utils.standin_app import StandinApp
 from config.config import Config
+from pages.login_page import LoginPage
+from pages.router import Router
+from data.constants import URLs, LoginPage as LoginConstants
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
@@ -20,6 +34,9 @@ def setup_logger():
         format='%(message)s',  # Simplified format
         force=True
     )
+    # A LOG_CAPTURE_LEVEL below INFO lowers the root level for the per-test capture, keep the console at INFO
+    for handler in logging.getLogger().handlers:
+        handler.setLevel(logging.INFO)
     
     # Silence verbose loggers
     logging.getLogger('WDM').setLevel(logging.ERROR)
@@ -27,88 +44,367 @@ def setup_logger():
     logging.getLogger('urllib3').setLevel(logging.ERROR)
     logging.getLogger('report').setLevel(logging.INFO)
 
-def create_screenshot_dirs():
-    """Create screenshots directory structure"""
-    base_dir = "screenshots"
-    if not os.path.exists(base_dir):
-        os.makedirs(base_dir)
+def get_worker_id():
+    """Name of the pytest-xdist worker running this process, 'main' when not parallel"""
+    return os.environ.get('PYTEST_XDIST_WORKER', 'main')
+
+def is_worker(config):
+    """Check if this process is a pytest-xdist worker rather than the controller"""
+    return hasattr(config, 'workerinput')
+
+def get_worker_index():
+    """Number of this pytest-xdist worker (gw3 is 3) and the worker count, (0, 1) when not parallel"""
+    worker_id = get_worker_id()
+    index = int(worker_id[2:]) if worker_id.startswith('gw') else 0
+    return index, int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', '1'))
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_session(request, settings):
+    setup_logger()
+    wait_stats.slow_ratio = settings.slow_wait_ratio
+    seed = settings.data_seed if settings.data_seed is not None else request.config.data_seed
+    data_pool.configure(seed, *get_worker_index())
+    logging.info(f"Test data seed {data_pool.seed} (set DATA_SEED={data_pool.seed} to repeat this run's data)")
+
+@pytest.fixture(scope="session")
+def settings():
+    """Run settings without the login check, for fixtures that every test uses, browser-free ones too"""
+    return Config(require_login=False)
+
+@pytest.fixture(scope="session")
+def config(settings):
+    """Run settings of tests that log in, fails when LOGIN_EMAIL or LOGIN_PASSWORD is missing"""
+    return settings.check_login()
+
+@pytest.fixture(scope="session")
+def launch_browser(config):
+    """Browser factory for the configured browser, launch profile and headless setting"""
+    return partial(
+        WebDriverFactory.create_driver,
+        config.browser,
+        profile=config.browser_profile,
+        headless=config.headless,
+        cache_dir=os.path.join(config.browser_cache_dir, get_worker_id()),
+        driver_cache_dir=config.driver_cache_dir
+    )
+
+@pytest.fixture(scope="session")
+def driver_pool(config, launch_browser):
+    """Warm browser pool shared by the session, None when pooling is disabled"""
+    if config.pool_size <= 0:
+        yield None
+        return
     
-    date_dir = os.path.join(base_dir, datetime.now().strftime('%Y-%m-%d'))
-    if not os.path.exists(date_dir):
-        os.makedirs(date_dir)
-    return date_dir
+    pool = WebDriverPool(size=config.pool_size, max_uses=config.pool_max_uses, factory=launch_browser).start()
+    yield pool
+    pool.shutdown()
+
+@pytest.fixture(scope="session")
+def screenshot_manager(config):
+    """Background screenshot writer, flushed when the session ends"""
+    manager = ScreenshotManager(policy=config.screenshot_policy, image_format=config.screenshot_format)
+    yield manager
+    manager.shutdown()
+
+@pytest.fixture(scope="session")
+def asset_cache(config):
+    """Static assets served to browsers by request stubbing, shared by all workers"""
+    return AssetCache(config.asset_cache_dir)
+
+@pytest.fixture(scope="session")
+def session_cache(settings):
+    """On-disk login session shared by all tests of this worker"""
+    return SessionCache(settings.base_url, ttl=settings.session_ttl, worker_id=get_worker_id())
 
-def take_screenshot(driver, name):
-    """Take screenshot and save it in organized directory structure"""
-    timestamp = datetime.now().strftime('%H-%M-%S')
-    screenshot_dir = create_screenshot_dirs()
-    clean_name = "".join(char for char in name if char.isalnum() or char in (' ', '-', '_')).rstrip()
-    screenshot_path = os.path.join(screenshot_dir, f"{clean_name}_{timestamp}.png")
+@pytest.fixture(scope="session")
+def standin_app():
+    """Local stand-in admin app for tests of the HTTP layer, which need no browser or real app"""
+    with StandinApp() as app:
+        yield app
+
+@pytest.fixture(scope="function")
+def standin_factory(standin_app, tmp_path):
+    """Data factory logged in to the stand-in app
+
+    It has its own registry with manifests under tmp_path, so stand-in records never
+    reach the session's cleanup of the real app.
+    """
+    registry = EntityRegistry(manifest_dir=str(tmp_path), worker_id=get_worker_id())
+    factory = DataFactory.connect(standin_app.base_url, standin_app.data.email, standin_app.data.password,
+                                  workers=4, registry=registry)
+    yield factory
+    factory.close()
+
+@pytest.fixture(scope="session")
+def data_factory(config, session_cache):
+    """Creates the records tests need over HTTP instead of through the forms"""
+    factory = DataFactory.connect(config.base_url, config.username, config.password, session_cache)
+    yield factory
+    factory.close()
+
+@pytest.fixture(scope="session", autouse=True)
+def created_entities(settings, session_cache):
+    """Registry of the records tests create, deleted again when the session ends
+
+    Runs without login credentials leave earlier runs' leftovers for a run that has them.
+    """
+    entity_registry.worker_id = get_worker_id()
+    if settings.entity_cleanup and settings.has_login:
+        entity_registry.claim_leftovers()
+    
+    yield entity_registry
     
+    if not settings.entity_cleanup or not len(entity_registry):
+        return
     try:
-        driver.save_screenshot(screenshot_path)
-        logging.info(f"Screenshot saved: {screenshot_path}")
-        return screenshot_path
+        factory = DataFactory.connect(settings.base_url, settings.username, settings.password, session_cache, workers=8)
     except Exception as e:
-        logging.error(f"Failed to save screenshot: {str(e)}")
-        return None
+        path = entity_registry.write_leftovers(entity_registry.drain())
+        logging.error(f"Test data cleanup skipped, records saved to {path}: {str(e)}")
+        return
+    try:
+        entity_registry.cleanup(factory)
+    finally:
+        factory.close()
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_session(request):
-    setup_logger()
-    request.config.test_data = {}  # Store on config instead of session
+@pytest.fixture(scope="function")
+def router(driver, config):
+    """Direct URL navigation to app pages"""
+    return Router(driver, config.base_url)
 
-@pytest.fixture(scope="session")
-def config():
-    return Config()
+@pytest.fixture(scope="function")
+def authenticated(request, driver, config, session_cache, router):
+    """Logged-in browser opened on the test's landing page, reusing the cached session when valid"""
+    marker = request.node.get_closest_marker("landing")
+    landing_path = marker.args[0] if marker else URLs.DASHBOARD
+    
+    if config.session_ttl > 0:
+        # The restore loads the landing page, block what it blocks before that
+        router.block_requests(landing_path)
+        if session_cache.restore(driver, landing_path):
+            router.wait_until_ready(landing_path)
+            return driver
+    
+    # No usable session - log in through the form once and cache the result
+    router.block_requests(LoginConstants.URLS['LOGIN'])
+    driver.get(f"{config.base_url}{LoginConstants.URLS['LOGIN']}")
+    assert LoginPage(driver).login(config.username, config.password), "Login failed"
+    if config.session_ttl > 0:
+        session_cache.capture(driver)
+    if landing_path in driver.current_url:
+        router.wait_until_ready(landing_path)
+    else:
+        router.open(landing_path)
+    return driver
 
 @pytest.fixture(scope="function", autouse=True)
-def test_logging(request):
+def test_logging(request, settings):
     """Per-test logging setup"""
     logger = logging.getLogger()
-    log_handler = TestCaseLogHandler()
+    clean_name = "".join(char for char in request.node.name if char.isalnum() or char in ('-', '_'))
+    spill_path = os.path.join("logs", datetime.now().strftime('%Y-%m-%d'), f"{clean_name}_{get_worker_id()}.log")
+    log_handler = TestCaseLogHandler(
+        capacity=settings.log_capture_size,
+        level=settings.log_capture_level,
+        spill_path=spill_path
+    )
     logger.addHandler(log_handler)
     
     yield
     
+    logger.removeHandler(log_handler)
+    log_handler.close()
+    
     # Initialize test data if not exists
     if request.node.nodeid not in request.config.test_data:
         request.config.test_data[request.node.nodeid] = {}
     
-    # Store logs
-    request.config.test_data[request.node.nodeid]['logs'] = log_handler.get_logs()
-    logger.removeHandler(log_handler)
+    # Store logs, formatted only now that the test is done
+    test_data = request.config.test_data[request.node.nodeid]
+    test_data['logs'] = log_handler.get_logs()
+    if log_handler.log_file:
+        test_data['log_file'] = log_handler.log_file
+
+@pytest.fixture(scope="function", autouse=True)
+def wait_recording(request):
+    """Collect the test's wait times for the run's slowest-waits table"""
+    wait_stats.drain()  # Left over from the previous test's teardown
+    
+    yield
+    
+    request.config.test_data.setdefault(request.node.nodeid, {})['waits'] = wait_stats.drain()
 
 @pytest.fixture(scope="function")
-def driver(request):
-    """Browser fixture with screenshot capture"""
-    # Create driver using factory
-    driver = WebDriverFactory.create_driver()
+def driver(request, config, driver_pool, launch_browser, screenshot_manager, asset_cache):
+    """Browser fixture with request interception, command tracing and screenshot capture"""
+    # Take a warm browser from the pool or create one using factory
+    driver = driver_pool.acquire() if driver_pool else launch_browser()
+    
+    # Block what the run and the test's block_requests marker ask for, tests marked
+    # needs_media get every request through, also what the profile or pages block
+    interceptor = driver.interceptor
+    marker = request.node.get_closest_marker("block_requests")
+    interceptor.block('run', config.block_requests)
+    interceptor.block('test', marker.args if marker else ())
+    if request.node.get_closest_marker("needs_media"):
+        interceptor.pause()
+    if config.stub_assets:
+        interceptor.start_stubbing(config.stub_assets, asset_cache)
+    tracer = CommandTracer().attach(driver) if config.command_trace else None
     
     yield driver
     
+    # Stop tracing first so teardown commands don't count against the test
+    if tracer:
+        request.config.test_data.setdefault(request.node.nodeid, {})['commands'] = tracer.stop()
+    if driver_pool:
+        interceptor.reset(keep=('profile', 'run'))
+    
     try:
-        # Take screenshot at test end
-        screenshot_path = take_screenshot(driver, request.node.name)
-        if request.node.nodeid not in request.config.test_data:
-            request.config.test_data[request.node.nodeid] = {}
-        request.config.test_data[request.node.nodeid]['screenshot'] = screenshot_path
+        # Take screenshot at test end if the policy asks for it - a missing call report means setup failed
+        rep_call = getattr(request.node, 'rep_call', None)
+        failed = rep_call is None or rep_call.failed
+        if screenshot_manager.should_capture(failed):
+            screenshot_path = screenshot_manager.capture(driver, request.node.name, suffix=f"_{get_worker_id()}")
+            if request.node.nodeid not in request.config.test_data:
+                request.config.test_data[request.node.nodeid] = {}
+            request.config.test_data[request.node.nodeid]['screenshot'] = screenshot_path
         
     except Exception as e:
         logging.error(f"Screenshot failed for {request.node.name}: {str(e)}")
     finally:
-        driver.quit()
+        if driver_pool:
+            driver_pool.release(driver)
+        else:
+            driver.quit()
+
+class ReportDataCollector:
+    """Merges test data sent back by xdist workers and streams each finished test into the report"""
+    
+    def __init__(self, config, writer, waits):
+        self.config = config
+        self.writer = writer
+        self.waits = waits
+    
+    def pytest_runtest_logreport(self, report):
+        data = getattr(report, 'test_data', None)
+        if report.when == "teardown" and data:
+            test_data = self.config.test_data.setdefault(report.nodeid, {})
+            test_data.update(data)
+            self.waits.add(test_data.pop('waits', []))
+            try:
+                self.writer.add_test_case(report.nodeid, test_data)
+                test_data.pop('logs', None)  # Already on disk, don't keep them for the whole run
+            except Exception as e:
+                logging.error(f"Failed to write {report.nodeid} to report: {str(e)}")
+
+class DurationRecorder:
+    """Adds up each test's setup, call and teardown time and saves it to the duration store at the end"""
+    
+    def __init__(self, store):
+        self.store = store
+        self.phases = {}
+    
+    def pytest_runtest_logreport(self, report):
+        seconds, passed, skipped = self.phases.get(report.nodeid, (0.0, True, False))
+        self.phases[report.nodeid] = (seconds + report.duration, passed and not report.failed, skipped or report.skipped)
+        if report.when == "teardown":
+            seconds, passed, skipped = self.phases.pop(report.nodeid)
+            if not skipped:  # Skipped tests say nothing about how long they take
+                self.store.record(report.nodeid, seconds, passed)
+    
+    def pytest_sessionfinish(self, session):
+        try:
+            path = self.store.save()
+            if path:
+                logging.info(f"Test durations saved: {path}")
+        except Exception as e:
+            logging.error(f"Failed to save test durations: {str(e)}")
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--changed-since", metavar="REF", default=None,
+        help="only run the tests affected by changes since REF (e.g. origin/main), found by utils/test_impact.py"
+    )
 
 def pytest_configure(config):
     config._metadata = None  # Clear default metadata
+    config.test_data = {}  # Store on config instead of session
+    # One data seed per run, chosen by the controller and passed to every worker
+    config.data_seed = config.workerinput.get('data_seed') if is_worker(config) else data_pool.seed
     pytest.screenshot_data = {}
+    
+    # pytest sets the root logger level for every test phase; let it go down to LOG_CAPTURE_LEVEL so
+    # records below INFO reach the per-test log handler (the console handlers stay at their own level)
+    capture_level = logging.getLevelName(os.getenv('LOG_CAPTURE_LEVEL', 'INFO').upper())
+    if isinstance(capture_level, int) and capture_level < logging.INFO and config.getoption('log_level') is None:
+        config.option.log_level = logging.getLevelName(capture_level)
+    # No login check: collection-only and --changed-since runs have no credentials
+    settings = Config(require_login=False)
+    config.duration_store = DurationStore(settings.duration_store)
+    config.duration_order = settings.duration_order
+    
+    if not is_worker(config):
+        template_path = os.path.join(os.path.dirname(__file__), '..', 'templates', 'report_template.html')
+        report_path = os.path.join("reports", f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
+        config.report_writer = StreamingReportWriter(template_path, report_path, report_generator)
+        config.wait_report = WaitReport()
+        config.pluginmanager.register(
+            ReportDataCollector(config, config.report_writer, config.wait_report), "report_data_collector"
+        )
+        config.pluginmanager.register(DurationRecorder(config.duration_store), "duration_recorder")
+
+def select_changed(config, items, base):
+    """Deselect the tests the changes since base can't affect, tests missing from the dependency map are kept"""
+    try:
+        dependency_map = DependencyMap(config.rootpath)
+        affected = dependency_map.affected(base)
+    except Exception as e:
+        logging.warning(f"Could not tell which tests changes since {base} affect, running all: {str(e)}")
+        return items
+    selected, deselected = [], []
+    for item in items:
+        nodeid = item.nodeid.split('[')[0]
+        (selected if nodeid in affected or nodeid not in dependency_map.tests else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    if get_worker_id() in ('main', 'gw0'):
+        logging.info(f"{len(selected)} of {len(items)} tests affected by changes since {base}")
+    return selected
+
+def pytest_collection_modifyitems(config, items):
+    """Keep the tests affected by --changed-since, then run the longest first
+    
+    Longest first lets pytest-xdist workers, taking the next test as they free up, finish at
+    about the same time. That order is the only balancing; the per-worker loads logged here are
+    an estimate, xdist's scheduler decides the actual assignment. Every worker reads the same
+    git state and duration store, so they all collect the same tests in the same order.
+    """
+    if config.getoption("changed_since"):
+        items[:] = select_changed(config, items, config.getoption("changed_since"))
+    if not config.duration_order or not len(config.duration_store) or not items:
+        return
+    items[:] = config.duration_store.order(items)
+    if get_worker_id() in ('main', 'gw0'):
+        _, loads = config.duration_store.partition([item.nodeid for item in items], get_worker_index()[1])
+        logging.info(
+            f"Ordered {len(items)} tests longest first, about {max(loads):.0f}s "
+            f"on {len(loads)} worker(s) if xdist balances them ideally ({sum(loads):.0f}s of tests)"
+        )
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the run's data seed to a starting pytest-xdist worker"""
+    node.workerinput['data_seed'] = node.config.data_seed
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)  # Lets fixtures check the outcome at teardown
     
-    if report.when == "call":
+    # Record the call phase, or the setup phase when the test never got to run
+    if report.when == "call" or (report.when == "setup" and not report.passed):
         # Initialize test data if not exists
         if item.nodeid not in item.config.test_data:
             item.config.test_data[item.nodeid] = {}
@@ -126,55 +422,37 @@ def pytest_runtest_makereport(item, call):
             'name': item.name,
             'status': report.outcome,
             'duration': report.duration,
-            'error': error_message
+            'error': error_message,
+            'worker': get_worker_id()
         })
+    
+    elif report.when == "teardown":
+        # Attach everything collected for this test so xdist ships it back to the controller
+        report.test_data = item.config.test_data.get(item.nodeid, {})
 
 def pytest_terminal_summary(terminalreporter, exitstatus, config):
-    """Handle test report generation"""
+    """Finish the HTML report streamed during the run"""
+    if is_worker(config):
+        return  # The controller builds a single report from all workers' data
+    
     try:
         logging.info("Generating HTML report")
-        template_path = os.path.join(os.path.dirname(__file__), '..', 'templates', 'report_template.html')
-        
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template = Template(f.read())
-        
-        test_cases_html = []
-        test_data = getattr(config, 'test_data', {})  # Get from config instead of terminalreporter
-        
-        for nodeid, data in test_data.items():
-            test_case_html = report_generator.create_test_case_html(
-                name=data.get('name', nodeid),
-                status=data.get('status', 'unknown'),
-                duration=data.get('duration', 0),
-                error=data.get('error'),
-                screenshot_path=data.get('screenshot'),
-                logs=data.get('logs', '')
-            )
-            test_cases_html.append(test_case_html)
-            
-        # Prepare report data
-        report_data = {
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'passed': len([x for x in test_data.values() if x.get('status') == 'passed']),
-            'failed': len([x for x in test_data.values() if x.get('status') == 'failed']),
-            'skipped': len([x for x in test_data.values() if x.get('status') == 'skipped']),
-            'duration': f"{sum(x.get('duration', 0) for x in test_data.values()):.2f}s",
-            'test_cases': '\n'.join(test_cases_html)
-        }
-        
-        # Generate report using safe substitution
-        html_report = template.safe_substitute(report_data)
-        
-        # Save the report
-        report_dir = "reports"
-        if not os.path.exists(report_dir):
-            os.makedirs(report_dir)
+        report_path = config.report_writer.finalize()
+        logging.info(f"HTML report generated: {report_path}")
         
-        report_path = os.path.join(report_dir, f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_report)
+        if len(config.wait_report):
+            terminalreporter.write_sep("-", "slowest waits")
+            for line in config.wait_report.table():
+                terminalreporter.write_line(line)
+            waits_path = config.wait_report.write(f"{os.path.splitext(report_path)[0]}_waits.json")
+            logging.info(f"Wait times written: {waits_path}")
         
-        logging.info(f"HTML report generated: {report_path}")
+        if len(config.duration_store):
+            terminalreporter.write_sep("-", "test duration trends")
+            for line in config.duration_store.table():
+                terminalreporter.write_line(line)
+            durations_path = config.duration_store.write(f"{os.path.splitext(report_path)[0]}_durations.json")
+            logging.info(f"Duration trends written: {durations_path}")
         
     except Exception as e:
         logging.error(f"Error generating report: {str(e)}", exc_info=True)
@@ -1,51 +1,43 @@
 import pytest
 import logging
-from faker import Faker
 from pages.add_category_page import AddCategoryPage
 from pages.categories_page import CategoriesPage
 from pages.side_menu import SideMenu
 from pages.login_page import LoginPage
 from data.constants import AddCategoryPage as Constants
+from data.constants import CategoryPage as CategoryConstants
+from utils.data_pool import data_pool
 import random
 import string
 import os
 
+@pytest.mark.landing(CategoryConstants.URLS["NEW"])
 class TestAddCategory:
     @pytest.fixture(autouse=True)
-    def setup(self, driver, config):
+    def setup(self, authenticated, driver, config, router):
         # Initialize logger
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # Initialize other attributes
-        self.faker = Faker()
         self.add_category_page = AddCategoryPage(driver)
         self.categories_page = CategoriesPage(driver)
         self.side_menu = SideMenu(driver)
         self.login_page = LoginPage(driver)
+        self.router = router
         self.driver = driver
         self.config = config
-        
-        # Login and navigate to add category page
-        self.driver.get(f"{self.config.base_url}/login")
-        self.login_page.login(self.config.username, self.config.password)
-        self.side_menu.expand_system_settings()
-        self.side_menu.navigate_to_system_settings_item('categories')
-        self.categories_page.click_new_category()
 
     def generate_test_data(self):
-        """Generate test data using Faker"""
-        return {
-            'name': f"Test Category {self.faker.word().capitalize()}",
-            'description': self.faker.sentence(nb_words=5),
-            'sort_order': self.faker.random_int(min=0, max=1000)
-        }
+        """Unique test data from the session's data pool"""
+        record = data_pool.category()
+        return {key: record[key] for key in ('name', 'description', 'sort_order')}
 
     def generate_invalid_data(self):
         """Generate invalid test data"""
         return {
             'name': '',  # Empty name
             'description': '',  # Empty description
-            'sort_order': self.faker.word(),  # Invalid sort order (string instead of number)
+            'sort_order': data_pool.word(),  # Invalid sort order (string instead of number)
         }
 
     def test_add_category_page_elements(self):
@@ -63,19 +55,12 @@ class TestAddCategory:
     def test_create_category_successful(self):
         """Test creating a new category and verify it in the table"""
         try:
-            # Generate unique test data
-            unique_name = f"Test Category {self.faker.company()} {self.faker.random_int(min=100, max=999)}"
-            test_category = {
-                "name": unique_name,  # Company name with random number for uniqueness
-                "description": f"{self.faker.paragraph(nb_sentences=3)}\n{self.faker.catch_phrase()}",
-                "sort_order": self.faker.random_int(min=1, max=9999),
-                "active": True
-            }
+            # Unique test data, name and sort order never collide with other tests or workers
+            test_category = data_pool.category()
             
             self.logger.info(f"Using test data: {test_category}")
             
-            # Navigate and fill form
-            self.categories_page.click_new_category()
+            # Fill form
             self.add_category_page.upload_photo()
             
             # Store sort order for comparison
@@ -94,9 +79,8 @@ class TestAddCategory:
             self.add_category_page.save_category()
             assert "/admin/categories" in self.driver.current_url
             
-            # Search and verify
-            self.logger.info(f"Searching for category: {test_category['name']}")
-            self.categories_page.search_category(test_category["name"])
+            # Load the list filtered to the new category and verify
+            self.categories_page.load_filtered(name=test_category["name"])
             
             categories = self.categories_page.get_all_categories()
             assert len(categories) > 0, "No categories found after search"
@@ -159,10 +143,6 @@ class TestAddCategory:
 
     def test_discard_changes(self):
         """Test discarding changes when creating category"""
-        # Navigate to new category page
-        self.side_menu.navigate_to_system_settings_item('categories')
-        self.categories_page.click_new_category()
-        
         # Fill form but don't save
         self.add_category_page.fill_category_form(
             name="Discarded Category",
@@ -180,12 +160,7 @@ class TestAddCategory:
         """Test unique constraints for name and sort order"""
         try:
             # First create a category
-            first_category = {
-                "name": f"Test Category {self.faker.company()}",
-                "description": self.faker.paragraph(),
-                "sort_order": self.faker.random_int(min=1, max=999),
-                "active": True
-            }
+            first_category = data_pool.category()
             
             self.logger.info(f"Creating first category: {first_category}")
             
@@ -200,15 +175,10 @@ class TestAddCategory:
             self.add_category_page.save_category()
             
             # Navigate back to create new category
-            self.categories_page.click_new_category()
+            self.router.open(CategoryConstants.URLS["NEW"])
             
             # Try to create category with same name but different sort order
-            duplicate_name = {
-                "name": first_category["name"],  # Same name
-                "description": self.faker.paragraph(),
-                "sort_order": self.faker.random_int(min=1000, max=1999),  # Different sort order
-                "active": True
-            }
+            duplicate_name = data_pool.category(name=first_category["name"])  # Same name, different sort order
             
             self.logger.info(f"Attempting to create category with duplicate name: {duplicate_name}")
             
@@ -222,12 +192,7 @@ class TestAddCategory:
                 f"Expected 'already been taken' error not found in: {alert_errors}"
             
             # Try with different name but same sort order
-            duplicate_sort = {
-                "name": f"Test Category {self.faker.company()}", # Different name
-                "description": self.faker.paragraph(),
-                "sort_order": first_category["sort_order"],  # Same sort order
-                "active": True
-            }
+            duplicate_sort = data_pool.category(sort_order=first_category["sort_order"])  # Different name, same sort order
             
             self.logger.info(f"Attempting to create category with duplicate sort order: {duplicate_sort}")
             
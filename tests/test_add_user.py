@@ -4,34 +4,24 @@ from pages.add_user_page import AddUserPage
 from pages.users_page import UsersPage
 from pages.side_menu import SideMenu
 from pages.login_page import LoginPage
-from data.constants import LoginPage as LoginConstants
 from data.constants import AddUserPage as Constants
-from faker import Faker
+from data.constants import UsersPage as UserConstants
+from utils.data_pool import data_pool
 
+@pytest.mark.landing(UserConstants.URLS["NEW"])
 class TestAddUser:
     @pytest.fixture(autouse=True)
-    def setup(self, driver, config):
+    def setup(self, authenticated, driver, config, router):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.faker = Faker()
         self.add_user_page = AddUserPage(driver)
         self.users_page = UsersPage(driver)
         self.side_menu = SideMenu(driver)
         self.login_page = LoginPage(driver)
+        self.router = router
         self.driver = driver
         self.config = config
         
-        # Login first using LoginPage
-        self.logger.info("Logging in before add user tests")
-        self.driver.get(f"{config.base_url}{LoginConstants.URLS['LOGIN']}")
-        assert self.login_page.login(config.username, config.password), "Login failed"
-        
-        # Navigate to users page using side menu
-        self.logger.info("Navigating to Users page")
-        assert self.side_menu.navigate_to_users(), "Failed to navigate to Users page"
-        
-        # Wait for users page and click add user
-        assert self.users_page.wait_for_users_table(), "Users table failed to load"
-        self.users_page.click(self.users_page.NEW_USER_BUTTON)
+        # Logged in on the new user form
         self.logger.info("Setup completed successfully")
 
     def test_create_user_with_valid_data(self):
@@ -74,27 +64,18 @@ class TestAddUser:
     def test_duplicate_email_validation(self):
         """Test that duplicate email addresses are not allowed"""
         # Create first user with generated data
-        user_data = {
-            'first_name': self.faker.first_name(),
-            'last_name': self.faker.last_name(),
-            'email': self.faker.email(),
-            'role': 'Administrator'  # Removed is_active
-        }
+        user_data = data_pool.user()
         
         # Create first user and verify success
         self.add_user_page.create_user(user_data)
         assert self.users_page.is_user_present(user_data['email']), \
             "First user creation failed"
         
-        # Click New User button to create second user
-        self.users_page.click(self.users_page.NEW_USER_BUTTON)
+        # Open the new user form again to create second user
+        self.router.open(UserConstants.URLS["NEW"])
         
         # Try to create second user with same email
-        duplicate_data = user_data.copy()
-        duplicate_data.update({
-            'first_name': self.faker.first_name(),
-            'last_name': self.faker.last_name()
-        })
+        duplicate_data = data_pool.user(email=user_data['email'], role=user_data['role'])
         
         self.add_user_page.fill_user_form(duplicate_data)
         self.add_user_page.save_user()
@@ -3,23 +3,18 @@ import logging
 from pages.categories_page import CategoriesPage
 from pages.side_menu import SideMenu
 from pages.login_page import LoginPage
-from data.constants import CategoryPage
+from data.constants import CategoryPage, URLs
 
+@pytest.mark.landing(URLs.CATEGORIES)
 class TestCategories:
     @pytest.fixture(autouse=True)
-    def setup(self, driver, config):
+    def setup(self, authenticated, driver, config):
         self.categories_page = CategoriesPage(driver)
         self.side_menu = SideMenu(driver)
         self.login_page = LoginPage(driver)
         self.driver = driver
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
-        
-        # Login and navigate to categories
-        self.driver.get(f"{self.config.base_url}/login")
-        self.login_page.login(self.config.username, self.config.password)
-        self.side_menu.expand_system_settings()
-        self.side_menu.navigate_to_system_settings_item('categories')
 
     def test_categories_page_elements(self):
         """Verify basic page elements are present and correct"""
@@ -73,13 +68,12 @@ class TestCategories:
         # Test descending order
         self.logger.info("Testing sort order descending")
         self.categories_page.sort_by_column(CategoryPage.TableColumns.SORT_ORDER)
-        self.driver.implicitly_wait(1)
+        self.categories_page.wait_for_settled(self.categories_page.TABLE)
         verify_sort_order(self.categories_page.get_all_categories(), descending=True)
 
         # Test ascending order
         self.logger.info("Testing sort order ascending")
         self.categories_page.sort_by(CategoryPage.SORT_OPTIONS["ORDER_ASC"])
-        self.driver.implicitly_wait(1)
         verify_sort_order(self.categories_page.get_all_categories(), descending=False)
 
     def test_sort_by_name(self):
@@ -103,7 +97,7 @@ class TestCategories:
         # Test A-Z name sorting
         self.logger.info("Testing Category Name A-Z")
         self.categories_page.sort_by_column(CategoryPage.TableColumns.NAME)
-        self.driver.implicitly_wait(1)
+        self.categories_page.wait_for_settled(self.categories_page.TABLE)
         categories = self.categories_page.get_all_categories()
         names_asc = [cat['name'] for cat in categories]
         assert verify_name_sequence(names_asc, descending=False), \
@@ -112,7 +106,6 @@ class TestCategories:
         # Test Z-A name sorting
         self.logger.info("Testing Category Name Z-A")
         self.categories_page.sort_by(CategoryPage.SORT_OPTIONS["NAME_DESC"])
-        self.driver.implicitly_wait(1)
         categories = self.categories_page.get_all_categories()
         names_desc = [cat['name'] for cat in categories]
         assert verify_name_sequence(names_desc, descending=True), \
@@ -123,7 +116,6 @@ class TestCategories:
         # Test active filter
         self.logger.info("Testing Active status filter")
         self.categories_page.filter_by_status(True)
-        self.driver.implicitly_wait(1)  # Wait for filter to apply
         active_categories = self.categories_page.get_all_categories()
         
         # Log the results for debugging
@@ -138,7 +130,6 @@ class TestCategories:
         # Test inactive filter
         self.logger.info("Testing Inactive status filter")
         self.categories_page.filter_by_status(False)
-        self.driver.implicitly_wait(1)  # Wait for filter to apply
         inactive_categories = self.categories_page.get_all_categories()
         
         # Log the results for debugging
@@ -150,6 +141,21 @@ class TestCategories:
         assert all(cat['status'] == CategoryPage.STATUS["INACTIVE"] for cat in inactive_categories), \
             f"Found active categories in inactive filter: {[cat for cat in inactive_categories if cat['status'] != CategoryPage.STATUS['INACTIVE']]}"
 
+    def test_load_filtered(self):
+        """Test status filter, sort and page size applied together through the list URL"""
+        self.categories_page.load_filtered(
+            status=True,
+            order_by=CategoryPage.SORT_OPTIONS["ORDER_ASC"],
+            count_per_page=10
+        )
+        categories = self.categories_page.get_all_categories()
+        
+        assert len(categories) <= 10, f"Too many items shown. Expected max 10, got {len(categories)}"
+        assert all(cat['status'] == CategoryPage.STATUS["ACTIVE"] for cat in categories), \
+            f"Found non-active categories: {[cat for cat in categories if cat['status'] != CategoryPage.STATUS['ACTIVE']]}"
+        orders = [int(cat['sort_order']) for cat in categories]
+        assert orders == sorted(orders), f"Sort order not in ascending order: {orders}"
+
     def test_items_per_page(self):
         """Test items per page functionality with different values"""
         for items in CategoryPage.ITEMS_PER_PAGE_OPTIONS:
@@ -171,8 +177,8 @@ class TestCategories:
         # Click new category button
         self.categories_page.click_new_category()
         
-        # Wait for URL to update and page to load
-        self.driver.implicitly_wait(2)
+        # Wait for the new page to finish loading
+        self.categories_page.wait_for_settled()
         
         # Get actual URL
         actual_url = self.driver.current_url
@@ -184,9 +190,8 @@ class TestCategories:
 
     def test_pagination(self):
         """Test pagination functionality"""
-        # First set items per page to minimum to ensure pagination
-        self.categories_page.set_items_per_page('10')
-        self.driver.implicitly_wait(2)  # Wait for table update
+        # First load the list with the minimum items per page to ensure pagination
+        self.categories_page.load_filtered(count_per_page=10)
         
         # Check if pagination exists and has multiple pages
         if not self.categories_page.has_pagination():
@@ -202,16 +207,14 @@ class TestCategories:
         first_page_categories = {cat['name'] for cat in initial_categories}
         
         # Navigate to next page
-        second_page_categories = self.categories_page.navigate_to_page('next')
-        if second_page_categories:
+        if self.categories_page.navigate_to_page('next'):
             # Verify different categories on second page
             current_categories = {cat['name'] for cat in self.categories_page.get_all_categories()}
             assert not first_page_categories.intersection(current_categories), \
                 "Found duplicate categories between pages"
             
             # Navigate back
-            returned_categories = self.categories_page.navigate_to_page('prev')
-            if returned_categories:
+            if self.categories_page.navigate_to_page('prev'):
                 # Verify we're back to original categories
                 final_categories = {cat['name'] for cat in self.categories_page.get_all_categories()}
                 assert final_categories == first_page_categories, \
@@ -0,0 +1,55 @@
+import time
+import pytest
+from utils.http_client import AdminHttpClient
+from utils.session_cache import SessionCache
+from scripts.cleanup_test_categories import cleanup_test_categories_http
+
+class TestCleanupTestCategoriesHttp:
+    @pytest.fixture(autouse=True)
+    def setup(self, standin_app, standin_factory, tmp_path):
+        self.app = standin_app
+        self.session_dir = str(tmp_path / "sessions")
+        # Lower case like the script's --match, unique so other tests' records never match
+        self.match = f"qa cleanup {tmp_path.name.lower()}"
+        self.created = [standin_factory.category(name=f"QA Cleanup {tmp_path.name} {index}") for index in range(3)]
+        self.other = standin_factory.category(name=f"QA Keep {tmp_path.name}")
+        self.app.data.find(self.app.data.categories, self.created[0]['id'])['in_use'] = True
+
+    def cleanup(self, dry_run=False, password=None, worker=None):
+        return cleanup_test_categories_http(self.app.base_url, self.app.data.email, password or self.app.data.password,
+                                            dry_run=dry_run, workers=4, match=self.match,
+                                            worker=worker, session_dir=self.session_dir)
+
+    def exists(self, record):
+        return self.app.data.find(self.app.data.categories, record['id']) is not None
+
+    def test_dry_run_lists_matching_categories(self):
+        """A dry run lists only the categories whose name contains match and deletes nothing"""
+        result = self.cleanup(dry_run=True)
+        assert sorted(result['pending']) == sorted(record['name'] for record in self.created)
+        assert all(self.exists(record) for record in self.created + [self.other])
+
+    def test_deletes_and_reports_blocked(self):
+        """Categories in use are reported as blocked, the rest are deleted, others are kept"""
+        result = self.cleanup()
+        assert result['blocked'] == [self.created[0]['name']]
+        assert sorted(result['deleted']) == sorted(record['name'] for record in self.created[1:])
+        assert result['failed'] == []
+        assert self.exists(self.created[0]) and self.exists(self.other)
+        assert not any(self.exists(record) for record in self.created[1:])
+
+    def test_reuses_worker_session(self):
+        """The session a parallel worker cached is used, no login needed"""
+        client = AdminHttpClient(self.app.base_url)
+        assert client.login(self.app.data.email, self.app.data.password)
+        cookies = [{'name': cookie.name, 'value': cookie.value} for cookie in client.session.cookies]
+        client.close()
+        SessionCache(self.app.base_url, self.session_dir, worker_id="gw1").save({
+            'base_url': self.app.base_url,
+            'expires_at': time.time() + 60,
+            'cookies': cookies,
+        })
+
+        assert self.cleanup(dry_run=True, password="wrong-password") is not None
+        assert self.cleanup(dry_run=True, password="wrong-password", worker="gw0") is None, \
+            "Login with a wrong password should fail without gw0's session"
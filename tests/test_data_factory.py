@@ -0,0 +1,90 @@
+import pytest
+from utils.data_pool import DataPool
+from data.constants import AddCategoryPage as AddCategoryConstants
+from data.constants import AddUserPage as AddUserConstants
+from data.constants import CategoryPage as CategoryConstants
+
+class TakenFirstPool(DataPool):
+    """Data pool whose first category has a sort order the app already uses"""
+
+    def __init__(self, taken_sort_order):
+        super().__init__(seed=1)
+        self.taken_sort_order = taken_sort_order
+
+    def category(self, **values):
+        if self.taken_sort_order is not None:
+            values.setdefault('sort_order', self.taken_sort_order)
+            self.taken_sort_order = None
+        return super().category(**values)
+
+class TestDataFactory:
+    @pytest.fixture(autouse=True)
+    def setup(self, standin_app, standin_factory):
+        self.app = standin_app
+        self.factory = standin_factory
+        self.registry = standin_factory.registry
+
+    def find(self, kind, record_id):
+        return self.app.data.find(getattr(self.app.data, kind), record_id)
+
+    def test_submit_returns_validation_errors(self):
+        """An invalid form comes back as a 422 page whose errors are parsed"""
+        page = self.factory.client.form_page(CategoryConstants.URLS["NEW"])
+        response, result = self.factory.client.submit(page, {'category[name]': '', 'category[sort_order]': 'abc'})
+
+        assert response.status_code == 422, f"Expected 422, got HTTP {response.status_code}"
+        assert AddCategoryConstants.VALIDATION['NAME_REQUIRED'] in result.errors
+        assert AddCategoryConstants.VALIDATION['SORT_ORDER_INVALID'] in result.errors
+
+    def test_create_category(self):
+        """A created category exists in the app with the values returned and is registered for cleanup"""
+        category = self.factory.category(active=False)
+        stored = self.find('categories', category['id'])
+
+        assert stored is not None, f"Category {category['name']} not found by id {category['id']}"
+        assert stored['name'] == category['name']
+        assert stored['sort_order'] == category['sort_order']
+        assert stored['active'] is False
+        assert [(entity['kind'], entity['name']) for entity in self.registry.entities] == \
+            [('categories', category['name'])]
+
+    def test_create_categories_in_parallel(self):
+        """A batch of categories gets distinct ids, names and sort orders"""
+        categories = self.factory.categories(6)
+
+        assert len({category['id'] for category in categories}) == 6
+        assert len({category['name'] for category in categories}) == 6
+        assert len({category['sort_order'] for category in categories}) == 6
+        assert all(self.find('categories', category['id']) for category in categories)
+        assert len(self.registry) == 6
+
+    def test_create_users(self):
+        """Users are created with the role's option value, singly and in a batch"""
+        user = self.factory.user(role=AddUserConstants.ROLES['RECRUITMENT'])
+        users = self.factory.users(3)
+
+        assert self.find('users', user['id'])['role'] == AddUserConstants.ROLES['RECRUITMENT']
+        assert len({created['email'] for created in users}) == 3
+        assert all(self.find('users', created['id']) for created in users)
+        assert len(self.registry) == 4
+
+    def test_generated_taken_values_are_retried(self):
+        """Generated values the app reports as taken are drawn again"""
+        taken = self.app.data.categories[0]['sort_order']
+        self.factory.pool = TakenFirstPool(taken)
+
+        category = self.factory.category()
+        assert category['sort_order'] != taken
+        assert self.find('categories', category['id']) is not None
+
+    def test_duplicate_name_is_an_error(self):
+        """A name chosen by the caller that is taken is reported, not replaced with a generated one"""
+        taken = self.app.data.categories[0]['name']
+        with pytest.raises(ValueError, match=AddCategoryConstants.VALIDATION['NAME_TAKEN']):
+            self.factory.category(name=taken)
+        assert len(self.registry) == 0
+
+    def test_duplicate_email_is_an_error(self):
+        taken = self.app.data.users[0]['email']
+        with pytest.raises(ValueError, match=AddUserConstants.VALIDATION['EMAIL_TAKEN']):
+            self.factory.user(email=taken)
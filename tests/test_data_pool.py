@@ -0,0 +1,43 @@
+import threading
+from utils.data_pool import DataPool
+
+class TestDataPool:
+    def test_workers_never_share_values(self):
+        """Workers of one run (same seed) hand out disjoint names, emails and sort orders"""
+        names, emails, sort_orders = set(), set(), set()
+        for worker_index in range(4):
+            pool = DataPool(seed=42, worker_index=worker_index, workers=4, batch=10)
+            for _ in range(50):
+                category = pool.category()
+                names.add(category['name'])
+                sort_orders.add(category['sort_order'])
+                emails.add(pool.user()['email'])
+                assert category['sort_order'] % 4 == (DataPool.SORT_ORDER_RANGE[0] + worker_index) % 4
+        assert len(names) == len(emails) == len(sort_orders) == 200
+
+    def test_threads_never_share_values(self):
+        """Tests running in threads of one worker don't get the same value twice"""
+        pool = DataPool(seed=42, batch=10)
+        names = []
+        threads = [threading.Thread(target=lambda: names.extend(pool.category_name() for _ in range(50)))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(set(names)) == 200
+
+    def test_same_seed_reproduces_values(self):
+        """Setting DATA_SEED to a logged seed gives the run's data again"""
+        def values(pool):
+            return [pool.category() for _ in range(3)] + [pool.user() for _ in range(3)]
+
+        pool = DataPool(seed=7, worker_index=1, workers=2)
+        first = values(pool)
+        assert values(pool.configure(seed=7, worker_index=1, workers=2)) == first
+        assert values(DataPool(seed=8, worker_index=1, workers=2)) != first
+
+    def test_values_given_win(self):
+        category = DataPool(seed=1).category(name="Fixed", active=False)
+        assert category['name'] == "Fixed" and category['active'] is False
+        assert DataPool(seed=1).user(email="fixed@example.com")['email'] == "fixed@example.com"
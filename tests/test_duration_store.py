@@ -0,0 +1,45 @@
+import json
+from utils.duration_store import DurationStore
+
+class TestDurationStore:
+    def store(self, tmp_path, runs):
+        """Store whose file holds the given {nodeid: [seconds, ...]} passing runs"""
+        path = tmp_path / "durations.json"
+        tests = {nodeid: [[0, seconds, 1] for seconds in durations] for nodeid, durations in runs.items()}
+        path.write_text(json.dumps({'version': 1, 'tests': tests}))
+        return DurationStore(str(path))
+
+    def test_estimate_is_median_of_passing_runs(self, tmp_path):
+        """Failed runs don't count while there are passing ones"""
+        store = self.store(tmp_path, {"t::a": [1.0, 3.0, 2.0]})
+        store.tests["t::a"].append([0, 60.0, 0])
+        assert store.estimate("t::a") == 2.0
+        assert store.estimate("t::unknown") is None
+
+    def test_order_longest_first(self, tmp_path):
+        """Unknown tests get the median of the known ones, ties keep the collected order"""
+        store = self.store(tmp_path, {"t::short": [1.0], "t::mid": [2.0], "t::long": [5.0]})
+        order = store.order(["t::short", "t::new", "t::long", "t::mid"], key=lambda nodeid: nodeid)
+        assert order == ["t::long", "t::new", "t::mid", "t::short"]
+
+    def test_partition_balances_workers(self, tmp_path):
+        """Each next-longest test goes to the least loaded worker"""
+        store = self.store(tmp_path, {"t::a": [7.0], "t::b": [5.0], "t::c": [4.0], "t::d": [3.0], "t::e": [1.0]})
+        assignments, loads = store.partition(["t::a", "t::b", "t::c", "t::d", "t::e"], 2)
+        assert assignments == [["t::a", "t::d"], ["t::b", "t::c", "t::e"]]
+        assert loads == [10.0, 10.0]
+
+    def test_save_merges_with_file(self, tmp_path):
+        """Runs saved by another session since loading are kept, history is capped"""
+        store = self.store(tmp_path, {"t::a": [1.0, 1.1]})
+        other = DurationStore(store.path)
+        other.record("t::b", 2.0, True)
+        other.save()
+
+        store.history = 2
+        store.record("t::a", 1.2, False)
+        store.save()
+
+        saved = DurationStore(store.path).tests
+        assert [run[1:] for run in saved["t::a"]] == [[1.1, 1], [1.2, 0]]
+        assert [run[1:] for run in saved["t::b"]] == [[2.0, 1]]
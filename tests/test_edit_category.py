@@ -4,48 +4,28 @@ from pages.categories_page import CategoriesPage
 from pages.side_menu import SideMenu
 from pages.login_page import LoginPage
 from data.constants import AddCategoryPage as Constants
+from data.constants import URLs
 import logging
-from faker import Faker  # Add this import
 
+@pytest.mark.landing(URLs.CATEGORIES)
 class TestEditCategory:
     @pytest.fixture(autouse=True)
-    def setup(self, driver, config):
+    def setup(self, authenticated, driver, config, data_factory):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.faker = Faker()  # Initialize Faker
         self.driver = driver
         self.edit_page = EditCategoryPage(driver)
         self.categories_page = CategoriesPage(driver)
         self.side_menu = SideMenu(driver)
         self.login_page = LoginPage(driver)
         
-        # Login and create test category
-        self.driver.get(f"{config.base_url}/login")
-        self.login_page.login(config.username, config.password)
-        
-        # Create test category for editing
-        self.test_category = {
-            "name": f"Test Category {self.faker.company()}",
-            "description": self.faker.paragraph(),
-            "sort_order": self.faker.random_int(min=1, max=999),
-            "active": True
-        }
-        
-        # Navigate and create category
-        self.side_menu.navigate_to_system_settings_item('categories')
-        self.categories_page.click_new_category()
-        self.edit_page.upload_photo()
-        self.edit_page.fill_category_form(**self.test_category)
-        self.edit_page.save_category()
-        
-        yield
-        
-        # Cleanup: Could add cleanup code here if needed
+        # Create test category for editing over HTTP, only the edit is driven through the UI
+        self.test_category = data_factory.category()
 
     def test_edit_category_successful(self):
         """Test editing an existing category"""
         try:
-            # Search and edit created category
-            self.categories_page.search_category(self.test_category["name"])
+            # Find and edit created category
+            self.categories_page.load_filtered(name=self.test_category["name"])
             self.categories_page.edit_category(self.test_category["name"])
             
             # Wait for page load before verification
@@ -69,7 +49,7 @@ class TestEditCategory:
             assert self.edit_page.save_category(), "Save failed"
             
             # Verify updates in table
-            self.categories_page.search_category(updated_data["name"])
+            self.categories_page.load_filtered(name=updated_data["name"])
             categories = self.categories_page.get_all_categories()
             assert len(categories) > 0, "Updated category not found"
             
@@ -88,7 +68,7 @@ class TestEditCategory:
         """Test validation when editing category"""
         try:
             # Navigate to edit page
-            self.categories_page.search_category(self.test_category["name"])
+            self.categories_page.load_filtered(name=self.test_category["name"])
             self.categories_page.edit_category(self.test_category["name"])
             
             # Clear fields and try to save
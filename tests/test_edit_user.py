@@ -5,45 +5,29 @@ from pages.edit_user_page import EditUserPage
 from pages.add_user_page import AddUserPage
 from pages.login_page import LoginPage
 from pages.side_menu import SideMenu
-from data.constants import LoginPage as LoginConstants
-from data.constants import UsersPage as UserConstants
 from data.constants import EditUserPage as Constants
+from data.constants import URLs
 from datetime import datetime
 
+@pytest.mark.landing(URLs.USERS)
 class TestEditUser:
     @pytest.fixture(autouse=True)
-    def setup(self, driver, config):
+    def setup(self, authenticated, driver, config, router):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.users_page = UsersPage(driver)
         self.edit_user_page = EditUserPage(driver)
         self.add_user_page = AddUserPage(driver)
         self.login_page = LoginPage(driver)
         self.side_menu = SideMenu(driver)
+        self.router = router
         self.driver = driver
         self.config = config
-        
-        # Login first using LoginConstants
-        self.driver.get(self.config.base_url + LoginConstants.URLS['LOGIN'])
-        self.login_page.login(self.config.username, self.config.password)
-        self.users_page.navigate_to_users()
 
     @pytest.fixture
-    def test_user(self):
-        """Create a test user for editing"""
-        # Navigate to add user page
-        self.users_page.click(self.users_page.NEW_USER_BUTTON)
-        
-        # Create test user with known data
-        test_data = {
-            'first_name': self.add_user_page.faker.first_name(),
-            'last_name': self.add_user_page.faker.last_name(),
-            'email': self.add_user_page.faker.email(),
-            'role': Constants.ROLES['ADMIN'],  # Use Constants instead of ValidationData
-            'is_active': True
-        }
-        
-        self.add_user_page.create_user(test_data)
-        self.users_page.navigate_to_users()
+    def test_user(self, data_factory):
+        """Create a test user for editing over HTTP"""
+        test_data = data_factory.user(role=Constants.ROLES['ADMIN'])
+        self.router.open(URLs.USERS)
         
         # Verify user was created
         assert self.users_page.is_user_present(test_data['email']), \
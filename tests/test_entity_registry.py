@@ -0,0 +1,59 @@
+import json
+import pytest
+from utils.entity_registry import EntityRegistry
+
+class TestEntityRegistry:
+    @pytest.fixture(autouse=True)
+    def setup(self, standin_app, standin_factory):
+        self.app = standin_app
+        self.factory = standin_factory
+        self.registry = standin_factory.registry
+
+    def test_drain_empties_registry(self):
+        """drain hands over what was recorded and starts over"""
+        self.registry.add('categories', entity_id=1)
+        self.registry.add('users', name="someone@example.com")
+        entities = self.registry.drain()
+        assert [(entity['kind'], entity['id'], entity['name']) for entity in entities] == [
+            ('categories', 1, None), ('users', None, "someone@example.com")
+        ]
+        assert len(self.registry) == 0
+
+    def test_cleanup_deletes_created_records(self):
+        """Records known by id or only by name are deleted"""
+        by_id = self.factory.category()
+        by_name = self.factory.category()
+        self.registry.drain()
+        self.registry.add('categories', entity_id=by_id['id'])
+        self.registry.add('categories', name=by_name['name'])
+
+        result = self.registry.cleanup(self.factory)
+        assert len(result['deleted']) == 2 and not result['gone'] and not result['left']
+        assert self.app.data.find(self.app.data.categories, by_id['id']) is None
+        assert self.app.data.find(self.app.data.categories, by_name['id']) is None
+
+    def test_cleanup_counts_missing_records_as_gone(self):
+        """A 404 on delete or a name the list doesn't have means the test already deleted it"""
+        self.registry.add('categories', entity_id=999999)
+        self.registry.add('categories', name="QA never created")
+
+        result = self.registry.cleanup(self.factory)
+        assert len(result['gone']) == 2 and not result['deleted'] and not result['left']
+
+    def test_cleanup_leaves_records_in_use(self, tmp_path):
+        """A category the app refuses to delete goes to a manifest that the next session claims"""
+        in_use = next(category for category in self.app.data.categories if category['in_use'])
+        self.registry.add('categories', name=in_use['name'])
+
+        result = self.registry.cleanup(self.factory)
+        assert [str(entity['id']) for entity in result['left']] == [str(in_use['id'])]
+
+        manifests = list(tmp_path.glob(f"leftovers_{self.registry.worker_id}_*.json"))
+        assert len(manifests) == 1
+        assert json.loads(manifests[0].read_text())[0]['name'] == in_use['name']
+
+        next_session = EntityRegistry(manifest_dir=str(tmp_path), worker_id="next")
+        assert next_session.claim_leftovers() == 1
+        assert next_session.drain()[0]['name'] == in_use['name']
+        assert not list(tmp_path.glob("leftovers_*")), "Claimed manifest not removed"
+        assert EntityRegistry(manifest_dir=str(tmp_path)).claim_leftovers() == 0
@@ -0,0 +1,43 @@
+import pytest
+from utils.http_client import AdminHttpClient
+from data.constants import CategoryPage as CategoryConstants
+
+class TestAdminHttpClient:
+    @pytest.fixture(autouse=True)
+    def setup(self, standin_app):
+        self.app = standin_app
+        self.client = AdminHttpClient(standin_app.base_url, pool_size=2)
+        yield
+        self.client.close()
+
+    def test_login_takes_csrf_token(self):
+        """Logging in keeps the session cookie and the CSRF token of the session"""
+        assert not self.client.is_authenticated(), "Fresh client should not be logged in"
+        assert self.client.login(self.app.data.email, self.app.data.password), "Login failed"
+        assert self.client.is_authenticated(), "Session not kept after login"
+
+        tokens = [session['csrf'] for session in self.app.data.sessions.values()]
+        assert self.client.csrf_token in tokens, "CSRF token of the logged in session not picked up"
+
+    def test_login_rejected(self):
+        """Wrong password leaves the client logged out"""
+        assert not self.client.login(self.app.data.email, "wrong-password")
+        assert not self.client.is_authenticated()
+
+    def test_delete_needs_csrf_token(self):
+        """The app refuses a DELETE whose CSRF token doesn't match the session"""
+        assert self.client.login(self.app.data.email, self.app.data.password)
+        record_id = self.app.data.categories[0]['id']
+
+        self.client.csrf_token = "forged"
+        response = self.client.delete(f"/admin/categories/{record_id}")
+        assert response.status_code == 422, f"Forged token accepted: HTTP {response.status_code}"
+        assert self.app.data.find(self.app.data.categories, record_id) is not None
+
+    def test_get_table_follows_pages(self):
+        """iter_tables reads every page of a list through the Next links"""
+        assert self.client.login(self.app.data.email, self.app.data.password)
+        names = []
+        for snapshot in self.client.iter_tables(CategoryConstants.URLS["LIST"]):
+            names += snapshot.text(CategoryConstants.TableColumns.NAME)
+        assert names == [row['name'] for row in self.app.data.list_categories({})]
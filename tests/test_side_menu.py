@@ -3,26 +3,20 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from pages.side_menu import SideMenu
 from pages.login_page import LoginPage
-from data.constants import LoginPage as LoginConstants  # Update this import
 from data.constants import SideMenu as Constants  # Update this import
 
 class TestSideMenu:
     @pytest.fixture(autouse=True)
-    def setup(self, driver, config):
+    def setup(self, authenticated, driver, config):
         self.side_menu = SideMenu(driver)
         self.login_page = LoginPage(driver)
         self.driver = driver
         self.config = config
-        
-        # Login first - Update to use LoginConstants
-        login_url = self.config.base_url + LoginConstants.URLS['LOGIN']
-        self.driver.get(login_url)
-        self.login_page.login(self.config.username, self.config.password)
 
     def test_sidebar_basic_elements(self):
         """Test that basic sidebar elements are present"""
         # Wait for page load
-        self.driver.implicitly_wait(2)
+        self.side_menu.wait_for_settled()
         # Test main menu visibility using constants
         menu_items = {
             Constants.ITEMS['DASHBOARD']: self.side_menu.DASHBOARD_LINK,
@@ -145,7 +139,7 @@ class TestSideMenu:
         # First ensure submenu is collapsed
         self.side_menu.click(self.side_menu.SYSTEM_SETTINGS_BUTTON)
         # Wait for animation
-        self.driver.implicitly_wait(1)
+        self.side_menu.wait_for_settled()
         # Verify expansion
         submenu = self.side_menu.find_element(self.side_menu.SYSTEM_SETTINGS_SECTION)
         assert self.side_menu.wait.until(
@@ -0,0 +1,73 @@
+import subprocess
+import pytest
+from utils.test_impact import DependencyMap
+
+LIST_PAGE = '''class ListPage:
+    TITLE = "Items"
+    SEARCH_INPUT = ("id", "search")
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def search(self, text):
+        return self.SEARCH_INPUT, text
+
+    def title(self):
+        return self.TITLE
+'''
+
+TEST_LIST = '''from pages.list_page import ListPage
+
+class TestList:
+    def setup_method(self):
+        self.list_page = ListPage(None)
+
+    def test_search(self):
+        assert self.list_page.search("x")
+
+    def test_title(self):
+        assert self.list_page.title()
+'''
+
+class TestDependencyMap:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.root = tmp_path
+        self.write("pages/__init__.py", "")
+        self.write("pages/list_page.py", LIST_PAGE)
+        self.write("data/__init__.py", "")
+        self.write("tests/conftest.py", "")
+        self.write("tests/test_list.py", TEST_LIST)
+        self.write("utils/helpers.py", "TIMEOUT = 10\n")
+        self.git("init", "-q")
+        self.git("add", ".")
+        self.git("-c", "user.name=qa", "-c", "user.email=qa@example.com", "commit", "-qm", "base")
+
+    def write(self, path, text):
+        (self.root / path).parent.mkdir(parents=True, exist_ok=True)
+        (self.root / path).write_text(text)
+
+    def git(self, *args):
+        subprocess.run(["git", *args], cwd=self.root, check=True, capture_output=True)
+
+    def affected(self, path, old, new):
+        """Tests affected once old is replaced by new in path, uncommitted changes count"""
+        source = (self.root / path).read_text()
+        self.write(path, source.replace(old, new))
+        return DependencyMap(str(self.root)).affected("HEAD")
+
+    def test_method_edit_selects_its_callers(self):
+        affected = self.affected("pages/list_page.py", "return self.TITLE", "return self.TITLE.upper()")
+        assert affected == {"tests/test_list.py::TestList::test_title": ["pages.list_page:ListPage.title"]}
+
+    def test_class_attribute_edit_selects_methods_using_it(self):
+        affected = self.affected("pages/list_page.py", '("id", "search")', '("id", "query")')
+        assert affected == {"tests/test_list.py::TestList::test_search": ["pages.list_page:ListPage.SEARCH_INPUT"]}
+
+    def test_comment_edit_selects_nothing(self):
+        assert self.affected("pages/list_page.py", "    def title", "    # Page heading\n    def title") == {}
+
+    def test_change_outside_packages_selects_everything(self):
+        affected = self.affected("utils/helpers.py", "10", "20")
+        assert sorted(affected) == ["tests/test_list.py::TestList::test_search", "tests/test_list.py::TestList::test_title"]
+        assert affected["tests/test_list.py::TestList::test_search"] == ["utils/helpers.py"]
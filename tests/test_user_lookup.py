@@ -0,0 +1,32 @@
+import pytest
+from pages.login_page import LoginPage
+from pages.router import Router
+from data.constants import LoginPage as LoginConstants
+from data.constants import UsersPage as UserConstants
+
+class TestUserLookup:
+    @pytest.fixture(autouse=True)
+    def setup(self, driver, standin_app):
+        self.app = standin_app
+        driver.get(f"{standin_app.base_url}{LoginConstants.URLS['LOGIN']}")
+        assert LoginPage(driver).login(standin_app.data.email, standin_app.data.password), "Login failed"
+        self.driver = driver
+        self.users_page = Router(driver, standin_app.base_url).open(UserConstants.URLS["LIST"])
+        # 10 users per page on the stand-in list
+        self.users = self.app.data.list_users({})
+
+    def test_lookup_starts_at_first_page(self):
+        """A lookup after one that walked to page 3 still finds users on page 1"""
+        later, first = self.users[20]['email'], self.users[0]['email']
+
+        row = self.users_page.get_user_by_email(later)
+        assert row is not None and later in row.text, f"{later} on page 3 not found"
+        assert "page=3" in self.driver.current_url
+
+        row = self.users_page.get_user_by_email(first)
+        assert row is not None and first in row.text, f"{first} on page 1 not found after leaving page 1"
+
+    def test_current_page_only(self):
+        """check_all_pages=False stays on the page the browser is on"""
+        assert self.users_page.get_user_by_email(self.users[20]['email'], check_all_pages=False) is None
+        assert self.users_page.get_user_by_email(self.users[0]['email'], check_all_pages=False) is not None
@@ -1,20 +1,19 @@
 import pytest
 import logging
-from faker import Faker
 from pages.users_page import UsersPage
 from pages.side_menu import SideMenu
 from pages.login_page import LoginPage
-from data.constants import LoginPage as LoginConstants
 from data.constants import UsersPage as Constants  
+from data.constants import URLs
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 import random
 
+@pytest.mark.landing(URLs.USERS)
 class TestUsers:
     @pytest.fixture(autouse=True)
-    def setup(self, driver, config):
+    def setup(self, authenticated, driver, config):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.faker = Faker()
         
         # Initialize pages
         self.users_page = UsersPage(driver)
@@ -23,17 +22,7 @@ class TestUsers:
         self.driver = driver
         self.config = config
         
-        # Login first
-        self.logger.info("Logging in before user tests")
-        self.driver.get(f"{config.base_url}{LoginConstants.URLS['LOGIN']}")
-        assert self.login_page.login(config.username, config.password), "Login failed"
-        self.logger.info("Successfully logged in")
-        
-        # Navigate to users page using specific method
-        self.logger.info("Navigating to Users page")
-        assert self.side_menu.navigate_to_users(), "Failed to navigate to Users page"
-        
-        # Wait for users table to load
+        # Logged in on the users page - wait for users table to load
         assert self.users_page.wait_for_users_table(), "Users table failed to load"
         self.logger.info("Users page loaded successfully")
 
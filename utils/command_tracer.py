@@ -0,0 +1,97 @@
+from collections import defaultdict
+from time import perf_counter
+from utils.wait_stats import page_caller
+
+class CommandTracer:
+    """Records every WebDriver command sent by a driver and sums them up per test
+
+    attach() wraps the driver's execute() so each command is timed together with its
+    locator, outcome and the page-object method that issued it. Commands are sorted
+    into waits (anything issued from a WebDriverWait or a page's wait_* method),
+    scripts and actions. summary() turns the records into the per-test aggregates.
+    """
+
+    SCRIPT_COMMANDS = ("w3cExecuteScript", "w3cExecuteScriptAsync", "executeScript", "executeAsyncScript")
+    SLOWEST = 10
+
+    def __init__(self):
+        self.records = []
+        self._driver = None
+
+    def attach(self, driver):
+        """Start tracing the driver's commands"""
+        if self._driver is not None:
+            self.detach()
+        execute = driver.execute
+
+        def traced_execute(command, params=None):
+            caller, waiting = page_caller(waiting=True)
+            started = perf_counter()
+            result = "ok"
+            try:
+                return execute(command, params)
+            except Exception as e:
+                result = type(e).__name__
+                raise
+            finally:
+                self.records.append((command, self._locator(params), perf_counter() - started,
+                                     result, caller, self._kind(command, waiting)))
+
+        driver.execute = traced_execute
+        self._driver = driver
+        return self
+
+    def detach(self):
+        """Stop tracing and give the driver its own execute() back"""
+        if self._driver is not None:
+            # Drop the instance attribute so the class method shows through again
+            self._driver.__dict__.pop('execute', None)
+            self._driver = None
+        return self
+
+    @staticmethod
+    def _locator(params):
+        if params and 'using' in params:
+            return f"{params['using']}={params.get('value')}"
+        return None
+
+    def _kind(self, command, waiting):
+        if waiting:
+            return 'wait'
+        if command in self.SCRIPT_COMMANDS:
+            return 'script'
+        return 'action'
+
+    def summary(self):
+        """Command counts and times of everything recorded, by kind, command and caller"""
+        kinds = {kind: {'count': 0, 'time': 0.0} for kind in ('wait', 'action', 'script')}
+        commands = defaultdict(lambda: {'count': 0, 'time': 0.0})
+        callers = defaultdict(lambda: {'count': 0, 'time': 0.0})
+        errors = 0
+        for command, locator, duration, result, caller, kind in self.records:
+            for bucket in (kinds[kind], commands[command], callers[caller or '(test)']):
+                bucket['count'] += 1
+                bucket['time'] += duration
+            errors += result != "ok"
+
+        slowest = sorted(self.records, key=lambda record: record[2], reverse=True)[:self.SLOWEST]
+        by_time = lambda item: item[1]['time']
+        return {
+            'count': len(self.records),
+            'time': sum(bucket['time'] for bucket in kinds.values()),
+            'errors': errors,
+            'kinds': kinds,
+            'commands': dict(sorted(commands.items(), key=by_time, reverse=True)),
+            'callers': dict(sorted(callers.items(), key=by_time, reverse=True)),
+            'slowest': [
+                {'command': command, 'locator': locator, 'time': duration, 'result': result, 'caller': caller}
+                for command, locator, duration, result, caller, kind in slowest
+            ]
+        }
+
+    def stop(self):
+        """Detach from the driver and return the summary of its commands"""
+        self.detach()
+        summary = self.summary()
+        self.records = []
+        return summary
@@ -0,0 +1,162 @@
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from data.constants import CategoryPage as CategoryConstants
+from data.constants import UsersPage as UserConstants
+from data.constants import AddUserPage as AddUserConstants
+from data.constants import AddCategoryPage as AddCategoryConstants
+from utils.http_client import AdminHttpClient
+from utils.entity_registry import entity_registry
+from utils.data_pool import data_pool
+
+class DataFactory:
+    """Creates categories and users over HTTP so UI tests only drive the screens they test
+
+    Records are created by posting the same forms the browser submits, including the
+    form's hidden fields and CSRF token, through an AdminHttpClient logged in as the
+    test user. Each created record is returned as a dict of its field values plus its
+    id, in the shape the UI tests already use for their test data. Values not given
+    come from data_pool, and are drawn again in the rare case the app reports one of
+    them as taken by data from outside the run. Every record created is added to entity_registry
+    (or the registry given) so the session deletes it again.
+    """
+
+    # How to find a record's row: list path, search param, key column, action column
+    LISTS = {
+        'categories': (CategoryConstants.URLS["LIST"], 'name', CategoryConstants.TableColumns.NAME,
+                       CategoryConstants.TableColumns.ACTION),
+        'users': (UserConstants.URLS["LIST"], 'email', UserConstants.TableColumns.EMAIL,
+                  UserConstants.TableColumns.ACTION),
+    }
+
+    # Form parameter of each record field
+    CATEGORY_FIELDS = {
+        'name': 'category[name]',
+        'description': 'category[description]',
+        'sort_order': 'category[sort_order]',
+        'active': 'category[active]',
+        'photo': 'category[photo]',
+    }
+    USER_FIELDS = {
+        'first_name': 'user[first_name]',
+        'middle_name': 'user[middle_name]',
+        'last_name': 'user[last_name]',
+        'email': 'user[email]',
+        'role': 'user[role]',
+    }
+
+    # Errors worth another try with freshly generated values, unless the caller chose them
+    TAKEN_ERRORS = (
+        AddCategoryConstants.VALIDATION['NAME_TAKEN'],
+        AddCategoryConstants.VALIDATION['SORT_ORDER_TAKEN'],
+        AddUserConstants.VALIDATION['EMAIL_TAKEN'],
+    )
+    UNIQUE_FIELDS = {'name', 'sort_order', 'email'}
+    ATTEMPTS = 3
+
+    def __init__(self, client, pool=None, workers=4, registry=None):
+        self.logger = logging.getLogger(__name__)
+        self.client = client
+        self.pool = pool or data_pool
+        self.registry = registry if registry is not None else entity_registry
+        self.workers = workers
+
+    @classmethod
+    def connect(cls, base_url, email, password, session_cache=None, **kwargs):
+        """Factory with its own HTTP session, reusing the cached test login when there is one"""
+        client = AdminHttpClient(base_url, pool_size=kwargs.get('workers', 4))
+        if not (session_cache and client.use_session_cache(session_cache)) and not client.login(email, password):
+            client.close()
+            raise RuntimeError(f"Data factory could not log in to {base_url}")
+        return cls(client, **kwargs)
+
+    def close(self):
+        self.client.close()
+
+    # --- categories -----------------------------------------------------------
+
+    def category_values(self):
+        """Generated values for a new category, the name marks it for cleanup_test_categories"""
+        return self.pool.category()
+
+    def category(self, **values):
+        """Create a category, returns its values and id"""
+        def form_data(record, page):
+            record.setdefault('photo', page.gallery[0] if page.gallery else '')
+            data = {self.CATEGORY_FIELDS[key]: str(value) for key, value in record.items() if key != 'active'}
+            data[self.CATEGORY_FIELDS['active']] = '1' if record['active'] else '0'
+            return data
+
+        record = self._create(CategoryConstants.URLS["NEW"], self.category_values, values, form_data)
+        record['id'] = self.find_id('categories', record['name'])
+        self.registry.add('categories', record['id'], record['name'])
+        self.logger.info(f"Created category {record['name']} ({record['id']})")
+        return record
+
+    def categories(self, count, **values):
+        """Create count categories in parallel"""
+        return self._batch(self.category, count, values)
+
+    # --- users ----------------------------------------------------------------
+
+    def user_values(self):
+        """Generated values for a new user"""
+        return self.pool.user()
+
+    def user(self, **values):
+        """Create a user, returns its values and id; role takes the option text shown in the form"""
+        def form_data(record, page):
+            data = {self.USER_FIELDS[key]: str(value) for key, value in record.items() if key in self.USER_FIELDS}
+            options = next((form['options'] for form in page.forms.values() if form['method'] == 'post'), {})
+            roles = options.get(self.USER_FIELDS['role'], {})
+            data[self.USER_FIELDS['role']] = roles.get(record['role'], record['role'])
+            return data
+
+        record = self._create(UserConstants.URLS["NEW"], self.user_values, values, form_data)
+        record['id'] = self.find_id('users', record['email'])
+        self.registry.add('users', record['id'], record['email'])
+        self.logger.info(f"Created user {record['email']} ({record['id']})")
+        return record
+
+    def users(self, count, **values):
+        """Create count users in parallel"""
+        return self._batch(self.user, count, values)
+
+    # --- plumbing -------------------------------------------------------------
+
+    def _create(self, form_path, defaults, values, form_data):
+        """Post the form on form_path, generating fresh defaults when a generated value was taken"""
+        errors = []
+        for _ in range(self.ATTEMPTS):
+            record = dict(defaults(), **values)
+            page = self.client.form_page(form_path)
+            response, result = self.client.submit(page, form_data(record, page))
+            if response.is_redirect:
+                return record
+            errors = result.errors or [f"HTTP {response.status_code}"]
+            if self.UNIQUE_FIELDS & set(values) or not set(errors) & set(self.TAKEN_ERRORS):
+                break
+            self.logger.info(f"Generated values taken, retrying: {errors}")
+        raise ValueError(f"Could not create record from {form_path}: {', '.join(errors)}")
+
+    def find_id(self, kind, key):
+        """Id of the categories or users record with that name or email, None when it doesn't exist
+
+        Read from the row's data-item-id, or else from its Edit link.
+        """
+        list_path, param, key_column, action_column = self.LISTS[kind]
+        snapshot, _ = self.client.get_table(list_path, {param: key})
+        position = snapshot.index(key_column).get(key)
+        if position is None:
+            self.logger.debug(f"{key} not found in {list_path}")
+            return None
+        item_id = snapshot.row_data[position].get('itemId')
+        if item_id:
+            return item_id
+        links = snapshot.actions(action_column)[position]
+        match = re.search(r'/(\d+)(?:/edit)?$', links.get('Edit') or links.get('View') or '')
+        return match.group(1) if match else None
+
+    def _batch(self, create, count, values):
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, count))) as executor:
+            return list(executor.map(lambda _: create(**values), range(count)))
@@ -0,0 +1,123 @@
+import logging
+import random
+import re
+import threading
+from collections import deque
+from faker import Faker
+from data.constants import AddUserPage as AddUserConstants
+
+class DataPool:
+    """Unique test values, generated in batches by one seeded Faker and handed out in O(1)
+
+    Every process of a run gets the same seed and its own worker index. Sort orders
+    are interleaved by worker (worker k only hands out values k, k + workers, ...)
+    from a seeded start in a range far above hand-made data. Names and emails end in
+    the run's tag, the worker and a counter. Values therefore never collide within a
+    run, across workers, or with other runs. The seed is logged, and setting it again
+    (DATA_SEED) reproduces a run's data.
+    """
+
+    BATCH = 100
+    SORT_ORDER_RANGE = (1_000_000, 2_000_000_000)
+    # Sort orders each worker can hand out before the sequence would wrap
+    SORT_ORDER_CAPACITY = 1_000_000
+
+    def __init__(self, seed=None, worker_index=0, workers=1, batch=BATCH):
+        self.logger = logging.getLogger(__name__)
+        self.batch = batch
+        self._lock = threading.Lock()
+        self.configure(seed, worker_index, workers)
+
+    def configure(self, seed=None, worker_index=0, workers=1):
+        """Start over with a seed (random when None) and this process's share of the values"""
+        with self._lock:
+            self.seed = random.SystemRandom().randrange(2 ** 32) if seed is None else int(seed)
+            self.worker_index = int(worker_index)
+            self.workers = max(1, int(workers))
+            rng = random.Random(self.seed)
+            self.tag = f"{rng.randrange(16 ** 4):04x}"
+            slots = (self.SORT_ORDER_RANGE[1] - self.SORT_ORDER_RANGE[0]) // self.workers
+            self._sort_start = rng.randrange(slots - self.SORT_ORDER_CAPACITY)
+            self._count = 0
+            self._faker = None
+            self._categories = deque()
+            self._users = deque()
+        return self
+
+    @property
+    def faker(self):
+        """The pool's Faker, created on first use and seeded per worker"""
+        if self._faker is None:
+            self._faker = Faker()
+            self._faker.seed_instance(self.seed + self.worker_index)
+        return self._faker
+
+    def _next(self):
+        with self._lock:
+            self._count += 1
+            return self._count
+
+    def suffix(self):
+        """Unique '<tag><worker>-<n>' marker for names and emails"""
+        return f"{self.tag}{self.worker_index}-{self._next()}"
+
+    def sort_order(self):
+        """Unique sort order"""
+        position = self._sort_start + self._next() % self.SORT_ORDER_CAPACITY
+        return self.SORT_ORDER_RANGE[0] + position * self.workers + self.worker_index
+
+    def category_name(self, prefix="Test Category"):
+        """Unique category name, 'Test Category' marks it as test data for cleanup_test_categories"""
+        return f"{prefix} {self._take(self._categories, self._category_batch)['company']} {self.suffix()}"
+
+    def category(self, **values):
+        """Category form values (name, description, sort_order, active), values given win"""
+        generated = self._take(self._categories, self._category_batch)
+        record = {
+            'name': f"Test Category {generated['company']} {self.suffix()}",
+            'description': generated['description'],
+            'sort_order': self.sort_order(),
+            'active': True,
+        }
+        record.update(values)
+        return record
+
+    def user(self, **values):
+        """User form values (first_name, last_name, email, role), values given win"""
+        generated = self._take(self._users, self._user_batch)
+        local_part = re.sub(r'[^a-z0-9.]', '', f"{generated['first_name']}.{generated['last_name']}".lower())
+        record = {
+            'first_name': generated['first_name'],
+            'last_name': generated['last_name'],
+            'email': f"{local_part}.{self.suffix()}@example.com",
+            'role': AddUserConstants.ROLES['ADMIN'],
+        }
+        record.update(values)
+        return record
+
+    def word(self):
+        """A plain word, e.g. for invalid numeric input"""
+        return self._take(self._categories, self._category_batch)['word']
+
+    def _take(self, queue, generate):
+        while True:
+            try:
+                return queue.popleft()
+            except IndexError:
+                with self._lock:
+                    if not queue:
+                        queue.extend(generate())
+
+    def _category_batch(self):
+        faker = self.faker
+        return [
+            {'company': faker.company(), 'description': faker.paragraph(), 'word': faker.word()}
+            for _ in range(self.batch)
+        ]
+
+    def _user_batch(self):
+        faker = self.faker
+        return [{'first_name': faker.first_name(), 'last_name': faker.last_name()} for _ in range(self.batch)]
+
+# Shared by the page objects, the data factory and the tests of this process
+data_pool = DataPool()
@@ -0,0 +1,125 @@
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows, locked through msvcrt instead
+    fcntl = None
+    import msvcrt
+
+class DriverCache:
+    """Resolved chromedriver binaries on disk, keyed by the installed Chrome's major version
+
+    webdriver-manager probes versions and may go to the network on every call, and its
+    result was only kept per process. The index here is shared by every process using
+    the directory and guarded by a file lock, so parallel workers resolve a driver once
+    and the rest reuse it. When resolving fails (offline, rate limited) the last binary
+    that worked is used instead.
+    """
+
+    def __init__(self, cache_dir=".cache/drivers"):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, "drivers.json")
+        self.lock_path = os.path.join(cache_dir, "drivers.lock")
+
+    @contextmanager
+    def _locked(self):
+        """Hold the cache's file lock, blocking until other processes release it"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.lock_path, 'a+') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            else:
+                lock.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue  # LK_LOCK gives up after 10 seconds, keep waiting
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+                else:
+                    lock.seek(0)
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'drivers': {}, 'last_good': None}
+
+    def _save(self, index):
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    @staticmethod
+    def browser_version():
+        """Major version of the installed Chrome, read locally without the network, None when unknown"""
+        try:
+            from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+            version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+            return version.split('.')[0] if version else None
+        except Exception:
+            return None
+
+    def resolve(self, install):
+        """Path of a chromedriver matching the installed Chrome
+
+        install() is only called on a cache miss, under the lock, and must return the
+        path of a freshly installed driver. Returns None when nothing could be resolved.
+        """
+        version = self.browser_version()
+        with self._locked():
+            index = self._load()
+            if version:
+                path = index['drivers'].get(version, {}).get('path')
+            else:
+                path = index.get('last_good')  # Can't tell which driver fits, trust the last one that worked
+            if path and os.path.exists(path):
+                return path
+
+            try:
+                path = install()
+            except Exception as e:
+                return self._fallback(index, version, e)
+
+            index['drivers'][version or "unknown"] = {'path': path, 'resolved_at': time.time()}
+            index['last_good'] = path
+            self._save(index)
+            self.logger.info(f"Resolved chromedriver for Chrome {version or '(unknown version)'}: {path}")
+            return path
+
+    def _fallback(self, index, version, error):
+        path = index.get('last_good')
+        if path and os.path.exists(path):
+            self.logger.warning(
+                f"Could not resolve chromedriver for Chrome {version}, using last known good {path}: {str(error)}"
+            )
+            return path
+        self.logger.error(f"Could not resolve chromedriver and none is cached: {str(error)}")
+        return None
+
+    def mark_bad(self, path):
+        """Forget a cached driver that failed to start the browser"""
+        with self._locked():
+            index = self._load()
+            index['drivers'] = {version: entry for version, entry in index['drivers'].items() if entry['path'] != path}
+            if index.get('last_good') == path:
+                index['last_good'] = None
+            self._save(index)
+
+    def clear(self):
+        """Forget every resolved driver, the next resolve() installs again"""
+        with self._locked():
+            self._save({'drivers': {}, 'last_good': None})
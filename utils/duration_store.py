@@ -0,0 +1,132 @@
+import heapq
+import json
+import logging
+import os
+import statistics
+import time
+
+class DurationStore:
+    """How long each test took in past runs, kept in one small JSON file
+
+    Every test keeps its last `history` runs as [finished_at, seconds, passed], where
+    seconds covers setup, call and teardown. The controller records each finished test
+    and saves once at the end of the session; saving merges with the file on disk so
+    runs of different test subsets add up. The estimates order the next run longest
+    first. Parallel workers then finish at about the same time; the balance comes from
+    that order alone, tests are not assigned to workers.
+    """
+
+    HISTORY = 10
+
+    def __init__(self, path=".cache/durations.json", history=HISTORY):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.history = history
+        self.tests = self._load()
+        self._recorded = {}
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('tests', {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def record(self, nodeid, seconds, passed):
+        """Add a finished test to this run's results, kept in memory until save()"""
+        self._recorded[nodeid] = [int(time.time()), round(seconds, 3), int(bool(passed))]
+
+    def save(self):
+        """Append this run's results to the file, keeping the last `history` runs per test"""
+        if not self._recorded:
+            return None
+        tests = self._load()
+        for nodeid, run in self._recorded.items():
+            tests[nodeid] = (tests.get(nodeid, []) + [run])[-self.history:]
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'tests': tests}, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self.tests = tests
+        self._recorded = {}
+        return self.path
+
+    def estimate(self, nodeid):
+        """Expected seconds for a test, the median of its passing runs (all runs if none passed), None when unknown"""
+        runs = self.tests.get(nodeid)
+        if not runs:
+            return None
+        passed = [seconds for _, seconds, ok in runs if ok]
+        return statistics.median(passed or [seconds for _, seconds, _ in runs])
+
+    def estimates(self, nodeids):
+        """Expected seconds per test, tests never seen get the median of the known ones"""
+        known = {nodeid: self.estimate(nodeid) for nodeid in nodeids}
+        seen = [seconds for seconds in known.values() if seconds is not None]
+        default = statistics.median(seen) if seen else 0.0
+        return {nodeid: default if seconds is None else seconds for nodeid, seconds in known.items()}
+
+    def order(self, items, key=lambda item: item.nodeid):
+        """Items sorted longest first; the sort is stable, so ties keep the collected order"""
+        estimates = self.estimates([key(item) for item in items])
+        return sorted(items, key=lambda item: -estimates[key(item)])
+
+    def partition(self, nodeids, workers):
+        """Tests per worker when each next-longest test goes to the least loaded worker
+
+        Only an estimate for the log: nothing hands this assignment to pytest-xdist. Its
+        load scheduler, fed a longest-first order, ends up close to it, so the loads are
+        roughly the expected busy time of each worker. Returns (assignments, loads).
+        """
+        estimates = self.estimates(nodeids)
+        workers = max(1, workers)
+        assignments = [[] for _ in range(workers)]
+        loads = [0.0] * workers
+        heap = [(0.0, index) for index in range(workers)]
+        for nodeid in sorted(nodeids, key=lambda nodeid: -estimates[nodeid]):
+            load, index = heapq.heappop(heap)
+            assignments[index].append(nodeid)
+            loads[index] = load + estimates[nodeid]
+            heapq.heappush(heap, (loads[index], index))
+        return assignments, loads
+
+    def trends(self, limit=None):
+        """Per test: runs, last and median seconds, change of the last run against the median before it, failures
+
+        Sorted by the largest slowdown first.
+        """
+        rows = []
+        for nodeid, runs in self.tests.items():
+            durations = [seconds for _, seconds, _ in runs]
+            before = statistics.median(durations[:-1]) if len(durations) > 1 else None
+            rows.append({
+                'nodeid': nodeid,
+                'runs': len(runs),
+                'last': durations[-1],
+                'median': statistics.median(durations),
+                'change': (durations[-1] - before) / before if before else None,
+                'failures': sum(1 for _, _, ok in runs if not ok),
+            })
+        rows.sort(key=lambda row: (row['change'] is not None, row['change'] or 0, row['last']), reverse=True)
+        return rows[:limit] if limit else rows
+
+    def table(self, limit=20):
+        """Duration trends as text lines for the terminal summary"""
+        lines = [f"{'last':>7} {'median':>7} {'change':>7} {'runs':>4} {'fail':>4}  test"]
+        for row in self.trends(limit):
+            change = f"{row['change']:>+6.0%}" if row['change'] is not None else f"{'new':>6}"
+            lines.append(
+                f"{row['last']:>6.2f}s {row['median']:>6.2f}s {change:>7} {row['runs']:>4} {row['failures']:>4}  {row['nodeid']}"
+            )
+        return lines
+
+    def write(self, path):
+        """Save the full trends as JSON"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.trends(), f, indent=2)
+        return path
+
+    def __len__(self):
+        return len(self.tests)
@@ -0,0 +1,124 @@
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class EntityRegistry:
+    """Records every categories/users record the tests create so the session deletes exactly those
+
+    Page objects add what they save through the add forms and DataFactory adds what it
+    posts. Records created through the UI are known by name (email for users) only,
+    their id is looked up when they are deleted. cleanup() deletes everything in
+    concurrent requests. Whatever is left (in use, failed, app down) goes to a manifest
+    that the next session claims and tries again.
+    """
+
+    def __init__(self, manifest_dir=".cache/entities", worker_id="main"):
+        self.logger = logging.getLogger(__name__)
+        self.manifest_dir = manifest_dir
+        self.worker_id = worker_id
+        self.entities = []
+        self._lock = threading.Lock()
+
+    def add(self, kind, entity_id=None, name=None):
+        """Record a created 'categories' or 'users' record by id, name or both"""
+        with self._lock:
+            self.entities.append({
+                'kind': kind,
+                'id': entity_id,
+                'name': name,
+                'worker': self.worker_id,
+                'created_at': time.time()
+            })
+
+    def drain(self):
+        """Entities recorded so far, the registry starts over empty"""
+        with self._lock:
+            entities, self.entities = self.entities, []
+        return entities
+
+    def __len__(self):
+        return len(self.entities)
+
+    def claim_leftovers(self):
+        """Take over the manifests earlier sessions left, from any worker
+
+        Each manifest is renamed before it is read, so with several workers starting at
+        once every manifest is claimed by exactly one of them.
+        """
+        claimed = 0
+        for path in glob.glob(os.path.join(self.manifest_dir, "leftovers_*.json")):
+            claim_path = f"{path}.{self.worker_id}.{os.getpid()}"
+            try:
+                os.replace(path, claim_path)
+            except OSError:
+                continue  # Another worker got there first
+            try:
+                with open(claim_path, 'r', encoding='utf-8') as f:
+                    entities = json.load(f)
+                with self._lock:
+                    self.entities.extend(entities)
+                claimed += len(entities)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Unreadable leftover manifest {path}: {str(e)}")
+            finally:
+                os.remove(claim_path)
+        if claimed:
+            self.logger.info(f"Claimed {claimed} records left by earlier runs")
+        return claimed
+
+    def write_leftovers(self, entities):
+        """Save entities for the next session to delete, returns the manifest path"""
+        os.makedirs(self.manifest_dir, exist_ok=True)
+        path = os.path.join(self.manifest_dir, f"leftovers_{self.worker_id}_{os.getpid()}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entities, f, indent=2)
+        os.replace(tmp_path, path)
+        return path
+
+    def cleanup(self, factory):
+        """Delete every recorded entity through the factory's HTTP session, factory.workers at a time
+
+        Returns {'deleted': [...], 'gone': [...], 'left': [...]}. Records already deleted
+        by their test count as gone; the ones left are written to a manifest.
+        """
+        entities = self.drain()
+        result = {'deleted': [], 'gone': [], 'left': []}
+        if not entities:
+            return result
+
+        def delete(entity):
+            try:
+                entity_id = entity['id'] or factory.find_id(entity['kind'], entity['name'])
+                if entity_id is None:
+                    return 'gone', entity
+                response = factory.client.delete(f"/admin/{entity['kind']}/{entity_id}")
+                if response.status_code == 404:
+                    return 'gone', entity
+                if response.status_code >= 400:
+                    self.logger.info(f"{entity['kind']} {entity['name'] or entity_id} not deleted: HTTP {response.status_code}")
+                    return 'left', dict(entity, id=entity_id)
+                return 'deleted', entity
+            except Exception as e:
+                self.logger.warning(f"Failed to delete {entity['kind']} {entity['name'] or entity['id']}: {str(e)}")
+                return 'left', entity
+
+        with ThreadPoolExecutor(max_workers=max(1, min(factory.workers, len(entities)))) as executor:
+            for outcome, entity in executor.map(delete, entities):
+                result[outcome].append(entity)
+
+        if result['left']:
+            path = self.write_leftovers(result['left'])
+            self.logger.warning(f"{len(result['left'])} test records left, saved for the next run: {path}")
+        self.logger.info(
+            f"Test data cleanup: {len(result['deleted'])} deleted, {len(result['gone'])} already gone, "
+            f"{len(result['left'])} left"
+        )
+        return result
+
+# Shared by the page objects and the data factory of this process
+entity_registry = EntityRegistry()
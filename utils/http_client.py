@@ -0,0 +1,202 @@
+import logging
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from data.constants import LoginPage as LoginConstants
+from utils.table_snapshot import TableSnapshot
+
+class _PageParser(HTMLParser):
+    """Pulls the CSRF token, forms, gallery photos, form errors and the pagy Next link out of an admin page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.csrf_token = None
+        self.next_href = None
+        self.forms = {}
+        self.gallery = []
+        self.errors = []
+        self._form = None
+        self._select = None
+        self._option = None
+        self._alert = False
+        self._error = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'meta' and attrs.get('name') == 'csrf-token':
+            self.csrf_token = attrs.get('content')
+        elif tag == 'form':
+            self._form = {'action': attrs.get('action') or '', 'method': (attrs.get('method') or 'get').lower(),
+                          'fields': {}, 'options': {}}
+            self.forms[attrs.get('id') or f"form_{len(self.forms)}"] = self._form
+        elif tag == 'select' and self._form is not None and attrs.get('name'):
+            self._select = self._form['options'].setdefault(attrs['name'], {})
+        elif tag == 'option' and self._select is not None:
+            self._option = {'value': attrs.get('value'), 'text': []}
+        elif tag == 'img' and 'gallery-photo' in (attrs.get('class') or '').split():
+            self.gallery.append(attrs.get('src'))
+        elif 'alert--soft-danger' in (attrs.get('class') or '').split():
+            self._alert = True
+        elif tag == 'li' and self._alert:
+            self._error = []
+        elif tag == 'input' and self._form is not None and attrs.get('name'):
+            if attrs.get('type') not in ('checkbox', 'radio', 'submit') or 'checked' in attrs:
+                self._form['fields'][attrs['name']] = attrs.get('value') or ''
+        elif tag == 'a' and attrs.get('aria-label') == 'Next' and attrs.get('aria-disabled') != 'true':
+            if attrs.get('href') and attrs['href'] != '#':
+                self.next_href = attrs['href']
+
+    def handle_endtag(self, tag):
+        if tag == 'form':
+            self._form = None
+        elif tag == 'select':
+            self._select = None
+        elif tag == 'option' and self._option is not None:
+            text = ''.join(self._option['text']).strip()
+            if self._option['value'] != '':  # Skip the "Select an Option" placeholder
+                self._select[text] = text if self._option['value'] is None else self._option['value']
+            self._option = None
+        elif tag == 'li' and self._error is not None:
+            self.errors.append(''.join(self._error).strip())
+            self._error = None
+        elif tag == 'ul':
+            self._alert = False
+
+    def handle_data(self, data):
+        if self._option is not None:
+            self._option['text'].append(data)
+        if self._error is not None:
+            self._error.append(data)
+
+class AdminHttpClient:
+    """requests session for the admin app, sharing cookies and the CSRF token with the browser session
+
+    Used for bulk reads and deletes that don't need a browser. Connections are pooled
+    so the client can be shared by worker threads.
+    """
+
+    LOGIN_FORM_ID = "new_user"
+
+    def __init__(self, base_url, pool_size=8, timeout=30):
+        self.logger = logging.getLogger(__name__)
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.csrf_token = None
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.3, allowed_methods=["GET"])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def url(self, path):
+        """Absolute URL for an app path"""
+        return urljoin(f"{self.base_url}/", path)
+
+    def use_cookies(self, cookies):
+        """Load cookies in WebDriver's get_cookies() format, e.g. from a logged-in browser"""
+        host = urlparse(self.base_url).hostname
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'], domain=host, path=cookie.get('path', '/'))
+
+    def use_session_cache(self, session_cache):
+        """Reuse the login cached by the test run, returns False if there is no valid session"""
+        snapshot = session_cache.load()
+        if not snapshot:
+            return False
+        self.use_cookies(snapshot['cookies'])
+        return self.is_authenticated()
+
+    def is_authenticated(self):
+        """Check the session by opening the dashboard"""
+        try:
+            response = self.get(LoginConstants.URLS["DASHBOARD"])
+            return LoginConstants.URLS["LOGIN"] not in response.url
+        except Exception as e:
+            self.logger.error(f"Failed to check session: {str(e)}")
+            return False
+
+    def login(self, email, password):
+        """Log in by submitting the login form with its authenticity token"""
+        try:
+            response = self.session.get(self.url(LoginConstants.URLS["LOGIN"]), timeout=self.timeout)
+            response.raise_for_status()
+            page = self._parse(response.text)
+            form = page.forms.get(self.LOGIN_FORM_ID, {'action': LoginConstants.URLS["LOGIN"], 'fields': {}})
+
+            fields = dict(form['fields'])
+            fields.update({'user[email]': email, 'user[password]': password})
+            response = self.session.post(self.url(form['action'] or LoginConstants.URLS["LOGIN"]),
+                                         data=fields, timeout=self.timeout)
+            self._parse(response.text)
+
+            if LoginConstants.URLS["LOGIN"] in response.url:
+                self.logger.error("HTTP login rejected")
+                return False
+            self.logger.info("Logged in over HTTP")
+            return True
+        except Exception as e:
+            self.logger.error(f"HTTP login failed: {str(e)}")
+            return False
+
+    def get(self, path, params=None):
+        """GET a page and remember its CSRF token"""
+        return self._get(path, params)[0]
+
+    def get_table(self, path, params=None):
+        """Read the list table of a page, returns (TableSnapshot, href of the next page or None)"""
+        response, page = self._get(path, params)
+        return TableSnapshot.from_html(response.text), page.next_href
+
+    def iter_tables(self, path, params=None):
+        """Yield the table of every page of a paginated list, following the Next links"""
+        next_href = path
+        while next_href:
+            snapshot, next_href = self.get_table(next_href, params)
+            params = None  # The Next link already carries the query string
+            yield snapshot
+
+    def form_page(self, path):
+        """Open the page of a form, returns the parsed page (forms, gallery photos, errors)"""
+        return self._get(path)[1]
+
+    def submit(self, page, fields):
+        """Post fields through the first POST form of a parsed page, with its hidden fields and CSRF token
+
+        Returns (response, parsed response page) without following the redirect, so a 3xx
+        means the app accepted the form and a 422 page carries the validation errors.
+        """
+        form = next((form for form in page.forms.values() if form['method'] == 'post'), None)
+        if form is None:
+            raise ValueError("No POST form on the page")
+        data = dict(form['fields'])
+        data.update(fields)
+        response = self.session.post(self.url(form['action']), data=data, allow_redirects=False, timeout=self.timeout)
+        return response, self._parse(response.text)
+
+    def delete(self, path):
+        """Send a DELETE for a record, returns the response without following the redirect"""
+        headers = {'Accept': 'text/vnd.turbo-stream.html, text/html'}
+        if self.csrf_token:
+            headers['X-CSRF-Token'] = self.csrf_token
+        return self.session.delete(self.url(path), headers=headers, allow_redirects=False, timeout=self.timeout)
+
+    def close(self):
+        self.session.close()
+
+    def _get(self, path, params=None):
+        response = self.session.get(self.url(path), params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response, self._parse(response.text)
+
+    def _parse(self, page_source):
+        page = _PageParser()
+        page.feed(page_source)
+        if page.csrf_token:
+            self.csrf_token = page.csrf_token
+        return page
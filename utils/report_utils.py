@@ -1,20 +1,67 @@
 import base64
+from collections import deque
 from datetime import datetime
+import html
+import json
 import logging
 from io import StringIO
 import os
+import shutil
+from string import Template
+from utils.screenshot_manager import thumbnail_path
 
 class TestCaseLogHandler(logging.Handler):
-    def __init__(self):
-        super().__init__()
-        self.log_records = []
+    """Keeps a test's log records in a bounded ring buffer and formats them only when asked
+
+    Records older than the buffer's capacity are formatted and spilled to spill_path
+    (opened on first overflow) so long data-driven tests keep a flat memory profile.
+    """
+
+    def __init__(self, capacity=1000, level=logging.INFO, spill_path=None):
+        super().__init__(level)
+        self.log_records = deque(maxlen=capacity)
+        self.spill_path = spill_path
+        self.spilled = 0
+        self.log_file = None
+        self._spill_file = None
         self.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 
     def emit(self, record):
-        self.log_records.append(self.format(record))
+        if record.exc_info and not record.exc_text:
+            # Render the traceback now so the record doesn't keep frames (and drivers) alive
+            record.exc_text = self.formatter.formatException(record.exc_info)
+            record.exc_info = None
+
+        if len(self.log_records) == self.log_records.maxlen:
+            self._spill(self.log_records[0])
+        self.log_records.append(record)
+
+    def _spill(self, record):
+        """Write the record about to be evicted from the buffer to the spill file"""
+        self.spilled += 1
+        if not self.spill_path:
+            return
+        try:
+            if self._spill_file is None:
+                os.makedirs(os.path.dirname(self.spill_path) or ".", exist_ok=True)
+                self._spill_file = open(self.spill_path, 'w', encoding='utf-8')
+                self.log_file = self.spill_path
+            self._spill_file.write(self.format(record) + '\n')
+        except Exception:
+            self.handleError(record)
 
     def get_logs(self):
-        return '\n'.join(self.log_records)
+        lines = [self.format(record) for record in self.log_records]
+        if self.spilled:
+            location = f" (see {self.log_file})" if self.log_file else ""
+            lines.insert(0, f"... {self.spilled} earlier log records omitted{location}")
+        return '\n'.join(lines)
+
+    def close(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        super().close()
 
 class ReportGenerator:
     def __init__(self):
@@ -39,7 +86,8 @@ class ReportGenerator:
             self.logger.error(f"Failed to process image: {str(e)}")
             return None
 
-    def create_test_case_html(self, name, status, duration, error=None, screenshot_path=None, logs=None):
+    def create_test_case_html(self, name, status, duration, error=None, screenshot_path=None, logs=None, log_file=None,
+                              commands=None):
         self.logger.debug(f"Processing test: {name}")
         try:
             html_parts = []
@@ -75,17 +123,45 @@ class ReportGenerator:
                 </div>
                 ''')
             
-            # Add screenshot if available
+            # Link the spill file holding records that overflowed the capture buffer
+            if log_file:
+                log_href = html.escape(log_file.replace(os.sep, '/'), quote=True)
+                html_parts.append(f'''
+                <div class="logs-section">
+                    <a href="{log_href}" target="_blank">Full test log</a>
+                </div>
+                ''')
+            
+            # WebDriver round trips by kind and the page-object methods that spent the most time
+            if commands and commands.get('count'):
+                kinds = ', '.join(
+                    f"{kind} {bucket['count']} ({bucket['time']:.2f}s)" for kind, bucket in commands['kinds'].items()
+                )
+                rows = '\n'.join(
+                    f"<tr><td>{html.escape(caller)}</td><td>{bucket['count']}</td><td>{bucket['time']:.2f}s</td></tr>"
+                    for caller, bucket in list(commands['callers'].items())[:5]
+                )
+                html_parts.append(f'''
+                <div class="logs-section">
+                    <h4>WebDriver Commands: {commands['count']} in {commands['time']:.2f}s</h4>
+                    <p>{kinds}</p>
+                    <table class="commands"><tr><th>Caller</th><th>Commands</th><th>Time</th></tr>
+                    {rows}
+                    </table>
+                </div>
+                ''')
+            
+            # Link screenshot as an external file, showing the thumbnail when one was written
             if screenshot_path:
-                base64_image = self.convert_image_to_base64(screenshot_path)
-                if base64_image:
-                    html_parts.append(f'''
-                    <div class="screenshot-section">
-                        <h4>Screenshot:</h4>
-                        <img class="screenshot" src="data:image/png;base64,{base64_image}" 
-                             alt="Test Screenshot" />
-                    </div>
-                    ''')
+                image_src = html.escape(screenshot_path.replace(os.sep, '/'), quote=True)
+                thumb_src = html.escape(thumbnail_path(screenshot_path).replace(os.sep, '/'), quote=True)
+                html_parts.append(f'''
+                <div class="screenshot-section">
+                    <h4>Screenshot:</h4>
+                    <img class="screenshot" src="{thumb_src}" data-full="{image_src}" loading="lazy"
+                         onerror="this.onerror=null; this.src=this.dataset.full;" alt="Test Screenshot" />
+                </div>
+                ''')
             
             html_parts.append("</div></div>")
             return '\n'.join(html_parts)
@@ -98,3 +174,99 @@ class ReportGenerator:
         self.logger.info("Generating test report...")
         # ...existing code...
         self.logger.info(f"Report generated: {output_path}")
+
+class StreamingReportWriter:
+    """Writes the HTML report one test case at a time instead of building it in memory
+
+    Test cases are appended to a partial file as they finish. finalize() writes the
+    template header with the summary counters, copies the partial file in chunks
+    and closes the document, so memory use doesn't grow with the number of tests.
+    Tests with WebDriver command summaries also get a line in <report>_commands.jsonl.
+    """
+
+    PLACEHOLDER = "${test_cases}"
+
+    def __init__(self, template_path, output_path, report_generator=None):
+        self.logger = logging.getLogger('report')
+        self.template_path = template_path
+        self.output_path = output_path
+        self.report_dir = os.path.dirname(output_path) or "."
+        self.body_path = f"{output_path}.part"
+        self.commands_path = f"{os.path.splitext(output_path)[0]}_commands.jsonl"
+        self.report_generator = report_generator or ReportGenerator()
+        self.counts = {'passed': 0, 'failed': 0, 'skipped': 0}
+        self.total_duration = 0.0
+        self._body = None
+        self._commands = None
+
+    def add_test_case(self, nodeid, data):
+        """Render one finished test and append it to the report body"""
+        if self._body is None:
+            os.makedirs(self.report_dir, exist_ok=True)
+            self._body = open(self.body_path, 'w', encoding='utf-8')
+
+        screenshot = data.get('screenshot')
+        log_file = data.get('log_file')
+        status = data.get('status', 'unknown')
+        duration = data.get('duration', 0)
+        self._body.write(self.report_generator.create_test_case_html(
+            name=data.get('name', nodeid),
+            status=status,
+            duration=duration,
+            error=data.get('error'),
+            screenshot_path=os.path.relpath(screenshot, self.report_dir) if screenshot else None,
+            logs=data.get('logs', ''),
+            log_file=os.path.relpath(log_file, self.report_dir) if log_file else None,
+            commands=data.get('commands')
+        ))
+        self._body.write('\n')
+        self._body.flush()
+
+        if data.get('commands'):
+            self._write_commands(nodeid, status, duration, data)
+
+        if status in self.counts:
+            self.counts[status] += 1
+        self.total_duration += duration
+
+    def _write_commands(self, nodeid, status, duration, data):
+        """Append the test's command summary as one JSON line"""
+        if self._commands is None:
+            self._commands = open(self.commands_path, 'w', encoding='utf-8')
+        self._commands.write(json.dumps({
+            'nodeid': nodeid,
+            'status': status,
+            'duration': duration,
+            'worker': data.get('worker'),
+            **data['commands']
+        }) + '\n')
+        self._commands.flush()
+
+    def finalize(self):
+        """Write the summary header, the streamed test cases and the closing markup"""
+        with open(self.template_path, 'r', encoding='utf-8') as f:
+            head, tail = f.read().split(self.PLACEHOLDER, 1)
+
+        summary = dict(self.counts)
+        summary.update({
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'duration': f"{self.total_duration:.2f}s"
+        })
+
+        if self._body is not None:
+            self._body.close()
+        if self._commands is not None:
+            self._commands.close()
+            self.logger.info(f"WebDriver command trace: {self.commands_path}")
+
+        os.makedirs(self.report_dir, exist_ok=True)
+        with open(self.output_path, 'w', encoding='utf-8') as report:
+            report.write(Template(head).safe_substitute(summary))
+            if os.path.exists(self.body_path):
+                with open(self.body_path, 'r', encoding='utf-8') as body:
+                    shutil.copyfileobj(body, report)
+                os.remove(self.body_path)
+            report.write(Template(tail).safe_substitute(summary))
+
+        self.logger.info(f"Report generated: {self.output_path}")
+        return self.output_path
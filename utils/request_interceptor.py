@@ -0,0 +1,299 @@
+import base64
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import threading
+import urllib.request
+from urllib.parse import urlsplit
+import trio
+
+class AssetCache:
+    """Static asset responses on disk, shared by every browser and worker using the directory"""
+
+    # Request headers passed on when downloading an asset, and response headers replayed to the browser
+    FORWARDED_HEADERS = ('user-agent', 'accept', 'referer')
+    KEPT_HEADERS = ('content-type', 'cache-control', 'last-modified', 'etag')
+    HTML_TYPES = ('text/html', 'application/xhtml+xml')
+
+    def __init__(self, cache_dir=".cache/assets"):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+
+    def _path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+    def load(self, url):
+        """Cached (status, headers, body) for url, None when not cached"""
+        path = self._path(url)
+        try:
+            with open(f"{path}.json", 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(path, 'rb') as f:
+                return meta['status'], meta['headers'], f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, url, status, headers, body):
+        """Write a response atomically, body first so a readable .json always has its body"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(url)
+        for target, data, mode in ((path, body, 'wb'), (f"{path}.json", None, 'w')):
+            tmp_path = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+            if data is None:
+                with open(tmp_path, mode, encoding='utf-8') as f:
+                    json.dump({'url': url, 'status': status, 'headers': headers}, f)
+            else:
+                with open(tmp_path, mode) as f:
+                    f.write(data)
+            os.replace(tmp_path, target)
+
+    @classmethod
+    def _kind(cls, media_type):
+        """Rough kind of a media type: image, font, audio, video, script, style, html or the type itself"""
+        top, _, sub = media_type.partition('/')
+        if media_type in cls.HTML_TYPES:
+            return 'html'
+        if top in ('image', 'font', 'audio', 'video'):
+            return top
+        if 'font' in sub:
+            return 'font'  # application/font-woff and friends
+        if 'javascript' in sub or 'ecmascript' in sub:
+            return 'script'
+        if media_type == 'text/css':
+            return 'style'
+        return media_type
+
+    def matches(self, url, content_type):
+        """Whether a response's content type fits the asset the URL's extension names
+
+        An HTML page is only an asset when HTML was asked for; that keeps login pages and
+        error pages served in place of an asset out of the cache. Assets without a known
+        extension take any other type, fonts also come as application/octet-stream.
+        """
+        received = self._kind((content_type or '').split(';')[0].strip().lower())
+        expected, _ = mimetypes.guess_type(urlsplit(url).path)
+        expected = self._kind(expected) if expected else None
+        if received == 'html' or expected is None:
+            return received != 'html' or expected == 'html'
+        return received == expected or (expected == 'font' and received == 'application/octet-stream')
+
+    def fetch(self, url, headers=None, timeout=15):
+        """Download url and cache it, returns (status, headers, body) or None when it can't be cached
+
+        Redirected responses and responses whose content type doesn't fit the asset (an
+        auth redirect to the login page, say) are passed on uncached.
+        """
+        request = urllib.request.Request(url, headers={
+            name: value for name, value in (headers or {}).items() if name.lower() in self.FORWARDED_HEADERS
+        })
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            status, final_url, body = response.status, response.geturl(), response.read()
+            kept = {name: value for name, value in response.headers.items() if name.lower() in self.KEPT_HEADERS}
+        if status != 200:
+            return None
+        if final_url != url:
+            self.logger.debug(f"Not caching {url}: redirected to {final_url}")
+            return None
+        content_type = next((value for name, value in kept.items() if name.lower() == 'content-type'), None)
+        if not self.matches(url, content_type):
+            self.logger.debug(f"Not caching {url}: unexpected content type {content_type}")
+            return None
+        self.save(url, status, kept, body)
+        return status, kept, body
+
+
+class RequestInterceptor:
+    """Blocks and stubs the requests of one browser through the DevTools protocol
+
+    Blocking uses Network.setBlockedURLs with the union of named scopes, so the
+    launch profile, the page object being opened and the running test can each set
+    their own patterns and clear them again without touching the others. Patterns
+    are Chrome URL wildcards or the names of RESOURCE_GROUPS. The 'page' scope
+    belongs to the URL path it was set for and is dropped by leave_page() once the
+    browser is somewhere else.
+
+    Stubbing answers requests matching its patterns from an AssetCache. It needs
+    DevTools events, so it runs a Fetch domain listener on a background thread;
+    assets missing from the cache are downloaded once and served from disk after.
+    """
+
+    # DevTools URL blocking has no resource type filter, so types are named pattern groups
+    RESOURCE_GROUPS = {
+        'image': ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif"],
+        'font': ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot", "*fonts.googleapis.com*", "*fonts.gstatic.com*"],
+        'media': ["*.mp4", "*.webm", "*.mp3", "*.ogg"],
+        'analytics': [
+            "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+            "*connect.facebook.net*", "*hotjar.com*", "*clarity.ms*",
+        ],
+    }
+
+    def __init__(self, driver):
+        self.logger = logging.getLogger(__name__)
+        self.driver = driver
+        self.paused = False
+        self.page_path = None
+        self._scopes = {}
+        self._applied = None
+        self._thread = None
+        self._token = None
+        self._cancel = None
+        self._ready = threading.Event()
+        self._listening = False
+        self.stubbed = 0
+
+    @classmethod
+    def expand(cls, patterns):
+        """URL patterns with group names replaced by the group's patterns
+
+        Chrome matches a wildcard against the whole URL, query string included, so every
+        pattern without a '?' that doesn't already end in '*' also gets a '<pattern>?*'
+        twin: '*.png' then matches 'logo.png?v=123' as well.
+        """
+        expanded = []
+        for pattern in patterns:
+            for url in cls.RESOURCE_GROUPS.get(pattern, [pattern]):
+                variants = [url] if '?' in url or url.endswith('*') else [url, f"{url}?*"]
+                expanded += [variant for variant in variants if variant not in expanded]
+        return expanded
+
+    @property
+    def blocked(self):
+        """URL patterns blocked right now"""
+        return [] if self.paused else self.expand(
+            pattern for patterns in self._scopes.values() for pattern in patterns
+        )
+
+    def block(self, scope, patterns):
+        """Block patterns under scope, replacing what the scope blocked before"""
+        if patterns:
+            self._scopes[scope] = tuple(patterns)
+        else:
+            self._scopes.pop(scope, None)
+        return self.apply()
+
+    def unblock(self, scope):
+        """Drop the patterns of scope"""
+        return self.block(scope, ())
+
+    def block_page(self, path, patterns):
+        """Block patterns under the 'page' scope while the browser stays on path (query strings don't count)"""
+        self.page_path = path if patterns else None
+        return self.block('page', patterns)
+
+    def leave_page(self, url):
+        """Drop the 'page' scope when url is off the path it was set for, returns whether it was dropped"""
+        if self.page_path is None or urlsplit(url).path == self.page_path:
+            return False
+        self.logger.debug(f"Left {self.page_path}, unblocking its requests")
+        self.page_path = None
+        self.unblock('page')
+        return True
+
+    def pause(self, paused=True):
+        """Let everything through (or block again) without losing the scopes"""
+        self.paused = paused
+        return self.apply()
+
+    def reset(self, keep=('profile',)):
+        """Clear every scope but the kept ones and stop pausing, used before a browser is reused"""
+        self._scopes = {scope: patterns for scope, patterns in self._scopes.items() if scope in keep}
+        if 'page' not in keep:
+            self.page_path = None
+        self.paused = False
+        return self.apply()
+
+    def apply(self):
+        """Send the blocked patterns to the browser when they changed since the last call"""
+        urls = self.blocked
+        if urls == self._applied:
+            return True
+        try:
+            if self._applied is None:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': urls})
+            self._applied = urls
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to set blocked URLs: {str(e)}")
+            return False
+
+    @property
+    def stubbing(self):
+        """Whether the stub listener is connected and answering requests"""
+        return self._listening
+
+    def start_stubbing(self, patterns, cache, timeout=10):
+        """Serve requests matching patterns from cache, returns False when the listener didn't start"""
+        if self.stubbing:
+            return True
+        urls = self.expand(patterns)
+        self._ready.clear()
+        self._thread = threading.Thread(target=trio.run, args=(self._serve, urls, cache),
+                                        name="request-stub", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout) or not self._listening:
+            self.logger.warning("Asset stubbing did not start")
+            return False
+        self.logger.info(f"Stubbing {len(urls)} URL patterns from {cache.cache_dir}")
+        return True
+
+    def stop_stubbing(self):
+        """Stop the listener, requests go to the network again"""
+        if self._thread is None:
+            return
+        try:
+            trio.from_thread.run_sync(self._cancel.cancel, trio_token=self._token)
+        except (RuntimeError, trio.RunFinishedError):
+            pass  # The loop already ended with the browser
+        self._thread.join(5)
+        self._thread = None
+
+    async def _serve(self, urls, cache):
+        """Listen for paused requests until cancelled or the browser goes away"""
+        self._token = trio.lowlevel.current_trio_token()
+        with trio.CancelScope() as self._cancel:
+            try:
+                async with self.driver.bidi_connection() as connection:
+                    session, devtools = connection.session, connection.devtools
+                    await session.execute(devtools.fetch.enable(patterns=[
+                        devtools.fetch.RequestPattern(url_pattern=url, request_stage=devtools.fetch.RequestStage.REQUEST)
+                        for url in urls
+                    ]))
+                    self._listening = True
+                    self._ready.set()
+                    async with trio.open_nursery() as nursery:
+                        async for event in session.listen(devtools.fetch.RequestPaused):
+                            nursery.start_soon(self._answer, session, devtools, cache, event)
+            except Exception as e:
+                self.logger.debug(f"Asset stubbing stopped: {str(e)}")
+            finally:
+                self._listening = False
+                self._ready.set()
+
+    async def _answer(self, session, devtools, cache, event):
+        """Fulfill a paused request from the cache, downloading it first on a miss"""
+        url = event.request.url
+        try:
+            response = cache.load(url)
+            if response is None:
+                response = await trio.to_thread.run_sync(cache.fetch, url, dict(event.request.headers))
+            if response is None:
+                await session.execute(devtools.fetch.continue_request(request_id=event.request_id))
+                return
+            status, headers, body = response
+            await session.execute(devtools.fetch.fulfill_request(
+                request_id=event.request_id,
+                response_code=status,
+                response_headers=[devtools.fetch.HeaderEntry(name=name, value=value) for name, value in headers.items()],
+                body=base64.b64encode(body).decode('ascii')
+            ))
+            self.stubbed += 1
+        except Exception as e:
+            self.logger.debug(f"Stub failed for {url}: {str(e)}")
+            try:
+                await session.execute(devtools.fetch.continue_request(request_id=event.request_id))
+            except Exception:
+                pass  # Request already answered or the page is gone
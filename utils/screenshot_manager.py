@@ -0,0 +1,110 @@
+import hashlib
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional, only needed for JPEG screenshots and thumbnails
+    Image = None
+
+def thumbnail_path(image_path):
+    """Path of the thumbnail written next to a screenshot"""
+    return f"{os.path.splitext(image_path)[0]}_thumb.jpg"
+
+class ScreenshotManager:
+    """Captures screenshots on the test thread and encodes/writes them on a background pool"""
+
+    POLICIES = ("always", "on-failure", "never")
+    THUMBNAIL_SIZE = (480, 300)
+
+    def __init__(self, base_dir="screenshots", policy="on-failure", image_format="png", max_workers=2):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unsupported screenshot policy: {policy}. Use one of {self.POLICIES}")
+
+        self.logger = logging.getLogger(__name__)
+        self.base_dir = base_dir
+        self.policy = policy
+        self.image_format = image_format.lower()
+        if self.image_format == "jpeg" and Image is None:
+            self.logger.warning("Pillow is not installed, saving screenshots as PNG")
+            self.image_format = "png"
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshot")
+        self._digests = {}
+        self._lock = threading.Lock()
+        self._pending = []
+
+    def should_capture(self, failed):
+        """Check the policy for a test that passed or failed"""
+        return self.policy == "always" or (self.policy == "on-failure" and failed)
+
+    def build_path(self, name, suffix=""):
+        """Target path for a screenshot in today's directory"""
+        date_dir = os.path.join(self.base_dir, datetime.now().strftime('%Y-%m-%d'))
+        os.makedirs(date_dir, exist_ok=True)
+        timestamp = datetime.now().strftime('%H-%M-%S')
+        clean_name = "".join(char for char in name if char.isalnum() or char in (' ', '-', '_')).rstrip()
+        extension = "jpg" if self.image_format == "jpeg" else "png"
+        return os.path.join(date_dir, f"{clean_name}{suffix}_{timestamp}.{extension}")
+
+    def capture(self, driver, name, suffix=""):
+        """Grab the raw PNG now and hand encoding and writing to the pool, returns the target path"""
+        try:
+            png = driver.get_screenshot_as_png()
+        except Exception as e:
+            self.logger.error(f"Failed to capture screenshot: {str(e)}")
+            return None
+
+        path = self.build_path(name, suffix)
+        self._pending = [future for future in self._pending if not future.done()]
+        self._pending.append(self._executor.submit(self._store, png, path))
+        return path
+
+    def _store(self, png, path):
+        """Encode and write one screenshot and its thumbnail, hard-linking identical images"""
+        try:
+            digest = hashlib.sha1(png).hexdigest()
+            with self._lock:
+                existing = self._digests.setdefault(digest, path)
+
+            if existing != path:
+                try:
+                    os.link(existing, path)
+                    return path
+                except OSError:
+                    pass  # Not written yet or no hard links on this filesystem
+
+            data = png
+            if Image is not None:
+                image = Image.open(io.BytesIO(png)).convert("RGB")
+                if self.image_format == "jpeg":
+                    buffer = io.BytesIO()
+                    image.save(buffer, "JPEG", quality=80, optimize=True)
+                    data = buffer.getvalue()
+                image.thumbnail(self.THUMBNAIL_SIZE)
+                image.save(thumbnail_path(path), "JPEG", quality=70)
+
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self.logger.info(f"Screenshot saved: {path}")
+            return path
+        except Exception as e:
+            self.logger.error(f"Failed to save screenshot {path}: {str(e)}")
+            return None
+
+    def flush(self):
+        """Wait for every queued screenshot to be written"""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def shutdown(self):
+        """Flush pending screenshots and stop the background pool"""
+        self.flush()
+        self._executor.shutdown(wait=True)
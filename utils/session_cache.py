@@ -0,0 +1,119 @@
+import glob
+import json
+import logging
+import os
+import time
+from data.constants import LoginPage as LoginConstants
+
+class SessionCache:
+    """Persists an authenticated browser session so tests can skip the login form"""
+
+    # Cheap same-origin page to load before cookies can be set for the domain
+    BOOTSTRAP_PATH = "/robots.txt"
+
+    def __init__(self, base_url, cache_dir=".cache/sessions", ttl=1800, worker_id="main"):
+        self.logger = logging.getLogger(__name__)
+        self.base_url = base_url.rstrip('/')
+        self.ttl = ttl
+        self.path = os.path.join(cache_dir, f"session_{worker_id}.json")
+
+    @classmethod
+    def all_workers(cls, base_url, cache_dir=".cache/sessions", **kwargs):
+        """Session caches of every worker that left a session file ('main', 'gw0', ...), most recent first"""
+        caches = []
+        for path in glob.glob(os.path.join(cache_dir, "session_*.json")):
+            try:
+                modified = os.path.getmtime(path)
+            except OSError:
+                continue  # Removed since it was listed
+            worker_id = os.path.basename(path)[len("session_"):-len(".json")]
+            caches.append((modified, cls(base_url, cache_dir, worker_id=worker_id, **kwargs)))
+        return [cache for _, cache in sorted(caches, key=lambda entry: entry[0], reverse=True)]
+
+    def load(self):
+        """Load the cached session snapshot if it exists and has not expired"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if snapshot.get('base_url') != self.base_url or snapshot.get('expires_at', 0) <= time.time():
+            self.logger.info("Cached session expired or belongs to another environment")
+            self.invalidate()
+            return None
+        return snapshot
+
+    def save(self, snapshot):
+        """Write snapshot to disk atomically"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self.path)
+
+    def invalidate(self):
+        """Remove the cached session"""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def capture(self, driver):
+        """Capture cookies and web storage from a logged-in browser"""
+        try:
+            storage = driver.execute_script("""
+                const dump = (store) => Object.fromEntries(
+                    Array.from({length: store.length}, (_, i) => [store.key(i), store.getItem(store.key(i))])
+                );
+                return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+            """)
+            now = time.time()
+            snapshot = {
+                'base_url': self.base_url,
+                'created_at': now,
+                'expires_at': now + self.ttl,
+                'cookies': driver.get_cookies(),
+                'local_storage': storage['local'],
+                'session_storage': storage['session']
+            }
+            self.save(snapshot)
+            self.logger.info(f"Session captured with {len(snapshot['cookies'])} cookies")
+            return snapshot
+        except Exception as e:
+            self.logger.error(f"Failed to capture session: {str(e)}")
+            return None
+
+    def inject(self, driver, snapshot):
+        """Load the snapshot's cookies and web storage into a fresh browser"""
+        driver.get(f"{self.base_url}{self.BOOTSTRAP_PATH}")
+        for cookie in snapshot['cookies']:
+            # Let the browser scope the cookie to the current host
+            cookie = {key: value for key, value in cookie.items() if key != 'domain'}
+            driver.add_cookie(cookie)
+
+        driver.execute_script("""
+            for (const [key, value] of Object.entries(arguments[0])) window.localStorage.setItem(key, value);
+            for (const [key, value] of Object.entries(arguments[1])) window.sessionStorage.setItem(key, value);
+        """, snapshot['local_storage'], snapshot['session_storage'])
+
+    def restore(self, driver, landing_path):
+        """Inject the cached session and open landing_path, returns False if a UI login is needed"""
+        snapshot = self.load()
+        if not snapshot:
+            return False
+
+        try:
+            self.inject(driver, snapshot)
+            driver.get(f"{self.base_url}{landing_path}")
+        except Exception as e:
+            self.logger.warning(f"Failed to restore cached session: {str(e)}")
+            return False
+
+        if LoginConstants.URLS["LOGIN"] in driver.current_url:
+            self.logger.info("Cached session rejected by the server")
+            self.invalidate()
+            return False
+
+        self.logger.info(f"Restored cached session on {landing_path}")
+        return True
@@ -0,0 +1,831 @@
+import argparse
+import html
+import logging
+import random
+import secrets
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+from data.constants import (
+    AddUserPage as UserFormConstants,
+    AddCategoryPage as CategoryFormConstants,
+    CategoryPage as CategoryConstants,
+    LoginPage as LoginConstants,
+    SideMenu as MenuConstants,
+    URLs,
+    UsersPage as UserConstants,
+)
+
+def _e(value):
+    return html.escape(str(value), quote=True)
+
+class StandinData:
+    """In-memory categories, users and login sessions of the stand-in app
+
+    Datasets are generated from a seed so every run sees the same rows. Every
+    in_use_every-th category counts as used by products and refuses to be deleted,
+    like the real app does.
+    """
+
+    ROLES = list(UserConstants.ROLES.values())
+    PER_PAGE = (10, 20, 50, 100)
+
+    def __init__(self, categories=60, users=40, email="admin@example.com", password="password",
+                 in_use_every=10, seed=1):
+        rng = random.Random(seed)
+        self.email = email
+        self.password = password
+        self.sessions = {}
+        self.lock = threading.Lock()
+        self._next_id = 1
+        self.categories = []
+        self.users = []
+        for index in range(categories):
+            self.categories.append({
+                'id': self._new_id(),
+                'name': f"Category {index + 1:05d}",
+                'description': f"Seeded category {index + 1}",
+                'sort_order': index + 1,
+                'active': rng.random() > 0.2,
+                'photo': "/gallery/1.jpg",
+                'in_use': in_use_every and (index + 1) % in_use_every == 0
+            })
+        for index in range(users):
+            first, last = f"User{index + 1:05d}", rng.choice(["Santos", "Reyes", "Cruz", "Garcia", "Lim"])
+            self.users.append({
+                'id': self._new_id(),
+                'first_name': first,
+                'middle_name': '',
+                'last_name': last,
+                'email': f"{first.lower()}.{last.lower()}@example.com",
+                'role': rng.choice(self.ROLES)
+            })
+
+    def _new_id(self):
+        record_id, self._next_id = self._next_id, self._next_id + 1
+        return record_id
+
+    def find(self, records, record_id):
+        return next((record for record in records if str(record['id']) == str(record_id)), None)
+
+    def list_categories(self, params):
+        rows = list(self.categories)
+        name = params.get('name', '').strip().lower()
+        if name:
+            rows = [row for row in rows if name in row['name'].lower()]
+        status = params.get('status')
+        if status in ('true', 'false'):
+            rows = [row for row in rows if row['active'] == (status == 'true')]
+        field, _, direction = (params.get('order_by') or 'sort_order asc').partition(' ')
+        if field in ('name', 'sort_order'):
+            rows.sort(key=lambda row: row[field], reverse=direction == 'desc')
+        return rows
+
+    def list_users(self, params):
+        rows = list(self.users)
+        for key, field in (('name', None), ('email', 'email')):
+            query = params.get(key, '').strip().lower()
+            if query:
+                rows = [row for row in rows if query in (row[field] if field else self.full_name(row)).lower()]
+        order = params.get('order_by', '')
+        field, _, direction = order.partition(' ')
+        if field == 'name':
+            rows.sort(key=self.full_name, reverse=direction == 'desc')
+        elif field == 'email':
+            rows.sort(key=lambda row: row['email'], reverse=direction == 'desc')
+        return rows
+
+    @staticmethod
+    def full_name(user):
+        return " ".join(part for part in (user['first_name'], user['middle_name'], user['last_name']) if part)
+
+    def validate_category(self, fields, record=None):
+        errors = []
+        messages = CategoryFormConstants.VALIDATION
+        if not fields.get('name'):
+            errors.append(messages['NAME_REQUIRED'])
+        if not fields.get('description'):
+            errors.append(messages['DESCRIPTION_REQUIRED'])
+        if not fields.get('photo'):
+            errors.append(messages['PHOTO_REQUIRED'])
+        sort_order = fields.get('sort_order', '')
+        if not sort_order:
+            errors.append(messages['SORT_ORDER_REQUIRED'])
+        elif not sort_order.lstrip('-').isdigit():
+            errors.append(messages['SORT_ORDER_INVALID'])
+        others = [row for row in self.categories if row is not record]
+        if sort_order.lstrip('-').isdigit() and any(row['sort_order'] == int(sort_order) for row in others):
+            errors.append(messages['SORT_ORDER_TAKEN'])
+        if fields.get('name') and any(row['name'].lower() == fields['name'].lower() for row in others):
+            errors.append(messages['NAME_TAKEN'])
+        return errors
+
+    def validate_user(self, fields, record=None):
+        errors = []
+        messages = UserFormConstants.VALIDATION
+        if not (fields.get('first_name') and fields.get('last_name')):
+            errors.append(messages['NAME_REQUIRED'])
+        email = fields.get('email', '')
+        if not email:
+            errors.append(messages['EMAIL_REQUIRED'])
+        elif '@' not in email or '.' not in email.rsplit('@', 1)[-1]:
+            errors.append(messages['EMAIL_INVALID'])
+        elif any(row['email'].lower() == email.lower() for row in self.users if row is not record):
+            errors.append(messages['EMAIL_TAKEN'])
+        if fields.get('role') not in self.ROLES:
+            errors.append(messages['ROLE_REQUIRED'])
+        return errors
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Serves the admin pages the page objects drive, with the markup their locators expect"""
+
+    server_version = "StandinAdmin/1.0"
+    COOKIE = "_admin_session"
+
+    # --- plumbing -------------------------------------------------------------
+
+    @property
+    def app(self):
+        return self.server.app
+
+    @property
+    def data(self):
+        return self.server.app.data
+
+    def log_message(self, format, *args):
+        self.app.logger.debug("%s %s", self.address_string(), format % args)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def _dispatch(self, method):
+        self.app.delay()
+        parts = urlsplit(self.path)
+        self.route = parts.path.rstrip('/') or '/'
+        self.params = {key: values[-1] for key, values in parse_qs(parts.query, keep_blank_values=True).items()}
+        self.form = {}
+        if method == 'POST':
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length).decode('utf-8')
+            self.form = {key: values[-1] for key, values in parse_qs(body, keep_blank_values=True).items()}
+            # Rails-style _method override for forms
+            method = self.form.get('_method', method).upper()
+
+        self.session = self._session()
+        try:
+            with self.data.lock:
+                self._route(method)
+        except Exception as e:
+            self.app.logger.exception(f"Stand-in app failed on {method} {self.path}")
+            self._send(500, f"<h1>500</h1><pre>{_e(e)}</pre>")
+
+    def _route(self, method):
+        route = self.route
+        if route == '/robots.txt':
+            return self._send(200, "User-agent: *\nDisallow: /\n", content_type="text/plain")
+        if route in ('/', '/admin'):
+            return self._redirect(URLs.DASHBOARD)
+        if route == LoginConstants.URLS['LOGIN']:
+            return self.login_post() if method == 'POST' else self.login_page()
+        if route == '/admin/logout':
+            self.data.sessions.pop(self.session_id, None)
+            return self._redirect(LoginConstants.URLS['LOGIN'])
+        if route == LoginConstants.URLS['FORGOT_PASSWORD']:
+            return self._send(200, self._layout("Forgot Password", "<h6>Forgot your password?</h6>", menu=False))
+        if self.session is None:
+            return self._redirect(LoginConstants.URLS['LOGIN'])
+        if method != 'GET' and not self._csrf_ok():
+            return self._send(422, "<h1>Invalid authenticity token</h1>")
+
+        segments = route.strip('/').split('/')[1:]
+        if route == URLs.CATEGORIES:
+            return self.create_category() if method == 'POST' else self.categories_page()
+        if route == URLs.USERS:
+            return self.create_user() if method == 'POST' else self.users_page()
+        if len(segments) >= 2 and segments[0] in ('categories', 'users'):
+            kind, record_id = segments[0], segments[1]
+            action = segments[2] if len(segments) > 2 else None
+            if record_id == 'new':
+                return self.category_form() if kind == 'categories' else self.user_form()
+            records = self.data.categories if kind == 'categories' else self.data.users
+            record = self.data.find(records, record_id)
+            if record is None:
+                return self._send(404, self._layout("Not Found", "<h1>Not Found</h1>"))
+            if method == 'DELETE':
+                return self.delete_record(kind, records, record)
+            if method in ('POST', 'PATCH', 'PUT'):
+                return self.update_category(record) if kind == 'categories' else self.update_user(record)
+            if action == 'edit' or kind == 'users':
+                return self.category_form(record) if kind == 'categories' else self.user_form(record)
+        if route.startswith('/admin/'):
+            # Other menu destinations only need to exist
+            title = next((name for key, name in MenuConstants.ITEMS.items()
+                          if MenuConstants.URLS.get(key) == route), route)
+            return self._send(200, self._layout(title, f"<div class='card'><div class='card__header'><span>{_e(title)}</span></div></div>"))
+        return self._send(404, "<h1>Not Found</h1>", content_type="text/html")
+
+    def _session(self):
+        cookie = SimpleCookie(self.headers.get('Cookie') or '')
+        self.session_id = cookie[self.COOKIE].value if self.COOKIE in cookie else None
+        return self.data.sessions.get(self.session_id)
+
+    def _csrf_ok(self):
+        token = self.headers.get('X-CSRF-Token') or self.form.get('authenticity_token')
+        return token == self.session['csrf']
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _redirect(self, location, flash=None, cookie=None):
+        if flash and self.session is not None:
+            self.session['flash'] = flash
+        headers = {'Location': location}
+        if cookie:
+            headers['Set-Cookie'] = cookie
+        self._send(303, "", headers=headers)
+
+    def _flash(self):
+        kind, message = (self.session or {}).pop('flash', None) or (None, None)
+        if not message:
+            return ""
+        return (f"<div class='alert alert--soft-{kind}'><div class='alert__content'><div class='row'>"
+                f"<div class='col'>{_e(message)}</div></div></div></div>")
+
+    # --- layout ---------------------------------------------------------------
+
+    def _layout(self, title, content, menu=True):
+        csrf = self.session['csrf'] if self.session else ""
+        return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{_e(LoginConstants.TITLE)}</title>
+<meta name="csrf-token" content="{_e(csrf)}">
+<style>{STYLE}</style></head>
+<body>{self._sidebar() if menu else ""}<main class="main">{self._flash()}{content}</main>
+{MODAL if menu else ""}
+<script>{SCRIPT}</script></body></html>"""
+
+    def _sidebar(self):
+        def link(key, sub=False):
+            css = "sidebar__link sidebar__link--sub" if sub else "sidebar__link"
+            return f"<a class='{css}' href='{MenuConstants.URLS[key]}'><span>{_e(self._menu_text(key))}</span></a>"
+
+        def section(name, section_id, items):
+            open_section = any(MenuConstants.URLS[key] == self.route for key in items)
+            return (f"<button class='sidebar__link' type='button' aria-controls='{section_id}' "
+                    f"data-action='collapse'><span>{_e(MenuConstants.SECTIONS[name])}</span></button>"
+                    f"<div id='{section_id}' class='collapse{' show' if open_section else ''}'>"
+                    + "".join(link(key, sub=True) for key in items) + "</div>")
+
+        items = [link(key) for key in MenuConstants.ITEMS]
+        items.append(section('SYSTEM_SETTINGS', 'collapseSystemSettings', MenuConstants.SYSTEM_SETTINGS_ITEMS))
+        items.append(section('INQUIRIES', 'collapseInquiries', MenuConstants.INQUIRIES_ITEMS))
+        return (f"<aside class='sidebar'><div class='sidebar__header'><img class='sidebar__logo' alt='logo' src='/logo.png'>"
+                f"<span>{_e(MenuConstants.TITLE)}</span></div><nav>{''.join(items)}</nav>"
+                f"<a id='logout' href='/admin/logout'>Logout</a></aside>")
+
+    @staticmethod
+    def _menu_text(key):
+        return (MenuConstants.ITEMS.get(key) or MenuConstants.SYSTEM_SETTINGS_ITEMS.get(key)
+                or MenuConstants.INQUIRIES_ITEMS.get(key))
+
+    def _tom_select(self, name, options, selected, select_id=None, label=""):
+        """Native select hidden behind a TomSelect-like widget, as rendered by admin--tom-select"""
+        ts_id = select_id or f"ts-{name}"
+        option_tags = "".join(
+            f"<option value='{_e(value)}'{' selected' if str(value) == str(selected) else ''}>{_e(text)}</option>"
+            for value, text in options
+        )
+        items = "".join(
+            f"<div class='option' data-selectable data-value='{_e(value)}'>{_e(text)}</div>" for value, text in options
+        )
+        current = next((text for value, text in options if str(value) == str(selected)), label)
+        return (f"<div class='ts-field'><select id='{ts_id}' name='{name}' class='ts-hidden-accessible' "
+                f"data-controller='admin--tom-select'><option value=''></option>{option_tags}</select>"
+                f"<div class='ts-wrapper single'><div id='{ts_id}-ts-control' class='ts-control'>"
+                f"<div class='item'>{_e(current)}</div><span class='clear-button'>&times;</span></div>"
+                f"<div id='{ts_id}-ts-dropdown' class='ts-dropdown'><div class='ts-dropdown-content'>{items}</div></div>"
+                f"</div></div>")
+
+    def _pagination(self, total, page, per_page):
+        pages = max(1, -(-total // per_page))
+        page = min(max(page, 1), pages)
+
+        def href(number):
+            query = dict(self.params, page=number)
+            return f"{self.route}?{urlencode(query)}"
+
+        def arrow(label, number, enabled):
+            if not enabled:
+                return f"<a role='link' aria-disabled='true' aria-label='{label}'>{'&lt;' if label == 'Previous' else '&gt;'}</a>"
+            return f"<a href='{href(number)}' aria-label='{label}' data-turbo-action='advance'>{'&lt;' if label == 'Previous' else '&gt;'}</a>"
+
+        links = []
+        for number in range(max(1, page - 3), min(pages, page + 3) + 1):
+            if number == page:
+                links.append(f"<span class='page active'><a class='current' aria-current='page' role='link'>{number}</a></span>")
+            else:
+                links.append(f"<span class='page'><a href='{href(number)}' data-turbo-action='advance'>{number}</a></span>")
+        return (f"<nav class='pagy nav pagy-nav' aria-label='Pages'>{arrow('Previous', page - 1, page > 1)}"
+                f"{''.join(links)}{arrow('Next', page + 1, page < pages)}</nav>")
+
+    def _paged(self, rows):
+        try:
+            per_page = int(self.params.get('count_per_page') or 10)
+        except ValueError:
+            per_page = 10
+        try:
+            page = max(int(self.params.get('page') or 1), 1)
+        except ValueError:
+            page = 1
+        pages = max(1, -(-len(rows) // per_page))
+        page = min(page, pages)
+        return rows[(page - 1) * per_page:page * per_page], page, per_page
+
+    def _header_buttons(self, headers):
+        return "".join(
+            f"<th>{_e(text)}</th>" if index == len(headers) else
+            f"<th><button type='button' data-button-type='{index}'>{_e(text)}</button></th>"
+            for index, text in enumerate(headers, 1)
+        )
+
+    def _actions(self, base, record, view=False):
+        links = [f"<a class='table__action' data-bs-title='View' href='{base}/{record['id']}'>View</a>"] if view else []
+        links.append(f"<a class='table__action' data-bs-title='Edit' href='{base}/{record['id']}/edit'>Edit</a>")
+        links.append(f"<a class='table__action' data-bs-title='Delete' href='{base}/{record['id']}' "
+                     f"data-action='click->admin--table#deleteItem'>Delete</a>")
+        return f"<td><div class='table__actions'>{''.join(links)}</div></td>"
+
+    # --- login ----------------------------------------------------------------
+
+    def login_page(self, error=None):
+        alert = (f"<div class='alert alert--danger'><div class='alert__content'>{_e(error)}</div></div>"
+                 if error else "")
+        content = f"""
+<div class="login card"><img class="mb-4" alt="alt" src="/logo.png">
+<form id="new_user" action="{LoginConstants.URLS['LOGIN']}" method="post">
+<h6>{_e(LoginConstants.HEADING)}</h6>
+<div class="field-group"><label class="label label--required" for="user_email">{_e(LoginConstants.LABELS['EMAIL'])}</label>
+<div class="field-container"><input id="user_email" class="field" type="email" name="user[email]"
+ placeholder="{_e(LoginConstants.PLACEHOLDERS['EMAIL'])}"></div></div>
+<div class="field-group"><label class="label label--required" for="user_password">{_e(LoginConstants.LABELS['PASSWORD'])}</label>
+<div class="field-container"><input id="user_password" class="field" type="password" name="user[password]"
+ placeholder="{_e(LoginConstants.PLACEHOLDERS['PASSWORD'])}">
+<button type="button" data-controller="admin--show-password">{_e(LoginConstants.BUTTONS['SHOW_PASSWORD'])}</button></div></div>
+{alert}
+<button class="btn btn--primary btn--block btn--lg" type="submit">Login</button>
+<a href="{LoginConstants.URLS['FORGOT_PASSWORD']}">{_e(LoginConstants.LABELS['FORGOT_PASSWORD'])}</a>
+</form></div>"""
+        self._send(422 if error else 200, self._layout("Login", content, menu=False))
+
+    def login_post(self):
+        if (self.form.get('user[email]'), self.form.get('user[password]')) != (self.data.email, self.data.password):
+            return self.login_page(LoginConstants.MESSAGES['INVALID_CREDENTIALS'])
+        session_id = secrets.token_hex(16)
+        self.data.sessions[session_id] = {'csrf': secrets.token_urlsafe(24)}
+        self.session = self.data.sessions[session_id]
+        self._redirect(URLs.DASHBOARD, cookie=f"{self.COOKIE}={session_id}; Path=/; HttpOnly")
+
+    # --- categories -----------------------------------------------------------
+
+    def categories_page(self):
+        rows = self.data.list_categories(self.params)
+        page_rows, page, per_page = self._paged(rows)
+        body = "".join(
+            f"<tr data-item-id='{row['id']}'><td>{_e(row['name'])}</td><td>{row['sort_order']}</td>"
+            f"<td><span class='badge badge--{'success' if row['active'] else 'secondary'}'>"
+            f"{CategoryConstants.STATUS['ACTIVE'] if row['active'] else CategoryConstants.STATUS['INACTIVE']}</span></td>"
+            f"{self._actions(CategoryConstants.URLS['LIST'], row)}</tr>"
+            for row in page_rows
+        ) or "<tr><td class='text-danger text-center' colspan='8'>No record found</td></tr>"
+        sort_options = [(value, value.replace('_', ' ').title()) for value in CategoryConstants.SORT_OPTIONS.values()]
+        status_options = [('true', CategoryConstants.STATUS['ACTIVE']), ('false', CategoryConstants.STATUS['INACTIVE'])]
+        content = f"""
+<div class="card"><div class="card__header"><span>{_e(CategoryConstants.TITLE)}</span>
+<a class="btn btn--primary" href="{CategoryConstants.URLS['NEW']}">New Category</a></div>
+<form class="filters" data-controller="admin--filters" action="{URLs.CATEGORIES}">
+<input id="name" name="name" class="field field--search" placeholder="Search by Category Name" value="{_e(self.params.get('name', ''))}">
+{self._tom_select('order_by', sort_options, self.params.get('order_by', ''), label='Sort by')}
+{self._tom_select('status', status_options, self.params.get('status', ''), label='Status')}
+<select name="count_per_page">{''.join(f"<option value='{count}'{' selected' if count == per_page else ''}>{count}</option>" for count in StandinData.PER_PAGE)}</select>
+</form>
+<turbo-frame id="data-table"><p class="overline">Showing <strong>{len(rows)}</strong> records</p>
+<table class="table"><thead><tr>{self._header_buttons(CategoryConstants.TABLE_HEADERS)}</tr></thead>
+<tbody>{body}</tbody></table>{self._pagination(len(rows), page, per_page)}</turbo-frame></div>"""
+        self._send(200, self._layout(CategoryConstants.TITLE, content))
+
+    def category_form(self, record=None, errors=None, fields=None):
+        fields = fields or (record and {
+            'name': record['name'], 'description': record['description'],
+            'sort_order': str(record['sort_order']), 'active': record['active'], 'photo': record['photo']
+        }) or {'name': '', 'description': '', 'sort_order': '', 'active': True, 'photo': ''}
+        title = "Edit Category" if record else CategoryFormConstants.TITLE
+        action = f"{CategoryConstants.URLS['LIST']}/{record['id']}" if record else CategoryConstants.URLS['LIST']
+        error_block = ""
+        if errors:
+            error_block = ("<div class='alert alert--soft-danger'><div class='alert__content'><ul>"
+                           + "".join(f"<li>{_e(error)}</li>" for error in errors) + "</ul></div></div>")
+        photo = fields.get('photo') or "/placeholder.png"
+        content = f"""
+<div class="card"><div class="card__header"><a data-bs-title="Back" href="{CategoryConstants.URLS['LIST']}">&lt;</a>
+<span class="fw-bold">{_e(title)}</span></div>
+<div id="formErrorStream">{error_block}</div>
+<form class="card__content" action="{action}" method="post">
+<input type="hidden" name="authenticity_token" value="{_e(self.session['csrf'])}">
+{"<input type='hidden' name='_method' value='patch'>" if record else ""}
+<div class="field-group"><label class="label" for="category_active">Active</label>
+<input type="hidden" name="category[active]" value="0">
+<input id="category_active" type="checkbox" name="category[active]" value="1"{' checked' if fields.get('active') else ''}></div>
+{self._field('category_name', 'category[name]', CategoryFormConstants.FIELDS['NAME'], fields.get('name'))}
+<div class="field-group"><label class="label label--required" for="category_description">{_e(CategoryFormConstants.FIELDS['DESCRIPTION'])}</label>
+<div class="field-container"><textarea id="category_description" class="field" name="category[description]">{_e(fields.get('description') or '')}</textarea></div></div>
+{self._field('category_sort_order', 'category[sort_order]', CategoryFormConstants.FIELDS['SORT_ORDER'], fields.get('sort_order'))}
+<div class="field-group"><label class="label label--required">{_e(CategoryFormConstants.FIELDS['PHOTO'])}</label>
+<p class="text-info overline">{_e(CategoryFormConstants.PHOTO_DIMENSIONS)}</p>
+<div class="change-photo-wrapper--hover"><img id="photo-url-field-preview" src="{_e(photo)}" alt="preview"></div>
+<input id="photo-url-field" type="hidden" name="category[photo]" value="{_e(fields.get('photo') or '')}">
+<button type="button" class="btn js-open-gallery">Choose Photo</button></div>
+<button class="btn btn--success" type="submit">Save</button>
+<a class="btn btn--outline-danger" href="{CategoryConstants.URLS['LIST']}">Discard</a>
+</form></div>
+<div id="gallery-wrapper" class="gallery-wrapper"><div class="gallery-body">
+<button type="button" class="close-gallery">&times;</button>
+<img class="gallery-thumbnail gallery-photo" src="/gallery/1.jpg" alt="photo 1">
+<img class="gallery-thumbnail gallery-photo" src="/gallery/2.jpg" alt="photo 2">
+<a class="btn btn--primary insert-img" href="#" data-action="click->admin--gallery#insertPhoto">Add Selected Photo</a>
+</div></div>"""
+        self._send(422 if errors else 200, self._layout(title, content))
+
+    @staticmethod
+    def _field(field_id, name, label, value, placeholder=""):
+        return (f"<div class='field-group'><label class='label label--required' for='{field_id}'>{_e(label)}</label>"
+                f"<div class='field-container'><input id='{field_id}' class='field' name='{name}' "
+                f"placeholder='{_e(placeholder)}' value='{_e(value or '')}'></div>"
+                f"<span class='field-helper'></span></div>")
+
+    def _category_fields(self):
+        return {
+            'name': self.form.get('category[name]', '').strip(),
+            'description': self.form.get('category[description]', '').strip(),
+            'sort_order': self.form.get('category[sort_order]', '').strip(),
+            'active': self.form.get('category[active]') == '1',
+            'photo': self.form.get('category[photo]', '').strip()
+        }
+
+    def create_category(self):
+        fields = self._category_fields()
+        errors = self.data.validate_category(fields)
+        if errors:
+            return self.category_form(errors=errors, fields=fields)
+        self.data.categories.append(dict(fields, id=self.data._new_id(), sort_order=int(fields['sort_order']), in_use=False))
+        self._redirect(CategoryConstants.URLS['LIST'], flash=('success', CategoryConstants.MESSAGES['CREATED']))
+
+    def update_category(self, record):
+        fields = self._category_fields()
+        errors = self.data.validate_category(fields, record)
+        if errors:
+            return self.category_form(record, errors=errors, fields=fields)
+        record.update(fields, sort_order=int(fields['sort_order']))
+        self._redirect(CategoryConstants.URLS['LIST'], flash=('success', CategoryConstants.MESSAGES['UPDATED']))
+
+    # --- users ----------------------------------------------------------------
+
+    def users_page(self):
+        rows = self.data.list_users(self.params)
+        page_rows, page, per_page = self._paged(rows)
+        body = "".join(
+            f"<tr data-item-id='{row['id']}'><td><div class='d-inline-flex'>"
+            f"<div class='avatar avatar--6 avatar--rounded'><img src='/avatar.png' alt=''></div>"
+            f"<span>{_e(self.data.full_name(row))}</span></div></td>"
+            f"<td><a href='mailto:{_e(row['email'])}'>{_e(row['email'])}</a></td><td>{_e(row['role'])}</td>"
+            f"{self._actions(UserConstants.URLS['LIST'], row, view=True)}</tr>"
+            for row in page_rows
+        ) or "<tr><td class='text-danger text-center' colspan='8'>No record found</td></tr>"
+        sort = lambda field: [(f"{field} asc", "Ascending"), (f"{field} desc", "Descending")]
+        order_by = self.params.get('order_by', '')
+        content = f"""
+<div class="card"><div class="card__header"><span>{_e(UserConstants.TITLE)}</span>
+<a id="add-user" class="btn btn--primary" href="{UserConstants.URLS['NEW']}">New User</a></div>
+<form class="filters" data-controller="admin--filters" action="{URLs.USERS}">
+<input name="name" class="field field--search" placeholder="Search by User Name" value="{_e(self.params.get('name', ''))}">
+<input name="email" class="field field--search" placeholder="Search by User Email" value="{_e(self.params.get('email', ''))}">
+{self._tom_select('order_by', sort('name'), order_by, select_id='tomselect-1', label='Name')}
+{self._tom_select('order_by_email', sort('email'), order_by, select_id='tomselect-2', label='Email')}
+{self._tom_select('count_per_page', [(count, count) for count in StandinData.PER_PAGE], per_page, select_id='tomselect-3')}
+</form>
+<turbo-frame id="data-table"><p class="overline">Showing <strong>{len(rows)}</strong> records</p>
+<table class="table"><thead><tr>{self._header_buttons(UserConstants.TABLE_HEADERS)}</tr></thead>
+<tbody>{body}</tbody></table>{self._pagination(len(rows), page, per_page)}</turbo-frame></div>"""
+        self._send(200, self._layout(UserConstants.TITLE, content))
+
+    def user_form(self, record=None, errors=None, fields=None):
+        fields = fields or record or {'first_name': '', 'middle_name': '', 'last_name': '', 'email': '', 'role': ''}
+        title = "Edit User" if record else UserFormConstants.TITLE
+        action = f"{UserConstants.URLS['LIST']}/{record['id']}" if record else UserConstants.URLS['LIST']
+        labels = UserFormConstants.FIELDS
+        error_block = ""
+        if errors:
+            error_block = ("<div class='alert alert--soft-danger'><div class='alert__content'><ul>"
+                           + "".join(f"<li>{_e(error)}</li>" for error in errors) + "</ul></div></div>")
+        roles = "".join(f"<option{' selected' if role == fields.get('role') else ''}>{_e(role)}</option>"
+                        for role in StandinData.ROLES)
+        content = f"""
+<div class="card"><div class="card__header"><a data-bs-title="Back" href="{UserConstants.URLS['LIST']}">&lt;</a>
+<span class="fw-bold">{_e(title)}</span></div>
+<div id="formErrorStream">{error_block}</div>
+<form id="new_user" class="card__content" action="{action}" method="post">
+<input type="hidden" name="authenticity_token" value="{_e(self.session['csrf'])}">
+{"<input type='hidden' name='_method' value='patch'>" if record else ""}
+<img id="userPhotoPreview" src="/avatar.png" alt=""><input id="member-photo" type="file" name="user[photo]">
+<input id="remove-photo" type="hidden" name="user[remove_photo]" value="0">
+{self._field('user_first_name', 'user[first_name]', labels['FIRST_NAME']['LABEL'], fields.get('first_name'), labels['FIRST_NAME']['PLACEHOLDER'])}
+{self._field('user_middle_name', 'user[middle_name]', labels['MIDDLE_NAME']['LABEL'], fields.get('middle_name'), labels['MIDDLE_NAME']['PLACEHOLDER'])}
+{self._field('user_last_name', 'user[last_name]', labels['LAST_NAME']['LABEL'], fields.get('last_name'), labels['LAST_NAME']['PLACEHOLDER'])}
+{self._field('user_email', 'user[email]', labels['EMAIL']['LABEL'], fields.get('email'), labels['EMAIL']['PLACEHOLDER'])}
+<div class="field-group"><label class="label label--required" for="division-id">{_e(labels['ROLE']['LABEL'])}</label>
+<select id="division-id" name="user[role]"><option value="">{_e(labels['ROLE']['PLACEHOLDER'])}</option>{roles}</select></div>
+<button class="btn btn--success" type="submit">Save</button>
+<a class="btn btn--outline-danger" href="{UserConstants.URLS['LIST']}">Discard</a>
+</form></div>"""
+        self._send(422 if errors else 200, self._layout(title, content))
+
+    def _user_fields(self):
+        return {key: self.form.get(f"user[{key}]", '').strip()
+                for key in ('first_name', 'middle_name', 'last_name', 'email', 'role')}
+
+    def create_user(self):
+        fields = self._user_fields()
+        errors = self.data.validate_user(fields)
+        if errors:
+            return self.user_form(errors=errors, fields=fields)
+        self.data.users.insert(0, dict(fields, id=self.data._new_id()))
+        self._redirect(UserConstants.URLS['LIST'],
+                       flash=('success', f"{UserFormConstants.MESSAGES['CREATED']} ({fields['email']})"))
+
+    def update_user(self, record):
+        fields = self._user_fields()
+        errors = self.data.validate_user(fields, record)
+        if errors:
+            return self.user_form(record, errors=errors, fields=fields)
+        record.update(fields)
+        self._redirect(UserConstants.URLS['LIST'], flash=('success', f"{UserConstants.MESSAGES['UPDATED']}."))
+
+    # --- delete ---------------------------------------------------------------
+
+    def delete_record(self, kind, records, record):
+        list_path = f"/admin/{kind}"
+        if record.get('in_use'):
+            message = f"Cannot delete {record['name']} because products are still using it."
+            return self._send(422, f"<div class='alert alert--danger'><div class='alert__content'>"
+                                   f"<div class='col'>{_e(message)}</div></div></div>")
+        records.remove(record)
+        messages = CategoryConstants.MESSAGES if kind == 'categories' else UserConstants.MESSAGES
+        self._redirect(list_path, flash=('success', messages['DELETED']))
+
+class StandinApp:
+    """Local stand-in for the admin app, serving the pages the page objects drive
+
+    Reproduces the login form, side menu, categories and users lists (search, TomSelect
+    sort/filter widgets, pagy pagination, delete modal) and the category/user forms
+    with in-memory data. latency_ms (plus up to jitter_ms) is added to every request.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0, jitter_ms=0, **dataset):
+        self.logger = logging.getLogger(__name__)
+        self.data = StandinData(**dataset)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random()
+        self.server = ThreadingHTTPServer((host, port), StandinHandler)
+        self.server.daemon_threads = True
+        self.server.app = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def delay(self):
+        """Sleep for the configured request latency"""
+        delay_ms = self.latency_ms + (self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def start(self):
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self.server.serve_forever, name="standin-app", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Stand-in app listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+# Look and behaviour the locators depend on: visible/hidden states, TomSelect dropdowns,
+# Turbo-style table replacement, the delete modal and the photo gallery
+STYLE = """
+body { font-family: sans-serif; margin: 0; display: flex; }
+.sidebar { width: 220px; background: #222; color: #eee; min-height: 100vh; }
+.sidebar a, .sidebar button { display: block; color: #eee; padding: 6px 12px; background: none; border: 0; text-align: left; width: 100%; }
+.sidebar__logo { width: 32px; height: 32px; }
+.collapse { display: none; } .collapse.show { display: block; }
+.main { flex: 1; padding: 16px; }
+.ts-field { display: inline-block; position: relative; }
+.ts-hidden-accessible { position: absolute; width: 1px; height: 1px; overflow: hidden; border: 0; padding: 0; }
+.ts-control { border: 1px solid #ccc; padding: 4px 24px 4px 8px; min-width: 120px; cursor: pointer; }
+.ts-dropdown { display: none; position: absolute; background: #fff; border: 1px solid #ccc; z-index: 10; min-width: 120px; }
+.ts-wrapper.dropdown-active .ts-dropdown { display: block; }
+.option { padding: 4px 8px; cursor: pointer; }
+.modal { display: none; position: fixed; inset: 0; background: rgba(0,0,0,.4); }
+.modal.show { display: block; }
+.modal-dialog { background: #fff; margin: 80px auto; width: 400px; padding: 16px; }
+.gallery-wrapper { display: none; } .gallery-wrapper--open { display: block; }
+.gallery-photo.selected { outline: 2px solid blue; }
+.alert { padding: 8px; margin: 8px 0; }
+"""
+
+MODAL = """
+<div id="modalDelete" class="modal" tabindex="-1"><div class="modal-dialog"><div class="modal-content">
+<div class="modal-header"><h5 class="modal-title">Delete Record</h5>
+<button type="button" class="modal-close" data-bs-dismiss="modal">&times;</button></div>
+<div class="modal-body"><p>Are you sure you want to delete this record?</p></div>
+<div class="modal-footer"><button type="button" class="btn btn--primary" data-bs-dismiss="modal">Keep Record</button>
+<a id="jsDeleteItem" class="btn btn--outline-danger" href="#" data-turbo-method="delete">Delete</a></div>
+</div></div></div>
+"""
+
+SCRIPT = """
+(function () {
+    const csrf = () => document.querySelector('meta[name="csrf-token"]').content;
+    const frame = () => document.querySelector('turbo-frame#data-table');
+
+    // Turbo-style frame replace: fetch the list with the form's params and swap the table in
+    async function reload(form) {
+        const target = frame();
+        if (!target) return;
+        const params = new URLSearchParams();
+        form.querySelectorAll('input[name], select[name]').forEach((field) => {
+            if (!field.value) return;
+            const name = field.name === 'order_by_email' ? 'order_by' : field.name;
+            params.set(name, field.value);
+        });
+        const url = form.getAttribute('action') + (params.toString() ? '?' + params : '');
+        target.setAttribute('busy', '');
+        const response = await fetch(url, {headers: {'Accept': 'text/html'}});
+        const doc = new DOMParser().parseFromString(await response.text(), 'text/html');
+        target.replaceWith(doc.querySelector('turbo-frame#data-table'));
+        history.replaceState(null, '', url);
+    }
+
+    let searchTimer = null;
+    document.addEventListener('input', (event) => {
+        const form = event.target.closest('form[data-controller="admin--filters"]');
+        if (!form || !event.target.matches('input.field--search')) return;
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(() => reload(form), 250);
+    });
+    document.addEventListener('change', (event) => {
+        const form = event.target.closest('form[data-controller="admin--filters"]');
+        if (form && event.target.matches('select')) reload(form);
+    });
+
+    function closeModal() {
+        document.getElementById('modalDelete').classList.remove('show');
+    }
+
+    document.addEventListener('click', async (event) => {
+        const control = event.target.closest('.ts-control');
+        if (control) {
+            const wrapper = control.closest('.ts-wrapper');
+            document.querySelectorAll('.ts-wrapper.dropdown-active').forEach((open) => {
+                if (open !== wrapper) open.classList.remove('dropdown-active');
+            });
+            wrapper.classList.toggle('dropdown-active');
+            return;
+        }
+        const option = event.target.closest('.ts-dropdown .option');
+        if (option) {
+            const wrapper = option.closest('.ts-wrapper');
+            const select = wrapper.parentElement.querySelector('select');
+            wrapper.classList.remove('dropdown-active');
+            wrapper.querySelector('.ts-control .item').textContent = option.textContent;
+            select.value = option.dataset.value;
+            select.dispatchEvent(new Event('change', {bubbles: true}));
+            return;
+        }
+        const toggle = event.target.closest('button[data-action="collapse"]');
+        if (toggle) {
+            document.getElementById(toggle.getAttribute('aria-controls')).classList.toggle('show');
+            return;
+        }
+        const remove = event.target.closest('a[data-action="click->admin--table#deleteItem"]');
+        if (remove) {
+            event.preventDefault();
+            document.getElementById('jsDeleteItem').setAttribute('href', remove.getAttribute('href'));
+            document.getElementById('modalDelete').classList.add('show');
+            return;
+        }
+        if (event.target.closest('#modalDelete [data-bs-dismiss="modal"]')) {
+            closeModal();
+            return;
+        }
+        const confirm = event.target.closest('#jsDeleteItem');
+        if (confirm) {
+            event.preventDefault();
+            const response = await fetch(confirm.getAttribute('href'), {
+                method: 'DELETE', headers: {'X-CSRF-Token': csrf(), 'Accept': 'text/html'}
+            });
+            closeModal();
+            if (response.ok) {
+                const form = document.querySelector('form[data-controller="admin--filters"]');
+                if (form) await reload(form);
+            } else {
+                const main = document.querySelector('.main');
+                main.insertAdjacentHTML('afterbegin', await response.text());
+            }
+            return;
+        }
+        if (event.target.closest('.js-open-gallery')) {
+            document.getElementById('gallery-wrapper').classList.add('gallery-wrapper--open');
+            return;
+        }
+        if (event.target.closest('.close-gallery')) {
+            document.getElementById('gallery-wrapper').classList.remove('gallery-wrapper--open');
+            return;
+        }
+        const photo = event.target.closest('.gallery-photo');
+        if (photo) {
+            document.querySelectorAll('.gallery-photo.selected').forEach((img) => img.classList.remove('selected'));
+            photo.classList.add('selected');
+            return;
+        }
+        if (event.target.closest('.insert-img')) {
+            event.preventDefault();
+            const selected = document.querySelector('.gallery-photo.selected');
+            if (selected) {
+                document.getElementById('photo-url-field').value = selected.getAttribute('src');
+                document.getElementById('photo-url-field-preview').src = selected.getAttribute('src');
+            }
+            document.getElementById('gallery-wrapper').classList.remove('gallery-wrapper--open');
+            return;
+        }
+        const show = event.target.closest('button[data-controller="admin--show-password"]');
+        if (show) {
+            const field = document.getElementById('user_password');
+            field.type = field.type === 'password' ? 'text' : 'password';
+        }
+    });
+})();
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the admin app")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--categories', type=int, default=60, help="Number of seeded categories")
+    parser.add_argument('--users', type=int, default=40, help="Number of seeded users")
+    parser.add_argument('--latency', type=float, default=0, help="Milliseconds added to every request")
+    parser.add_argument('--jitter', type=float, default=0, help="Up to this many extra random milliseconds")
+    parser.add_argument('--email', default="admin@example.com", help="Login email")
+    parser.add_argument('--password', default="password", help="Login password")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    app = StandinApp(args.host, args.port, latency_ms=args.latency, jitter_ms=args.jitter,
+                     categories=args.categories, users=args.users, email=args.email,
+                     password=args.password, seed=args.seed)
+    app.logger.info(f"Stand-in app on {app.base_url} - log in as {args.email} / {args.password}")
+    try:
+        app.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        app.server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+import re
+from html.parser import HTMLParser
+
+
+class _HTMLTableParser(HTMLParser):
+    """Collects the first .table of a page the same way TableSnapshot.SCRIPT reads it in the browser"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.headers = []
+        self.rows = []
+        self._state = None  # None, 'table' or 'done'
+        self._section = None
+        self._row = None
+        self._cell = None
+        self._header = None
+        self._badge = None
+        self._link = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if self._state is None:
+            if tag == 'table' and 'table' in (attrs.get('class') or '').split():
+                self._state = 'table'
+            return
+        if self._state != 'table':
+            return
+
+        if tag in ('thead', 'tbody'):
+            self._section = tag
+        elif tag == 'tr' and self._section == 'tbody':
+            # Same keys as element.dataset: data-item-id -> itemId
+            data = {
+                re.sub(r'-([a-z])', lambda m: m.group(1).upper(), key[5:]): value or ''
+                for key, value in attrs.items() if key.startswith('data-')
+            }
+            self._row = {'data': data, 'cells': []}
+        elif tag == 'th' and self._section == 'thead':
+            self._header = []
+        elif tag == 'td' and self._row is not None:
+            self._cell = {'text': [], 'badge': None, 'actions': {}, 'colspan': int(attrs.get('colspan') or 1)}
+        elif self._cell is not None:
+            if self._badge is not None:
+                if tag == self._badge['tag']:
+                    self._badge['depth'] += 1
+            elif self._cell['badge'] is None and 'badge' in (attrs.get('class') or '').split():
+                self._badge = {'tag': tag, 'depth': 1, 'text': []}
+            if tag == 'a' and attrs.get('href') is not None:
+                self._link = {'title': attrs.get('data-bs-title'), 'href': attrs['href'], 'text': []}
+
+    def handle_endtag(self, tag):
+        if self._state != 'table':
+            return
+
+        if tag == 'table':
+            self._state = 'done'
+        elif tag in ('thead', 'tbody'):
+            self._section = None
+        elif tag == 'th' and self._header is not None:
+            self.headers.append(_clean(''.join(self._header)))
+            self._header = None
+        elif tag == 'tr' and self._row is not None:
+            cells = self._row['cells']
+            if not (len(cells) == 1 and cells[0]['colspan'] > 1):
+                self.rows.append(self._row)
+            self._row = None
+        elif tag == 'td' and self._cell is not None:
+            self._cell['text'] = _clean(''.join(self._cell['text']))
+            self._row['cells'].append(self._cell)
+            self._cell = self._badge = self._link = None
+        elif self._cell is not None:
+            if self._badge is not None and tag == self._badge['tag']:
+                self._badge['depth'] -= 1
+                if self._badge['depth'] == 0:
+                    self._cell['badge'] = _clean(''.join(self._badge['text']))
+                    self._badge = None
+            if tag == 'a' and self._link is not None:
+                title = self._link['title'] or _clean(''.join(self._link['text']))
+                self._cell['actions'][title] = self._link['href']
+                self._link = None
+
+    def handle_data(self, data):
+        if self._header is not None:
+            self._header.append(data)
+        if self._cell is not None:
+            self._cell['text'].append(data)
+            if self._badge is not None:
+                self._badge['text'].append(data)
+            if self._link is not None:
+                self._link['text'].append(data)
+
+
+def _clean(value):
+    return re.sub(r'\s+', ' ', value or '').strip()
+
+
+class TableSnapshot:
+    """Column-oriented copy of an HTML table taken in a single WebDriver call
+
+    Columns are 1-based to match the TableColumns constants. Each column keeps the
+    cell text, the text of the first .badge in the cell and the cell's action links
+    (keyed by their data-bs-title, or link text when there is no title).
+    """
+
+    # Reads every row of a table (element or CSS selector) in one round trip. Rows
+    # made of a single spanning cell ("No record found") are skipped.
+    SCRIPT = """
+        const table = typeof arguments[0] === 'string' ? document.querySelector(arguments[0]) : arguments[0];
+        if (!table) return null;
+        const clean = (value) => (value || '').replace(/\\s+/g, ' ').trim();
+        const headers = Array.from(table.querySelectorAll('thead th'), (th) => clean(th.innerText));
+        const rows = Array.from(table.querySelectorAll('tbody tr')).filter(
+            (tr) => !(tr.cells.length === 1 && tr.cells[0].colSpan > 1)
+        );
+        const width = Math.max(headers.length, 0, ...rows.map((tr) => tr.cells.length));
+        const columns = Array.from({length: width}, () => ({text: [], badge: [], actions: []}));
+        rows.forEach((tr) => {
+            columns.forEach((column, index) => {
+                const td = tr.cells[index];
+                const badge = td && td.querySelector('.badge');
+                const actions = {};
+                if (td) {
+                    td.querySelectorAll('a[href]').forEach((a) => {
+                        actions[a.getAttribute('data-bs-title') || clean(a.innerText)] = a.getAttribute('href');
+                    });
+                }
+                column.text.push(td ? clean(td.innerText) : '');
+                column.badge.push(badge ? clean(badge.innerText) : null);
+                column.actions.push(actions);
+            });
+        });
+        return {headers: headers, columns: columns, data: rows.map((tr) => Object.assign({}, tr.dataset)), rows: rows};
+    """
+
+    def __init__(self, headers=None, columns=None, row_data=None, elements=None, url=None):
+        self.headers = headers or []
+        self.columns = columns or []
+        self.row_data = row_data or []
+        self.elements = elements or []
+        self.url = url
+        self._indexes = {}
+
+    @classmethod
+    def from_script_result(cls, result):
+        """Build a snapshot from the value returned by SCRIPT"""
+        if not result:
+            return cls()
+        return cls(result['headers'], result['columns'], result['data'], result['rows'])
+
+    @classmethod
+    def from_html(cls, page_source):
+        """Build a snapshot from the first .table in a page's HTML, for reads done without a browser"""
+        parser = _HTMLTableParser()
+        parser.feed(page_source)
+        parser.close()
+
+        rows = parser.rows
+        width = max([len(parser.headers)] + [len(row['cells']) for row in rows])
+        columns = [{'text': [], 'badge': [], 'actions': []} for _ in range(width)]
+        for row in rows:
+            for index, column in enumerate(columns):
+                cell = row['cells'][index] if index < len(row['cells']) else None
+                column['text'].append(cell['text'] if cell else '')
+                column['badge'].append(cell['badge'] if cell else None)
+                column['actions'].append(cell['actions'] if cell else {})
+        return cls(parser.headers, columns, [row['data'] for row in rows])
+
+    def __len__(self):
+        return len(self.row_data)
+
+    def _column(self, column):
+        index = int(column) - 1
+        if 0 <= index < len(self.columns):
+            return self.columns[index]
+        return {'text': [''] * len(self), 'badge': [None] * len(self), 'actions': [{}] * len(self)}
+
+    def index(self, column):
+        """Row position of each cell text in a column (first occurrence wins), built once per column"""
+        key = str(column)
+        if key not in self._indexes:
+            positions = {}
+            for position, text in enumerate(self.text(column)):
+                positions.setdefault(text, position)
+            self._indexes[key] = positions
+        return self._indexes[key]
+
+    def row(self, column, key):
+        """Row element whose cell in column has the given text, None if missing"""
+        position = self.index(column).get(key)
+        if position is None or position >= len(self.elements):
+            return None
+        return self.elements[position]
+
+    def text(self, column):
+        """Text of every cell in a column"""
+        return self._column(column)['text']
+
+    def badge(self, column):
+        """Badge text of every cell in a column (None where the cell has no badge)"""
+        return self._column(column)['badge']
+
+    def actions(self, column):
+        """Action links of every cell in a column as {title: href} dicts"""
+        return self._column(column)['actions']
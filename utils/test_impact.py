@@ -0,0 +1,395 @@
+import ast
+import fnmatch
+import logging
+import os
+import re
+import subprocess
+from collections import defaultdict, deque
+
+class _Module:
+    """Definitions of one source file and the line each of them spans"""
+
+    def __init__(self, name, path, source):
+        self.name = name
+        self.path = path
+        self.lines = source.splitlines()
+        self.tree = ast.parse(source, filename=path)
+        self.imports = {}
+        self.defs = {}  # symbol id -> (kind, node, parent id)
+        self.owners = [name] * (len(self.lines) + 2)  # line -> innermost symbol id
+        self._define(self.tree.body, "", name)
+
+    def _define(self, body, prefix, parent):
+        for node in body:
+            if isinstance(node, ast.ClassDef):
+                entries = [(node.name, 'class')]
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                entries = [(node.name, 'function')]
+            elif isinstance(node, ast.Assign):
+                entries = [(target.id, 'attribute') for target in node.targets if isinstance(target, ast.Name)]
+            elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+                entries = [(node.target.id, 'attribute')]
+            else:
+                continue  # Belongs to the enclosing class or module
+            start = min([node.lineno] + [decorator.lineno for decorator in getattr(node, 'decorator_list', [])])
+            for name, kind in entries:
+                symbol = f"{self.name}:{prefix}{name}"
+                self.defs[symbol] = (kind, node, parent)
+                for line in range(start, node.end_lineno + 1):
+                    self.owners[line] = symbol
+                if kind == 'class':
+                    self._define(node.body, f"{prefix}{name}.", symbol)
+
+    def changed(self, lines):
+        """Symbols owning the given lines, blank and comment-only lines don't count"""
+        symbols = set()
+        for line in lines:
+            if 0 < line <= len(self.lines):
+                text = self.lines[line - 1].strip()
+                if text and not text.startswith('#'):
+                    symbols.add(self.owners[line])
+        return symbols
+
+
+class DependencyMap:
+    """Which page objects, locators and data.constants entries each test uses, read from the source
+
+    Every module of `packages` is parsed, nothing is imported. Symbols are module
+    level names and class members, e.g. "pages.categories_page:CategoriesPage.TABLE".
+    A symbol depends on what its code references through imports, `self`, page objects
+    assigned to attributes or variables (`self.categories_page = CategoriesPage(driver)`)
+    and base classes; `self.X` in a base class also reaches the subclasses' X. An
+    attribute of an object of unknown type (a fixture argument, a return value)
+    reaches every page and constants member with that name, so guesses err towards
+    running a test.
+
+    A test depends on its own code, the fixtures and helpers of its class and module,
+    and everything tests/conftest.py uses, since that runs for every test.
+    """
+
+    PACKAGES = ('pages', 'data', 'tests')
+    CONFTEST = 'tests/conftest.py'
+    # Changes that never affect a test; any other change outside the parsed packages affects all of them
+    IGNORED = ('*.md', 'scripts/*', 'docs/*', 'reports/*', 'logs/*', '.gitignore')
+
+    def __init__(self, root=".", packages=PACKAGES, ignored=IGNORED):
+        self.logger = logging.getLogger(__name__)
+        self.root = os.path.abspath(root)
+        self.packages = packages
+        self.ignored = ignored
+        self.modules = {}
+        self.defs = {}
+        self._mro = {}
+        self._types = defaultdict(dict)  # class id -> attribute -> class id of the object assigned to it
+        self._subclasses = defaultdict(set)
+        self._by_name = defaultdict(set)
+        self.edges = {}
+        self.tests = {}
+        self._shared = None
+        self._build()
+
+    # --- parsing --------------------------------------------------------------
+
+    def _build(self):
+        for package in self.packages:
+            for folder, _, files in os.walk(os.path.join(self.root, package)):
+                for file in sorted(files):
+                    if file.endswith('.py'):
+                        path = os.path.relpath(os.path.join(folder, file), self.root).replace(os.sep, '/')
+                        self._add(path)
+
+        for module in self.modules.values():
+            self._imports(module)
+            self.defs.update(module.defs)
+        for symbol, (kind, node, _) in self.defs.items():
+            if kind == 'class':
+                self._mro[symbol] = [self._resolve(base, self._context(symbol), set())[1] for base in node.bases]
+        for symbol in list(self._mro):
+            self._mro[symbol] = self._linearize(symbol, [])
+            for base in self._mro[symbol][1:]:
+                self._subclasses[base].add(symbol)
+        for symbol, (kind, node, parent) in self.defs.items():
+            if kind == 'function' and self.defs.get(parent, ('',))[0] == 'class':
+                self._collect_types(parent, node)
+            if symbol.split(':')[0].split('.')[0] in ('pages', 'data') and parent in self._mro:
+                self._by_name[symbol.rsplit('.', 1)[-1]].add(symbol)
+
+        for symbol in self.defs:
+            self.edges[symbol] = self._references(symbol) | {self.defs[symbol][2]}
+        for module in self.modules.values():
+            if os.path.basename(module.path).startswith('test_'):
+                self._collect_tests(module)
+
+    def _add(self, path):
+        name = self._module_name(path)
+        try:
+            with open(os.path.join(self.root, path), 'r', encoding='utf-8') as f:
+                self.modules[name] = _Module(name, path, f.read())
+        except (OSError, SyntaxError, ValueError) as e:
+            self.logger.warning(f"Skipping {path}: {str(e)}")
+
+    def _imports(self, module):
+        package = module.name if module.path.endswith('__init__.py') else module.name.rpartition('.')[0]
+        for node in ast.walk(module.tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    module.imports[alias.asname or alias.name.split('.')[0]] = alias.name if alias.asname else alias.name.split('.')[0]
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    parts = package.split('.')
+                    base = '.'.join(filter(None, parts[:len(parts) - node.level + 1] + [node.module]))
+                for alias in node.names:
+                    target = f"{base}.{alias.name}"
+                    module.imports[alias.asname or alias.name] = target if target in self.modules else f"{base}:{alias.name}"
+
+    def _linearize(self, symbol, seen):
+        order = [symbol]
+        for base in self._mro.get(symbol, []):
+            if base in self._mro and base not in seen + order:
+                order += [cls for cls in self._linearize(base, seen + order) if cls not in order]
+        return order
+
+    def _context(self, symbol):
+        module = self.modules[symbol.split(':')[0]]
+        kind, _, parent = self.defs[symbol]
+        cls = parent if parent in self.defs and self.defs[parent][0] == 'class' else None
+        return {'module': module, 'class': cls if kind == 'function' else None, 'locals': {}}
+
+    def _collect_types(self, cls, function):
+        context = self._context(f"{cls}.{function.name}")
+        for node in ast.walk(function):
+            if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
+                kind, value = self._resolve(node.value.func, context, set())
+                for target in node.targets:
+                    if (kind == 'class' and isinstance(target, ast.Attribute)
+                            and isinstance(target.value, ast.Name) and target.value.id == 'self'):
+                        self._types[cls][target.attr] = value
+
+    # --- references -----------------------------------------------------------
+
+    def _references(self, symbol):
+        kind, node, _ = self.defs[symbol]
+        context = self._context(symbol)
+        refs = set()
+        if kind == 'class':
+            for part in node.bases + node.keywords + node.decorator_list:
+                self._visit(part, context, refs)
+            return refs
+        if kind == 'function':
+            for child in ast.walk(node):
+                if isinstance(child, ast.Assign) and isinstance(child.value, ast.Call):
+                    value_kind, value = self._resolve(child.value.func, context, set())
+                    for target in child.targets:
+                        if value_kind == 'class' and isinstance(target, ast.Name):
+                            context['locals'][target.id] = value
+        self._visit(node if kind == 'function' else node.value, context, refs)
+        return refs
+
+    def _visit(self, node, context, refs):
+        if node is None:
+            return
+        if isinstance(node, (ast.Name, ast.Attribute, ast.Call)):
+            self._resolve(node, context, refs)
+            return
+        for child in ast.iter_child_nodes(node):
+            self._visit(child, context, refs)
+
+    def _member(self, cls, name):
+        for base in self._mro.get(cls, [cls]):
+            if f"{base}.{name}" in self.defs:
+                return f"{base}.{name}"
+        return None
+
+    def _value(self, target, refs):
+        """What an imported or module level name refers to"""
+        if target in self.modules:
+            return 'module', target
+        if target in self.defs:
+            refs.add(target)
+            return ('class' if self.defs[target][0] == 'class' else 'symbol'), target
+        if target.split(':')[0] in self.modules:
+            refs.add(target)  # No longer defined, still matches a diff that removed it
+            return None, None
+        return 'external', None
+
+    def _resolve(self, node, context, refs):
+        """(kind, symbol) of an expression, recording the symbols it uses in refs
+
+        kind is 'module', 'class', 'instance' (of a class), 'symbol', 'external' for
+        things outside the parsed packages, or None when it can't be told.
+        """
+        module = context['module']
+        if isinstance(node, ast.Name):
+            if node.id in context['locals']:
+                return 'instance', context['locals'][node.id]
+            if node.id in ('self', 'cls') and context['class']:
+                return 'instance', context['class']
+            if f"{module.name}:{node.id}" in self.defs:
+                return self._value(f"{module.name}:{node.id}", refs)
+            if node.id in module.imports:
+                return self._value(module.imports[node.id], refs)
+            return None, None
+
+        if isinstance(node, ast.Attribute):
+            kind, value = self._resolve(node.value, context, refs)
+            if kind == 'module':
+                target = f"{value}.{node.attr}"
+                return self._value(target if target in self.modules else f"{value}:{node.attr}", refs)
+            if kind in ('class', 'instance'):
+                member = self._member(value, node.attr)
+                if member:
+                    refs.add(member)
+                    if isinstance(node.value, ast.Name) and node.value.id in ('self', 'cls'):
+                        refs.update(f"{sub}.{node.attr}" for sub in self._subclasses[value]
+                                    if f"{sub}.{node.attr}" in self.defs)
+                    return ('class' if self.defs[member][0] == 'class' else 'symbol'), member
+                for base in self._mro.get(value, [value]):
+                    if node.attr in self._types[base]:
+                        return 'instance', self._types[base][node.attr]
+                if not node.attr.startswith('__'):
+                    refs.add(f"{value}.{node.attr}")
+                return None, None
+            if kind == 'external':
+                return 'external', None
+            refs.update(self._by_name.get(node.attr, ()))
+            return None, None
+
+        if isinstance(node, ast.Call):
+            kind, value = self._resolve(node.func, context, refs)
+            for arg in node.args + [keyword.value for keyword in node.keywords]:
+                self._visit(arg, context, refs)
+            if kind == 'class':
+                init = self._member(value, '__init__')
+                if init:
+                    refs.add(init)
+                return 'instance', value
+            return ('external', None) if kind == 'external' else (None, None)
+
+        self._visit(node, context, refs)
+        return None, None
+
+    # --- tests ----------------------------------------------------------------
+
+    def _collect_tests(self, module):
+        helpers = [symbol for symbol, (_, _, parent) in module.defs.items()
+                  if parent == module.name and not symbol.split(':')[1].startswith(('test_', 'Test'))]
+        for symbol, (kind, _, parent) in module.defs.items():
+            qualname = symbol.split(':')[1]
+            name = qualname.rsplit('.', 1)[-1]
+            if kind != 'function' or not name.startswith('test_'):
+                continue
+            roots = [symbol] + helpers
+            if parent != module.name:
+                if not parent.split(':')[1].startswith('Test'):
+                    continue
+                roots += [member for member, (_, _, owner) in module.defs.items()
+                          if owner == parent and not member.rsplit('.', 1)[-1].startswith('test_')]
+            self.tests[f"{module.path}::{qualname.replace('.', '::')}"] = self.closure(roots)
+
+    def closure(self, roots):
+        """Every symbol reachable from roots"""
+        seen = set(roots)
+        queue = deque(roots)
+        while queue:
+            for symbol in self.edges.get(queue.popleft(), ()):
+                if symbol not in seen:
+                    seen.add(symbol)
+                    queue.append(symbol)
+        return seen
+
+    @property
+    def shared(self):
+        """Symbols every test depends on: whatever tests/conftest.py uses"""
+        if self._shared is None:
+            conftest = self._module_name(self.CONFTEST)
+            self._shared = self.closure([conftest] + list(self.modules[conftest].defs)) if conftest in self.modules else set()
+        return self._shared
+
+    def dependencies(self, nodeid):
+        """Page object, locator and constants symbols a test uses (pytest parameters in the nodeid are ignored)"""
+        own = self.tests.get(nodeid.split('[')[0], set())
+        return sorted(symbol for symbol in own | self.shared
+                      if not symbol.startswith('tests.') and (symbol in self.defs or symbol in self.modules))
+
+    # --- changes --------------------------------------------------------------
+
+    def _git(self, *args):
+        return subprocess.run(['git', *args], cwd=self.root, capture_output=True, text=True, check=True).stdout
+
+    def changed(self, base):
+        """Symbols changed since the merge base of base and HEAD, committed or not, plus changed files outside the packages
+
+        Lines of the base version map to the symbols they belonged to then, so
+        removed symbols count too.
+        """
+        merge_base = self._git('merge-base', base, 'HEAD').strip() or base
+        old_lines, new_lines = defaultdict(set), defaultdict(set)
+        old_path = new_path = None
+        for line in self._git('diff', '-U0', '--no-color', '--no-renames', '--relative', merge_base).splitlines():
+            if line.startswith('--- '):
+                old_path = None if line == '--- /dev/null' else line[6:]
+            elif line.startswith('+++ '):
+                new_path = None if line == '+++ /dev/null' else line[6:]
+            elif line.startswith('@@'):
+                match = re.match(r'@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@', line)
+                old_start, old_count, new_start, new_count = match.groups()
+                if old_path:
+                    old_lines[old_path].update(range(int(old_start), int(old_start) + int(old_count or 1)))
+                if new_path:
+                    new_lines[new_path].update(range(int(new_start), int(new_start) + int(new_count or 1)))
+        for path in self._git('ls-files', '--others', '--exclude-standard').splitlines():
+            new_lines[path].update(range(1, self._line_count(path) + 1))
+
+        symbols, files = set(), set()
+        for path in set(old_lines) | set(new_lines):
+            if any(fnmatch.fnmatch(path, pattern) for pattern in self.ignored):
+                continue
+            if not (path.endswith('.py') and path.split('/')[0] in self.packages):
+                files.add(path)
+                continue
+            try:
+                if old_lines.get(path):
+                    old = _Module(self._module_name(path), path, self._git('show', f"{merge_base}:./{path}"))
+                    symbols |= old.changed(old_lines[path])
+                if new_lines.get(path):
+                    module = self.modules.get(self._module_name(path))
+                    if module is None:
+                        raise SyntaxError("not parsed")
+                    symbols |= module.changed(new_lines[path])
+            except (SyntaxError, ValueError, subprocess.CalledProcessError):
+                files.add(path)  # Can't tell what changed inside it
+        return symbols, files
+
+    def _line_count(self, path):
+        try:
+            with open(os.path.join(self.root, path), 'rb') as f:
+                return sum(1 for _ in f)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _module_name(path):
+        name = path[:-3].replace('/', '.')
+        return name[:-len('.__init__')] if name.endswith('.__init__') else name
+
+    def affected(self, base):
+        """Tests affected by the changes since base, each with the changed symbols or files behind it
+
+        Changes to files outside the parsed packages (utils, config, requirements) and to
+        anything conftest uses affect every test.
+        """
+        symbols, files = self.changed(base)
+        everything = sorted(files | (symbols & self.shared))
+        if everything:
+            return {nodeid: everything for nodeid in self.tests}
+        affected = {}
+        for nodeid, dependencies in self.tests.items():
+            reasons = symbols & dependencies
+            if reasons:
+                affected[nodeid] = sorted(reasons)
+        return affected
+
+    def to_dict(self):
+        """Each test's page object, locator and constants symbols"""
+        return {nodeid: self.dependencies(nodeid) for nodeid in sorted(self.tests)}
@@ -0,0 +1,152 @@
+import json
+import logging
+import os
+import sys
+from collections import defaultdict
+from time import perf_counter
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.wait import WebDriverWait
+
+def describe_condition(method):
+    """Readable name of a wait condition, with its locator when it closes over one"""
+    name = getattr(method, '__qualname__', None) or type(method).__name__
+    name = name.split('.<locals>')[0]
+    for cell in getattr(method, '__closure__', None) or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        if isinstance(value, tuple) and len(value) == 2 and all(isinstance(part, str) for part in value):
+            return f"{name}({value[0]}={value[1]})"
+    locator = getattr(method, 'locator', None)
+    return f"{name}({locator[0]}={locator[1]})" if locator else name
+
+# Module of WebDriverWait, a frame of it on the stack means a wait is polling
+WAIT_MODULE = "selenium.webdriver.support.wait"
+
+def page_caller(waiting=False):
+    """Outermost page-object method ('Class.method') on the current stack, None outside page objects
+
+    With waiting=True returns (caller, waiting) instead, waiting telling whether the stack
+    is inside a WebDriverWait or a page's wait_* method.
+    """
+    caller = None
+    inside_wait = False
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module.startswith('pages.'):
+            inside_wait = inside_wait or frame.f_code.co_name.startswith('wait')
+            if 'self' in frame.f_locals and frame.f_code.co_name != '<lambda>':
+                caller = f"{type(frame.f_locals['self']).__name__}.{frame.f_code.co_name}"
+        elif caller is not None:
+            break  # Back in the test that called the page object
+        elif module == WAIT_MODULE:
+            inside_wait = True
+        frame = frame.f_back
+    return (caller, inside_wait) if waiting else caller
+
+class WaitStats:
+    """Collects how long each wait of the running test took against its timeout
+
+    Waits that use more than slow_ratio of their timeout are logged as slow. The
+    conftest drains the records after each test into the report data, so they reach
+    the controller's WaitReport also when running under xdist.
+    """
+
+    def __init__(self, slow_ratio=0.5):
+        self.logger = logging.getLogger('waits')
+        self.slow_ratio = slow_ratio
+        self.records = []
+
+    def record(self, condition, timeout, elapsed, outcome):
+        caller = page_caller()
+        slow = outcome == 'ok' and bool(timeout) and elapsed >= self.slow_ratio * timeout
+        self.records.append({
+            'caller': caller,
+            'condition': condition,
+            'timeout': timeout,
+            'elapsed': elapsed,
+            'outcome': outcome,
+            'slow': slow
+        })
+        if slow:
+            self.logger.warning(
+                f"Slow wait: {caller or 'test'} waited {elapsed:.2f}s of {timeout}s for {condition}"
+            )
+
+    def drain(self):
+        """Records collected since the last drain"""
+        records, self.records = self.records, []
+        return records
+
+# Shared by every page object of this process
+wait_stats = WaitStats()
+
+class TimedWait(WebDriverWait):
+    """WebDriverWait that reports each wait to wait_stats and names the condition on timeout"""
+
+    def until(self, method, message=""):
+        return self._timed(super().until, method, message)
+
+    def until_not(self, method, message=""):
+        return self._timed(super().until_not, method, message)
+
+    def _timed(self, wait, method, message):
+        condition = describe_condition(method)
+        started = perf_counter()
+        outcome = 'ok'
+        try:
+            return wait(method, message)
+        except TimeoutException as e:
+            outcome = 'timeout'
+            raise TimeoutException(
+                f"{message or condition} not met within {self._timeout}s", e.screen, e.stacktrace
+            ) from e
+        finally:
+            wait_stats.record(condition, self._timeout, perf_counter() - started, outcome)
+
+class WaitReport:
+    """Ranks the waits of a whole run, merged from every test's records"""
+
+    def __init__(self):
+        self._waits = defaultdict(lambda: {'count': 0, 'total': 0.0, 'max': 0.0, 'timeout': 0, 'slow': 0, 'timeouts': 0})
+
+    def add(self, records):
+        for record in records:
+            wait = self._waits[(record['caller'] or '(test)', record['condition'])]
+            wait['count'] += 1
+            wait['total'] += record['elapsed']
+            wait['max'] = max(wait['max'], record['elapsed'])
+            wait['timeout'] = max(wait['timeout'], record['timeout'] or 0)
+            wait['timeouts'] += record['outcome'] == 'timeout'
+            wait['slow'] += record['slow']
+
+    def ranked(self, limit=None):
+        """Waits sorted by their slowest occurrence"""
+        waits = [
+            dict(caller=caller, condition=condition, mean=wait['total'] / wait['count'], **wait)
+            for (caller, condition), wait in self._waits.items()
+        ]
+        waits.sort(key=lambda wait: (wait['max'], wait['total']), reverse=True)
+        return waits[:limit] if limit else waits
+
+    def table(self, limit=20):
+        """Slowest waits as text lines for the terminal summary"""
+        lines = [f"{'max':>7} {'mean':>7} {'timeout':>7} {'count':>5} {'slow':>4} {'fail':>4}  caller / condition"]
+        for wait in self.ranked(limit):
+            lines.append(
+                f"{wait['max']:>6.2f}s {wait['mean']:>6.2f}s {wait['timeout']:>6}s {wait['count']:>5} "
+                f"{wait['slow']:>4} {wait['timeouts']:>4}  {wait['caller']} / {wait['condition']}"
+            )
+        return lines
+
+    def write(self, path):
+        """Save the full ranking as JSON"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.ranked(), f, indent=2)
+        return path
+
+    def __len__(self):
+        return len(self._waits)
@@ -1,82 +1,149 @@
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import SessionNotCreatedException
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
+from utils.driver_cache import DriverCache
+from utils.request_interceptor import RequestInterceptor
 import logging
-from functools import lru_cache
+import os
+import queue
+import threading
 from time import time
 
 class WebDriverFactory:
+    """Launches browsers from named launch profiles
+
+    default    - maximized, headed Chrome as used for local runs
+    lean       - minimal logging and automation switches, fixed timeouts
+    throughput - new headless mode, fixed viewport, background services off, images
+                 and fonts blocked and a disk cache shared by the worker's browsers
+    """
+
+    PROFILES = {
+        'default': {
+            'arguments': ['--start-maximized', '--disable-extensions', '--disable-notifications'],
+        },
+        'lean': {
+            'arguments': ['--no-sandbox', '--disable-dev-shm-usage', '--log-level=3'],
+            'exclude_switches': ['enable-automation', 'enable-logging'],
+        },
+        'throughput': {
+            'arguments': [
+                '--window-size=1366,900',
+                '--disable-gpu',
+                '--disable-extensions',
+                '--disable-background-networking',
+                '--disable-component-update',
+                '--disable-default-apps',
+                '--disable-sync',
+                '--disable-notifications',
+                '--disable-dev-shm-usage',
+                '--no-first-run',
+                '--mute-audio',
+                '--log-level=3',
+            ],
+            'exclude_switches': ['enable-automation', 'enable-logging'],
+            'headless': True,
+            'block_media': True,
+            'disk_cache': True,
+        },
+    }
+
+    # Disable password saving, autofill and popups in every profile
+    PREFS = {
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False,
+        "profile.default_content_setting_values.notifications": 2,
+        "autofill.profile_enabled": False,
+        "profile.default_content_settings.popups": 0
+    }
+
+    # RequestInterceptor groups blocked by block_media, see set_media_blocking()
+    MEDIA_GROUPS = ('image', 'font')
+
+    # Resolved chromedriver binaries shared by all processes, see DriverCache. Created by
+    # the first launch, in the directory it names (Config.driver_cache_dir)
+    driver_cache = None
+    _driver_path = None
+    _driver_lock = threading.Lock()
+
     @classmethod
-    @lru_cache(maxsize=1)  # Cache ChromeDriver installation
-    def _get_driver_path(cls):
-        """Cache the ChromeDriver path to avoid repeated downloads"""
-        return ChromeDriverManager().install()
+    def _get_driver_path(cls, cache_dir=None):
+        """ChromeDriver path, resolved once per process through the on-disk cache in cache_dir
 
-    @staticmethod
-    def clear_cache():
-        """Clear the driver path cache to force new download"""
-        WebDriverFactory._get_driver_path.cache_clear()
+        None when no driver could be resolved, Selenium Manager picks one then.
+        """
+        with cls._driver_lock:  # Pooled browsers launch from several threads
+            if cls.driver_cache is None:
+                cls.driver_cache = DriverCache(cache_dir) if cache_dir else DriverCache()
+            if cls._driver_path is None:
+                cls._driver_path = cls.driver_cache.resolve(lambda: ChromeDriverManager().install()) or ""
+            return cls._driver_path or None
+
+    @classmethod
+    def clear_cache(cls, cache_dir=None):
+        """Forget the resolved driver path to force a new download"""
+        with cls._driver_lock:
+            cls._driver_path = None
+            driver_cache = cls.driver_cache or (DriverCache(cache_dir) if cache_dir else DriverCache())
+        driver_cache.clear()
 
     @classmethod
     def get_driver(cls):
-        """Get optimized WebDriver instance"""
-        try:
-            # Silence WDM and Selenium logging
-            logging.getLogger('WDM').setLevel(logging.ERROR)
-            logging.getLogger('selenium').setLevel(logging.ERROR)
-            
-            chrome_options = webdriver.ChromeOptions()
-            # Essential options only
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--log-level=3')  # Minimal Chrome logging
-            chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-            chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
-            
-            service = Service(
-                cls._get_driver_path(),
-                log_path=None  # Disable service logging
-            )
-            
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(30)  # Set page load timeout
-            driver.implicitly_wait(5)  # Set implicit wait
-            
-            return driver
+        """Get optimized WebDriver instance (the lean profile)"""
+        return cls.create_driver(profile="lean")
 
-        except Exception as e:
-            logging.error(f"Failed to initialize WebDriver: {str(e)}")
-            raise
+    @classmethod
+    def build_options(cls, profile="default", headless=None, cache_dir=None):
+        """Chrome options for a launch profile, headless overrides the profile's own setting"""
+        if profile not in cls.PROFILES:
+            raise ValueError(f"Unknown browser profile: {profile}. Use one of {tuple(cls.PROFILES)}")
+        settings = cls.PROFILES[profile]
 
-    @staticmethod
-    def create_driver(browser_type="chrome"):
-        """Create WebDriver instance with configured options"""
+        chrome_options = Options()
+        for argument in settings['arguments']:
+            chrome_options.add_argument(argument)
+        if settings.get('headless') if headless is None else headless:
+            chrome_options.add_argument('--headless=new')
+            if '--start-maximized' in settings['arguments']:
+                chrome_options.add_argument('--window-size=1920,1080')  # No screen to maximize to
+        if settings.get('disk_cache') and cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            chrome_options.add_argument(f'--disk-cache-dir={os.path.abspath(cache_dir)}')
+        chrome_options.add_experimental_option("prefs", dict(cls.PREFS))
+        chrome_options.add_experimental_option("excludeSwitches", settings.get('exclude_switches', ['enable-automation']))
+        return chrome_options
+
+    @classmethod
+    def create_driver(cls, browser_type="chrome", profile="default", headless=None, cache_dir=None,
+                      driver_cache_dir=None):
+        """Create WebDriver instance from a launch profile, driver_cache_dir is where resolved chromedrivers are kept"""
         logger = logging.getLogger(__name__)
         
         if browser_type.lower() == "chrome":
             try:
-                # Set up Chrome options
-                chrome_options = Options()
-                chrome_options.add_argument('--start-maximized')
-                chrome_options.add_argument('--disable-extensions')
-                chrome_options.add_argument('--disable-notifications')
-                
-                # Disable password saving and autofill
-                prefs = {
-                    "credentials_enable_service": False,
-                    "profile.password_manager_enabled": False,
-                    "profile.default_content_setting_values.notifications": 2,
-                    "autofill.profile_enabled": False,
-                    "profile.password_manager_enabled": False,
-                    "profile.default_content_settings.popups": 0
-                }
-                chrome_options.add_experimental_option("prefs", prefs)
-                chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+                # Silence WDM and Selenium logging
+                logging.getLogger('WDM').setLevel(logging.ERROR)
+                logging.getLogger('selenium').setLevel(logging.ERROR)
                 
-                # Initialize driver with options
-                driver = webdriver.Chrome(options=chrome_options)
-                logger.info("Chrome WebDriver created successfully")
+                driver_path = cls._get_driver_path(driver_cache_dir)
+                service = Service(executable_path=driver_path) if driver_path else Service()
+                try:
+                    driver = webdriver.Chrome(service=service, options=cls.build_options(profile, headless, cache_dir))
+                except SessionNotCreatedException:
+                    # Most likely Chrome updated past the cached driver, resolve again next launch
+                    if driver_path:
+                        cls.driver_cache.mark_bad(driver_path)
+                        with cls._driver_lock:
+                            cls._driver_path = None
+                    raise
+                driver.set_page_load_timeout(30)
+                driver.implicitly_wait(0)  # Explicit and settle waits only
+                driver.interceptor = RequestInterceptor(driver)
+                if cls.PROFILES[profile].get('block_media'):
+                    cls.set_media_blocking(driver, True)
+                logger.info(f"Chrome WebDriver created with the {profile} profile")
                 return driver
                 
             except Exception as e:
@@ -84,3 +151,122 @@ class WebDriverFactory:
                 raise
         else:
             raise ValueError(f"Unsupported browser type: {browser_type}")
+
+    @classmethod
+    def set_media_blocking(cls, driver, enabled):
+        """Block (or stop blocking) the profile's image and font requests"""
+        interceptor = getattr(driver, 'interceptor', None) or RequestInterceptor(driver)
+        driver.interceptor = interceptor
+        if not interceptor.block('profile', cls.MEDIA_GROUPS if enabled else ()):
+            return False
+        driver.media_blocked = enabled
+        return True
+
+
+class WebDriverPool:
+    """Keeps a fixed number of warm WebDriver instances and hands them out per test"""
+
+    def __init__(self, size=2, max_uses=25, factory=None):
+        self.logger = logging.getLogger(__name__)
+        self.size = max(1, int(size))
+        self.max_uses = max(1, int(max_uses))
+        self.factory = factory or WebDriverFactory.create_driver
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self):
+        """Pre-launch the pool's browsers in parallel"""
+        threads = [threading.Thread(target=self._launch, daemon=True) for _ in range(self.size)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.logger.info(f"WebDriver pool started with {self._idle.qsize()} browsers")
+        return self
+
+    def _launch(self):
+        """Create a new browser and put it in the idle queue"""
+        try:
+            started = time()
+            driver = self.factory()
+            with self._lock:
+                self._uses[id(driver)] = 0
+            self._idle.put(driver)
+            self.logger.info(f"Pooled browser launched in {time() - started:.2f}s")
+        except Exception as e:
+            self.logger.error(f"Failed to launch pooled browser: {str(e)}")
+
+    def _replace(self):
+        """Launch a replacement browser in the background"""
+        if not self._closed:
+            threading.Thread(target=self._launch, daemon=True).start()
+
+    def acquire(self, timeout=60):
+        """Get a warm browser from the pool, launching one if none is ready"""
+        try:
+            driver = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            self.logger.warning("No pooled browser available, launching a new one")
+            driver = self.factory()
+        with self._lock:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        return driver
+
+    def release(self, driver):
+        """Reset browser state and return it to the pool, recycling worn out or crashed browsers"""
+        with self._lock:
+            uses = self._uses.get(id(driver), 0)
+
+        if self._closed or self._idle.qsize() >= self.size:
+            self._discard(driver)
+            return
+
+        if uses >= self.max_uses or not self.reset(driver):
+            self.logger.info(f"Recycling pooled browser after {uses} uses")
+            self._discard(driver)
+            self._replace()
+            return
+
+        self._idle.put(driver)
+
+    def reset(self, driver):
+        """Clear cookies, storage and extra windows so the next test starts clean"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Storage is only reachable from a real origin, not about:blank
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            driver.delete_all_cookies()
+            driver.implicitly_wait(0)
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to reset pooled browser: {str(e)}")
+            return False
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Failed to quit pooled browser: {str(e)}")
+
+    def shutdown(self):
+        """Quit all idle browsers"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+        self.logger.info("WebDriver pool shut down")